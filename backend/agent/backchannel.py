@@ -0,0 +1,114 @@
+"""Short cached acknowledgements that cover slow LLM turns."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+
+BACKCHANNEL_PHRASES: tuple[str, ...] = ("Mm-hm.", "Okay...", "Right.")
+
+_END = object()
+
+
+class BackchannelFiller:
+    """Plays a filler phrase when no reply audio started soon after end-of-turn.
+
+    The filler is spliced into the reply's own audio stream (`cover`, called
+    from `InterviewAgent.tts_node`) rather than spoken as a separate speech:
+    a second `session.say()` would only queue behind the reply it is meant
+    to cover. `frames(text)` returns cached audio for a phrase, or None when
+    it is not cached; fillers are never synthesized live.
+    """
+
+    def __init__(
+        self,
+        frames: Callable[[str], AsyncIterator | None],
+        *,
+        delay_seconds: float,
+        phrases: Sequence[str] = BACKCHANNEL_PHRASES,
+    ):
+        self._frames = frames
+        self.delay_seconds = delay_seconds
+        self.phrases = tuple(phrases)
+        self._user_stopped_at: float | None = None
+        self._next_phrase = 0
+        self.armed = 0
+        self.fired = 0
+        self.uncached = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.delay_seconds > 0 and bool(self.phrases)
+
+    def on_user_stopped(self, now: float | None = None) -> None:
+        """Suitor finished speaking; the threshold is measured from here."""
+        self._user_stopped_at = time.monotonic() if now is None else now
+
+    def cancel(self) -> None:
+        """The suitor resumed: the next reply is not late yet."""
+        self._user_stopped_at = None
+
+    async def cover(self, reply: AsyncIterator) -> AsyncIterator:
+        """Yield `reply`, led by a filler if its first frame is late.
+
+        Only the first reply after the suitor stops is covered; later speech
+        in the same turn (e.g. the question after a tool call) passes through.
+        """
+        stopped_at, self._user_stopped_at = self._user_stopped_at, None
+        if not self.enabled or stopped_at is None:
+            async for frame in reply:
+                yield frame
+            return
+
+        self.armed += 1
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def _pump() -> None:
+            try:
+                async for frame in reply:
+                    await queue.put(frame)
+            finally:
+                await queue.put(_END)
+
+        pump = asyncio.create_task(_pump())
+        try:
+            budget = self.delay_seconds - (time.monotonic() - stopped_at)
+            try:
+                first = await asyncio.wait_for(queue.get(), timeout=max(0.0, budget))
+            except asyncio.TimeoutError:
+                async for frame in self._filler():
+                    yield frame
+                first = await queue.get()
+            while first is not _END:
+                yield first
+                first = await queue.get()
+            await pump
+        finally:
+            if not pump.done():
+                pump.cancel()
+
+    def _filler(self) -> AsyncIterator:
+        text = self.phrases[self._next_phrase % len(self.phrases)]
+        self._next_phrase += 1
+        audio = self._frames(text)
+        if audio is None:
+            self.uncached += 1
+            return _empty()
+        self.fired += 1
+        return audio
+
+    def snapshot(self) -> dict:
+        """How often the filler was armed vs. actually played."""
+        return {
+            "delay_ms": int(self.delay_seconds * 1000),
+            "armed": self.armed,
+            "fired": self.fired,
+            "uncached": self.uncached,
+            "fire_rate": round(self.fired / self.armed, 3) if self.armed else None,
+        }
+
+
+async def _empty() -> AsyncIterator:
+    return
+    yield
@@ -0,0 +1,78 @@
+"""Rolling chat-context compaction for long interviews."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from agent.session_manager import ConversationTurn
+
+RECORDING_TOOLS = frozenset({"record_suitor_response", "record_and_get_next"})
+_CHARS_PER_TOKEN = 4
+
+
+def _item_text(item: Any) -> str:
+    item_type = getattr(item, "type", None)
+    if item_type == "message":
+        text = getattr(item, "text_content", None)
+        if text is None:
+            text = " ".join(str(part) for part in getattr(item, "content", []) or [])
+        return text or ""
+    if item_type == "function_call":
+        return f"{getattr(item, 'name', '')}{getattr(item, 'arguments', '')}"
+    if item_type == "function_call_output":
+        return str(getattr(item, "output", ""))
+    return ""
+
+
+def estimate_tokens(items: Sequence[Any]) -> int:
+    """Rough token count (~4 chars/token) of a chat context's items."""
+    return sum(len(_item_text(item)) for item in items) // _CHARS_PER_TOKEN
+
+
+def compaction_boundary(items: Sequence[Any]) -> int | None:
+    """Index of the latest recording tool call; everything before it is settled."""
+    for index in range(len(items) - 1, -1, -1):
+        item = items[index]
+        if (
+            getattr(item, "type", None) == "function_call"
+            and getattr(item, "name", None) in RECORDING_TOOLS
+        ):
+            return index
+    return None
+
+
+def summarize_turns(turns: Sequence[ConversationTurn]) -> str:
+    """Compact notes replacing the raw exchanges of recorded questions."""
+    lines = ["Interview notes so far (earlier exchanges summarized):"]
+    for turn in turns:
+        lines.append(
+            f"Q{turn.question_index + 1} ({turn.response_quality}): "
+            f"{turn.response_summary}"
+        )
+    return "\n".join(lines)
+
+
+def compact_items(
+    items: Sequence[Any],
+    turns: Sequence[ConversationTurn],
+    make_note: Callable[[str], Any],
+) -> list[Any] | None:
+    """Return system prompt + summary note + live tail, or None if nothing to drop.
+
+    The live tail starts at the latest recording call, so its call/output pair
+    (which may carry the next question) stays intact for the provider.
+    """
+    boundary = compaction_boundary(items)
+    if boundary is None or not turns:
+        return None
+    head = [
+        item
+        for item in items[:boundary]
+        if getattr(item, "type", None) == "message"
+        and getattr(item, "role", None) in ("system", "developer")
+        and not _item_text(item).startswith("Interview notes so far")
+    ]
+    if len(head) + 1 >= boundary:
+        return None
+    return [*head, make_note(summarize_turns(turns)), *items[boundary:]]
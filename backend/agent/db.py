@@ -16,6 +16,7 @@ from src.models.heart_model import HeartDb
 from src.models.screening_question_model import ScreeningQuestionDb
 from src.models.session_model import SessionDb
 from src.models.suitor_model import SuitorDb
+from src.repository.session_repository import SessionRepository
 from src.workers.tasks import enqueue_scoring_job
 
 logger = logging.getLogger(__name__)
@@ -117,6 +118,23 @@ async def update_session_status(session_id: str, status: str) -> None:
         await db.commit()
 
 
+async def mark_session_in_progress(session_id: str) -> bool:
+    """Move a PENDING session to IN_PROGRESS; False if it already moved on.
+
+    Conditional, so a session ended (or scored) while the agent was joining
+    is never dragged back to IN_PROGRESS.
+    """
+    session = await SessionRepository(AsyncSessionLocal).transition(
+        uuid.UUID(session_id),
+        {SessionStatus.PENDING},
+        status=SessionStatus.IN_PROGRESS,
+        started_at=datetime.now(timezone.utc),
+    )
+    if session is None:
+        logger.info("Session %s was not pending; left its status as is", session_id)
+    return session is not None
+
+
 async def save_conversation_data(session_id: str, session_data: dict) -> None:
     """Persist transcript data and mark session complete, then enqueue scoring job."""
     async with AsyncSessionLocal() as db:
@@ -191,6 +209,11 @@ async def save_conversation_data(session_id: str, session_data: dict) -> None:
             "turns": summarized_turns if isinstance(summarized_turns, list) else []
         }
         session.audio_recording_url = session_data.get("audio_recording_url")
+        agent_metrics = session_data.get("agent_metrics")
+        if isinstance(agent_metrics, dict) and agent_metrics:
+            metadata = dict(session.session_metadata or {})
+            metadata["agent_metrics"] = agent_metrics
+            session.session_metadata = metadata
         db.add(session)
         await db.commit()
 
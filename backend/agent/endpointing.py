@@ -0,0 +1,162 @@
+"""Per-suitor adaptive end-of-turn endpointing delays."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+
+# Conversational English sits around 2.5 words/second.
+_NORMAL_WORDS_PER_SECOND = 2.5
+# Suitor speech this soon after the agent starts replying means we cut them off.
+_CUTOFF_WINDOW_SECONDS = 1.5
+
+
+@dataclass
+class EndpointingBounds:
+    """Hard limits the controller may tune within."""
+
+    min_delay_floor: float = 0.3
+    min_delay_ceiling: float = 1.2
+    max_delay_floor: float = 1.5
+    max_delay_ceiling: float = 5.0
+
+
+@dataclass
+class _Stats:
+    turns: int = 0
+    cutoffs: int = 0
+    adjustments: int = 0
+    response_latencies: list[float] = field(default_factory=list)
+
+
+class AdaptiveEndpointing:
+    """Tunes `min/max_endpointing_delay` from one suitor's speaking cadence.
+
+    Fed by transcript timing plus `RambleDetector` word counts: fast talkers get
+    shorter delays, slow talkers (or anyone who keeps resuming right after the
+    agent starts replying) get longer ones.
+    """
+
+    def __init__(
+        self,
+        min_delay: float = 0.5,
+        max_delay: float = 3.0,
+        *,
+        bounds: EndpointingBounds | None = None,
+        step: float = 0.15,
+        smoothing: float = 0.3,
+    ):
+        self.bounds = bounds or EndpointingBounds()
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.step = step
+        self.smoothing = smoothing
+        self.words_per_second: float | None = None
+        self._turn_started_at: float | None = None
+        self._last_user_speech_at: float | None = None
+        self._agent_speaking_since: float | None = None
+        self._stats = _Stats()
+
+    def on_user_speech(
+        self,
+        words_in_turn: int,
+        now: float | None = None,
+        *,
+        spoken_at: float | None = None,
+    ) -> None:
+        """Record one final suitor transcript and its running turn word count.
+
+        Feed final STT results only. `spoken_at` is when the transcribed speech
+        began (defaults to `now`); the speaking rate is measured from the
+        turn's first `spoken_at`. A final for speech that began before the
+        agent started replying is a late STT result, not a cut-off, and is
+        ignored.
+        """
+        now = time.monotonic() if now is None else now
+        spoken_at = now if spoken_at is None else spoken_at
+        agent_since = self._agent_speaking_since
+        if agent_since is not None:
+            if spoken_at < agent_since:
+                return
+            if spoken_at - agent_since <= _CUTOFF_WINDOW_SECONDS:
+                # The suitor was still going when we decided their turn was over.
+                self._stats.cutoffs += 1
+                self._nudge(+self.step, +2 * self.step)
+        self._agent_speaking_since = None
+
+        if self._turn_started_at is None:
+            # The turn's words include speech from before its first final.
+            self._turn_started_at = spoken_at
+        elapsed = now - self._turn_started_at
+        if elapsed >= 1.0 and words_in_turn > 0:
+            sample = words_in_turn / elapsed
+            if self.words_per_second is None:
+                self.words_per_second = sample
+            else:
+                self.words_per_second += self.smoothing * (
+                    sample - self.words_per_second
+                )
+        self._last_user_speech_at = now
+
+    def on_agent_speaking(self, now: float | None = None) -> float | None:
+        """Mark the agent reply start; returns the end-of-speech → reply latency."""
+        now = time.monotonic() if now is None else now
+        self._agent_speaking_since = now
+        if self._last_user_speech_at is None:
+            return None
+        latency = now - self._last_user_speech_at
+        self._last_user_speech_at = None
+        self._turn_started_at = None
+        self._stats.turns += 1
+        self._stats.response_latencies.append(round(latency, 3))
+        self._retune_from_cadence()
+        return latency
+
+    def _retune_from_cadence(self) -> None:
+        wps = self.words_per_second
+        if wps is None:
+            return
+        if wps >= _NORMAL_WORDS_PER_SECOND * 1.2:
+            self._nudge(-self.step / 2, -self.step)
+        elif wps <= _NORMAL_WORDS_PER_SECOND * 0.8:
+            self._nudge(+self.step / 2, +self.step)
+
+    def _nudge(self, min_delta: float, max_delta: float) -> None:
+        b = self.bounds
+        new_min = min(
+            max(self.min_delay + min_delta, b.min_delay_floor), b.min_delay_ceiling
+        )
+        new_max = min(
+            max(self.max_delay + max_delta, b.max_delay_floor), b.max_delay_ceiling
+        )
+        new_max = max(new_max, new_min)
+        if (round(new_min, 3), round(new_max, 3)) != (
+            round(self.min_delay, 3),
+            round(self.max_delay, 3),
+        ):
+            self._stats.adjustments += 1
+        self.min_delay = round(new_min, 3)
+        self.max_delay = round(new_max, 3)
+
+    def delays(self) -> tuple[float, float]:
+        """Current `(min_endpointing_delay, max_endpointing_delay)`."""
+        return self.min_delay, self.max_delay
+
+    def snapshot(self) -> dict:
+        """Metrics for persistence: chosen delays and observed reply latency."""
+        latencies = sorted(self._stats.response_latencies)
+        avg = round(sum(latencies) / len(latencies), 3) if latencies else None
+        return {
+            "min_endpointing_delay": self.min_delay,
+            "max_endpointing_delay": self.max_delay,
+            "words_per_second": (
+                round(self.words_per_second, 2)
+                if self.words_per_second is not None
+                else None
+            ),
+            "turns": self._stats.turns,
+            "cutoffs": self._stats.cutoffs,
+            "adjustments": self._stats.adjustments,
+            "response_latency_avg_s": avg,
+            "response_latency_max_s": latencies[-1] if latencies else None,
+        }
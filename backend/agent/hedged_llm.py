@@ -0,0 +1,302 @@
+"""Hedged LLM requests: race a secondary provider when the primary is slow."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from src.util.stats import percentile
+
+logger = logging.getLogger(__name__)
+
+# (hedged stream, candidate label) for provider streams started by a hedge;
+# their metrics task inherits it, so metrics can be traced back to the race.
+_candidate: contextvars.ContextVar[tuple[Any, str] | None] = contextvars.ContextVar(
+    "hedged_llm_candidate", default=None
+)
+
+try:
+    from livekit.agents import APIConnectionError
+    from livekit.agents import llm as lk_llm
+    from livekit.agents.types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN
+except Exception:  # pragma: no cover - optional dependency guard
+    lk_llm = None  # type: ignore[assignment]
+    DEFAULT_API_CONNECT_OPTIONS = None  # type: ignore[assignment]
+    NOT_GIVEN = None  # type: ignore[assignment]
+    APIConnectionError = RuntimeError  # type: ignore[assignment,misc]
+
+
+class HedgeDelay:
+    """Hedge trigger derived from the primary's recent first-token p95."""
+
+    def __init__(
+        self,
+        initial: float = 1.0,
+        *,
+        floor: float = 0.3,
+        ceiling: float = 3.0,
+        window: int = 50,
+        min_samples: int = 10,
+    ):
+        self.initial = initial
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def observe(self, first_token_seconds: float) -> None:
+        """First-token latency of a request the primary won."""
+        self._samples.append(first_token_seconds)
+
+    def current(self) -> float:
+        if len(self._samples) < self.min_samples:
+            return self.initial
+        p95 = percentile(list(self._samples), 95)
+        return min(max(p95, self.floor), self.ceiling)
+
+
+class HedgeStats:
+    """Per-provider win counts and first-token latency for one session."""
+
+    def __init__(self, labels: tuple[str, ...]):
+        self.labels = labels
+        self.requests = 0
+        self.hedged = 0
+        self.failures: dict[str, int] = {label: 0 for label in labels}
+        self.wins: dict[str, list[float]] = {label: [] for label in labels}
+
+    def snapshot(self) -> dict:
+        """Win rates and first-token p50/p95 per provider."""
+        providers = {}
+        for label in self.labels:
+            samples_ms = [round(s * 1000) for s in self.wins[label]]
+            providers[label] = {
+                "wins": len(samples_ms),
+                "win_rate": (
+                    round(len(samples_ms) / self.requests, 3) if self.requests else None
+                ),
+                "failures": self.failures[label],
+                "first_token_p50_ms": percentile(samples_ms, 50),
+                "first_token_p95_ms": percentile(samples_ms, 95),
+            }
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "providers": providers,
+        }
+
+
+async def hedged_stream(
+    candidates: list[tuple[str, Callable[[], Any]]],
+    *,
+    delay: HedgeDelay,
+    stats: HedgeStats,
+    on_winner: Callable[[str], None] | None = None,
+) -> AsyncIterator:
+    """Yield chunks from whichever candidate stream produces its first chunk first.
+
+    The first candidate starts immediately; the second only after
+    `delay.current()` without a first chunk (or as soon as the first fails).
+    The losing stream is cancelled and closed. Only primary wins feed
+    `delay`: when the hedge wins, the primary's latency is unknown.
+    """
+    started = time.monotonic()
+    streams: dict[str, Any] = {}
+    iterators: dict[str, Any] = {}
+    heads: dict[asyncio.Future, str] = {}
+    primary_label = candidates[0][0]
+    last_error: BaseException | None = None
+    stats.requests += 1
+
+    def _start(index: int) -> None:
+        label, factory = candidates[index]
+        stream = factory()
+        streams[label] = stream
+        iterators[label] = stream.__aiter__()
+        heads[asyncio.ensure_future(iterators[label].__anext__())] = label
+
+    winner: str | None = None
+    first: Any = None
+    exhausted = False
+    try:
+        _start(0)
+        done, _ = await asyncio.wait(set(heads), timeout=delay.current())
+        if not done and len(candidates) > 1:
+            stats.hedged += 1
+            _start(1)
+        while winner is None:
+            if not heads:
+                raise last_error or APIConnectionError("all hedged LLMs failed")
+            done, _ = await asyncio.wait(
+                set(heads), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(done, key=lambda t: list(streams).index(heads[t])):
+                label = heads.pop(task)
+                exc = task.exception()
+                if exc is None or isinstance(exc, StopAsyncIteration):
+                    winner = label
+                    exhausted = exc is not None
+                    first = None if exhausted else task.result()
+                    break
+                last_error = exc
+                stats.failures[label] += 1
+                logger.warning("Hedged LLM %s failed: %s", label, exc)
+                if len(streams) < len(candidates):
+                    _start(len(streams))
+        elapsed = time.monotonic() - started
+        stats.wins[winner].append(elapsed)
+        if winner == primary_label:
+            delay.observe(elapsed)
+        if on_winner is not None:
+            on_winner(winner)
+        await _close_losers(heads, streams, keep=winner)
+        if exhausted:
+            return
+        yield first
+        async for chunk in iterators[winner]:
+            yield chunk
+    finally:
+        await _close_losers(heads, streams, keep=None)
+
+
+async def _close_losers(
+    heads: dict[asyncio.Future, str], streams: dict[str, Any], keep: str | None
+) -> None:
+    for task, label in list(heads.items()):
+        if label == keep:
+            continue
+        heads.pop(task)
+        if task.done():
+            if not task.cancelled():
+                task.exception()  # retrieved so asyncio does not warn
+        else:
+            task.cancel()
+    for label, stream in list(streams.items()):
+        if label == keep:
+            continue
+        streams.pop(label)
+        close = getattr(stream, "aclose", None)
+        if close is not None:
+            try:
+                await close()
+            except Exception as exc:
+                logger.debug("Closing hedged LLM stream %s failed: %s", label, exc)
+
+
+if lk_llm is not None:
+
+    class HedgedLLM(lk_llm.LLM):
+        """LiveKit LLM that hedges a primary provider with a secondary one."""
+
+        def __init__(
+            self,
+            primary,
+            secondary,
+            *,
+            labels: tuple[str, str],
+            delay: HedgeDelay,
+        ):
+            super().__init__()
+            self._instances = (primary, secondary)
+            self.labels = labels
+            self.delay = delay
+            self.stats = HedgeStats(labels)
+            for instance in self._instances:
+                instance.on("metrics_collected", self._forward_metrics)
+
+        def _forward_metrics(self, metrics) -> None:
+            # Losing and failed candidates report too; only the winner's
+            # request reached the user, so only its metrics count.
+            source = _candidate.get()
+            if source is not None:
+                stream, label = source
+                if stream.winner != label:
+                    return
+            self.emit("metrics_collected", metrics)
+
+        @property
+        def model(self) -> str:
+            return self._instances[0].model
+
+        @property
+        def provider(self) -> str:
+            return self._instances[0].provider
+
+        def chat(
+            self,
+            *,
+            chat_ctx,
+            tools=None,
+            conn_options=DEFAULT_API_CONNECT_OPTIONS,
+            parallel_tool_calls=NOT_GIVEN,
+            tool_choice=NOT_GIVEN,
+            extra_kwargs=NOT_GIVEN,
+        ):
+            return _HedgedLLMStream(
+                self,
+                chat_ctx=chat_ctx,
+                tools=tools or [],
+                conn_options=conn_options,
+                chat_kwargs={
+                    "parallel_tool_calls": parallel_tool_calls,
+                    "tool_choice": tool_choice,
+                    "extra_kwargs": extra_kwargs,
+                },
+            )
+
+        async def aclose(self) -> None:
+            for instance in self._instances:
+                instance.off("metrics_collected", self._forward_metrics)
+                await instance.aclose()
+
+    class _HedgedLLMStream(lk_llm.LLMStream):
+        def __init__(self, hedged: HedgedLLM, *, chat_kwargs: dict, **kwargs):
+            super().__init__(hedged, **kwargs)
+            self._hedged = hedged
+            self._chat_kwargs = chat_kwargs
+            self.winner: str | None = None
+
+        def _factory(self, label: str, instance) -> Callable[[], Any]:
+            def _start():
+                token = _candidate.set((self, label))
+                try:
+                    return instance.chat(
+                        chat_ctx=self._chat_ctx,
+                        tools=self._tools,
+                        conn_options=self._conn_options,
+                        **self._chat_kwargs,
+                    )
+                finally:
+                    _candidate.reset(token)
+
+            return _start
+
+        def _set_winner(self, label: str) -> None:
+            self.winner = label
+
+        async def _run(self) -> None:
+            hedged = self._hedged
+            candidates = [
+                (label, self._factory(label, instance))
+                for label, instance in zip(hedged.labels, hedged._instances)
+            ]
+            async for chunk in hedged_stream(
+                candidates,
+                delay=hedged.delay,
+                stats=hedged.stats,
+                on_winner=self._set_winner,
+            ):
+                self._event_ch.send_nowait(chunk)
+
+        async def _metrics_monitor_task(self, event_aiter) -> None:
+            # The provider streams report their own metrics (forwarded above).
+            async for _ in event_aiter:
+                pass
+
+else:  # pragma: no cover - livekit not installed
+    HedgedLLM = None  # type: ignore[assignment,misc]
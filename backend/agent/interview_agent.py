@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import logging
+
 try:
     from livekit.agents import Agent, RunContext, function_tool
+    from livekit.agents import llm as lk_llm
 except Exception:  # pragma: no cover - optional dependency guard
     Agent = object  # type: ignore[assignment]
     RunContext = object  # type: ignore[assignment]
+    lk_llm = None  # type: ignore[assignment]
 
     def function_tool(fn):  # type: ignore[misc]
         return fn
 
 
+from agent.backchannel import BackchannelFiller
+from agent.context_compaction import compact_items, estimate_tokens
 from agent.session_manager import SessionManager
+from agent.question_bridge import QuestionBridge, lead_in
+
+logger = logging.getLogger(__name__)
 
 
 class InterviewAgent(Agent):
@@ -22,23 +31,109 @@ class InterviewAgent(Agent):
         self,
         instructions: str,
         session_manager: SessionManager,
+        question_bridge: QuestionBridge | None = None,
+        backchannel: BackchannelFiller | None = None,
         **kwargs,
     ):
         super().__init__(instructions=instructions, **kwargs)
         self.session_mgr = session_manager
+        self.question_bridge = question_bridge
+        self.backchannel = backchannel
+        self._question_issued = False
+        self.context_tokens: list[tuple[int, int]] = []
 
-    @function_tool
-    async def get_next_question(self, context: RunContext) -> str:
-        """Return the next screening question instruction for the LLM."""
-        _ = context
+    def prepare_bridge(self) -> None:
+        """Buffer the lead-in for the next question while the suitor talks."""
+        if self.question_bridge is not None and self.session_mgr.questions_remaining():
+            self.question_bridge.prepare()
+
+    def compact_chat_ctx(self, chat_ctx):
+        """Swap recorded exchanges for their summaries; returns the context to send."""
+        before = estimate_tokens(chat_ctx.items)
+        items = compact_items(
+            chat_ctx.items,
+            self.session_mgr.turns,
+            lambda text: lk_llm.ChatMessage(role="system", content=[text]),
+        )
+        compacted = chat_ctx if items is None else lk_llm.ChatContext(items)
+        after = estimate_tokens(compacted.items) if items is not None else before
+        self.context_tokens.append((before, after))
+        logger.info(
+            "Session %s LLM context ~%s tokens (%s before compaction)",
+            self.session_mgr.session_id,
+            after,
+            before,
+        )
+        return compacted
+
+    def context_snapshot(self) -> dict:
+        """Estimated prompt tokens per request, raw vs. compacted."""
+        raw = sum(before for before, _ in self.context_tokens)
+        sent = sum(after for _, after in self.context_tokens)
+        return {
+            "requests": len(self.context_tokens),
+            "raw_tokens": raw,
+            "sent_tokens": sent,
+            "last_sent_tokens": self.context_tokens[-1][1]
+            if self.context_tokens
+            else None,
+        }
+
+    async def llm_node(self, chat_ctx, tools, model_settings):
+        """Run the LLM on a compacted copy of the chat context."""
+        async for chunk in Agent.default.llm_node(
+            self, self.compact_chat_ctx(chat_ctx), tools, model_settings
+        ):
+            yield chunk
+
+    async def tts_node(self, text, model_settings):
+        """Lead the reply with the question bridge, or a filler if it is late."""
+        audio = Agent.default.tts_node(self, text, model_settings)
+        bridge = None
+        if self._question_issued and self.question_bridge is not None:
+            self._question_issued = False
+            bridge = await self.question_bridge.take()
+        if bridge is not None:
+            bridge_text, bridge_audio = bridge
+            self.session_mgr.add_transcript_entry(speaker="avatar", text=bridge_text)
+            audio = lead_in(bridge_audio, audio)
+        if self.backchannel is not None:
+            audio = self.backchannel.cover(audio)
+        async for frame in audio:
+            yield frame
+
+    def _next_question_instruction(self) -> str:
         question = self.session_mgr.get_next_question()
         if question is None:
             return "ALL_QUESTIONS_COMPLETE — wrap up the conversation naturally."
+        self._question_issued = True
         return (
             "Ask this question next in your own style (do not read verbatim): "
             f"{question['text']}"
         )
 
+    def _record(
+        self, question_index: int, response_summary: str, response_quality: str
+    ) -> str | None:
+        """Record one answer; returns the wrap-up instruction once none remain."""
+        self.session_mgr.record_response(
+            question_index,
+            response_summary,
+            response_quality,
+        )
+        if self.session_mgr.questions_remaining() > 0:
+            return None
+        if self.session_mgr.end_reason is None:
+            self.session_mgr.end("all_questions_complete")
+            return "All questions answered. Wrap up warmly and end now."
+        return f"Session already ended: {self.session_mgr.end_reason}"
+
+    @function_tool
+    async def get_next_question(self, context: RunContext) -> str:
+        """Return the next screening question instruction for the LLM."""
+        _ = context
+        return self._next_question_instruction()
+
     @function_tool
     async def record_suitor_response(
         self,
@@ -49,19 +144,27 @@ class InterviewAgent(Agent):
     ) -> str:
         """Record one summarized suitor answer with quality label."""
         _ = context
-        self.session_mgr.record_response(
-            question_index,
-            response_summary,
-            response_quality,
-        )
+        wrap_up = self._record(question_index, response_summary, response_quality)
+        if wrap_up is not None:
+            return wrap_up
         remaining = self.session_mgr.questions_remaining()
-        if remaining == 0:
-            if self.session_mgr.end_reason is None:
-                self.session_mgr.end("all_questions_complete")
-                return "All questions answered. Wrap up warmly and end now."
-            return f"Session already ended: {self.session_mgr.end_reason}"
         return f"Response recorded. {remaining} questions remaining."
 
+    @function_tool
+    async def record_and_get_next(
+        self,
+        context: RunContext,
+        question_index: int,
+        response_summary: str,
+        response_quality: str,
+    ) -> str:
+        """Record the suitor's answer and return the next question in one call."""
+        _ = context
+        wrap_up = self._record(question_index, response_summary, response_quality)
+        if wrap_up is not None:
+            return wrap_up
+        return f"Response recorded. {self._next_question_instruction()}"
+
     @function_tool
     async def end_interview(self, context: RunContext, reason: str) -> str:
         """Mark interview as ended and direct the model to give closing message."""
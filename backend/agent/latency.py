@@ -0,0 +1,94 @@
+"""Per-turn voice pipeline latency tracking for one interview."""
+
+from __future__ import annotations
+
+import time
+
+from src.util.stats import percentile
+
+# Offsets (ms) measured from the moment the suitor stopped speaking.
+LATENCY_STAGES = (
+    "final_transcript",
+    "llm_first_token",
+    "tool_call",
+    "first_audio",
+)
+
+
+class TurnLatencyTracker:
+    """Records end-of-speech → transcript → LLM → tool → first audio per turn."""
+
+    def __init__(self) -> None:
+        self._current: dict[str, float] | None = None
+        self.turns: list[dict[str, int]] = []
+
+    def on_user_stopped(self, at: float | None = None) -> None:
+        """Open a new turn when VAD reports the suitor stopped speaking."""
+        self._current = {"user_stopped": time.time() if at is None else at}
+
+    def _mark(self, stage: str, at: float | None) -> None:
+        current = self._current
+        if current is None or stage in current:
+            return
+        current[stage] = time.time() if at is None else at
+
+    def on_final_transcript(self, at: float | None = None) -> None:
+        """Final STT result for the open turn."""
+        self._mark("final_transcript", at)
+
+    def on_llm_metrics(self, timestamp: float, duration: float, ttft: float) -> None:
+        """Derive the first-token wall time from a LiveKit `LLMMetrics` record."""
+        if ttft < 0:
+            return
+        self._mark("llm_first_token", timestamp - duration + ttft)
+
+    def on_tool_call(self, at: float | None = None) -> None:
+        """First function tool executed in the open turn."""
+        self._mark("tool_call", at)
+
+    def on_first_audio(self, at: float | None = None) -> None:
+        """Agent audio started playing; closes the open turn."""
+        current = self._current
+        if current is None:
+            return
+        self._mark("first_audio", at)
+        started = current["user_stopped"]
+        self.turns.append(
+            {
+                stage: int(round((current[stage] - started) * 1000))
+                for stage in LATENCY_STAGES
+                if stage in current and current[stage] >= started
+            }
+        )
+        self._current = None
+
+    def summary(self) -> dict:
+        """p50/p95 per stage in milliseconds, ready for `session_metadata`."""
+        stages: dict[str, dict[str, int | None]] = {}
+        for stage in LATENCY_STAGES:
+            samples = [turn[stage] for turn in self.turns if stage in turn]
+            stages[stage] = {
+                "count": len(samples),
+                "p50_ms": percentile(samples, 50),
+                "p95_ms": percentile(samples, 95),
+            }
+        return {"turns": len(self.turns), "stages": stages}
+
+
+class PhaseTimer:
+    """Cumulative millisecond offsets of named phases from one start point."""
+
+    def __init__(self, start: float | None = None) -> None:
+        self._start = time.monotonic() if start is None else start
+        self.phases: dict[str, int] = {}
+
+    def mark(self, phase: str, at: float | None = None) -> int:
+        """Record `phase` once; returns its offset in milliseconds."""
+        if phase not in self.phases:
+            now = time.monotonic() if at is None else at
+            self.phases[phase] = int(round((now - self._start) * 1000))
+        return self.phases[phase]
+
+    def snapshot(self) -> dict[str, int]:
+        """Phase offsets in the order they were reached."""
+        return dict(self.phases)
@@ -0,0 +1,113 @@
+"""Worker load reporting for LiveKit job dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+try:
+    from livekit.agents.utils.hw import get_cpu_monitor
+except Exception:  # pragma: no cover - optional dependency guard
+    get_cpu_monitor = None  # type: ignore[assignment]
+
+
+class LoopLagMonitor:
+    """Measures event-loop oversleep with a periodic probe task."""
+
+    def __init__(
+        self, interval: float = 0.5, smoothing: float = 0.3, history: int = 600
+    ):
+        self.interval = interval
+        self.smoothing = smoothing
+        self.lag_ms = 0.0
+        self.samples: deque[float] = deque(maxlen=history)
+        self._task: asyncio.Task | None = None
+
+    def ensure_started(self) -> None:
+        """Start probing on the running loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._probe())
+
+    def stop(self) -> None:
+        """Cancel the probe task."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def observe(self, lag_ms: float) -> None:
+        """Fold one oversleep sample into the smoothed lag."""
+        lag_ms = max(lag_ms, 0.0)
+        self.samples.append(lag_ms)
+        self.lag_ms += self.smoothing * (lag_ms - self.lag_ms)
+
+    def snapshot(self) -> dict:
+        """Smoothed and worst observed lag, for per-session metrics."""
+        return {
+            "lag_ms": round(self.lag_ms, 1),
+            "max_ms": round(max(self.samples), 1) if self.samples else None,
+            "samples": len(self.samples),
+        }
+
+    async def _probe(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.observe((loop.time() - scheduled) * 1000)
+
+
+class WorkerLoad:
+    """Combines session count and CPU into one 0..1 load figure.
+
+    The result is the worse of the two ratios, so either saturated resource
+    marks the worker busy and LiveKit routes new rooms elsewhere. Event-loop
+    lag is not part of it: interviews run in separate job processes, so the
+    main process's loop says nothing about interview load (each job samples
+    its own with `LoopLagMonitor` instead).
+    """
+
+    def __init__(
+        self,
+        max_sessions: int,
+        *,
+        cpu_percent: Callable[[], float] | None = None,
+    ):
+        self.max_sessions = max(1, max_sessions)
+        if cpu_percent is None and get_cpu_monitor is not None:
+            monitor = get_cpu_monitor()
+            cpu_percent = lambda: monitor.cpu_percent(interval=0.5)  # noqa: E731
+        self._cpu_percent = cpu_percent
+        self._lock = threading.Lock()
+        self._last: dict = {"active_sessions": 0, "cpu": 0.0, "load": 0.0}
+        self._last_logged_at = 0.0
+
+    def compute(self, active_sessions: int) -> float:
+        """Current load; safe to call from the worker's executor thread."""
+        cpu = self._cpu_percent() if self._cpu_percent is not None else 0.0
+        load = min(1.0, max(active_sessions / self.max_sessions, cpu))
+        with self._lock:
+            self._last = {
+                "active_sessions": active_sessions,
+                "cpu": round(cpu, 3),
+                "load": round(load, 3),
+            }
+        now = time.monotonic()
+        if now - self._last_logged_at >= 60:
+            self._last_logged_at = now
+            logger.info("Worker load %s", self.snapshot())
+        return load
+
+    def has_capacity(self, active_sessions: int) -> bool:
+        """Hard per-worker cap, checked before accepting a job."""
+        return active_sessions < self.max_sessions
+
+    def snapshot(self) -> dict:
+        """Last computed load breakdown for logs and capacity planning."""
+        with self._lock:
+            return {**self._last, "max_sessions": self.max_sessions}
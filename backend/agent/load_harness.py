@@ -0,0 +1,510 @@
+"""Offline multi-room load harness for the interview agent.
+
+Drives `InterviewAgent` + `SessionManager` through N concurrent simulated
+interviews with scripted STT/LLM/TTS fakes (configurable latencies), then
+persists each one with the real `save_conversation_data` against the local
+Postgres from `config`. No provider is called and no scoring job is enqueued.
+
+    python -m agent.load_harness --rooms 20 --stt-ms 250 --llm-ttft-ms 600
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import resource
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from types import SimpleNamespace
+
+from agent.interview_agent import InterviewAgent
+from agent.latency import TurnLatencyTracker
+from agent.load import LoopLagMonitor
+from agent.prompt_builder import build_system_prompt
+from agent.question_bridge import QuestionBridge, lead_in
+from agent.session_manager import SessionManager
+from src.util.stats import percentile
+
+logger = logging.getLogger(__name__)
+
+HARNESS_QUESTIONS: list[dict[str, object]] = [
+    {"text": "What made you click on this link today?", "required": True},
+    {"text": "Describe your perfect first date with no budget.", "required": True},
+    {"text": "What have you changed your mind about recently?", "required": True},
+    {
+        "text": "Tell me about a time you messed up and what you learned.",
+        "required": True,
+    },
+    {"text": "Why should Luna give you a chance?", "required": True},
+]
+HARNESS_HEART: dict = {
+    "profile": {"display_name": "Luna"},
+    "persona": {
+        "traits": ["witty", "warm"],
+        "vibe": "playful",
+        "tone": "teasing",
+        "humor_level": 7,
+        "strictness": 5,
+    },
+    "expectations": {"dealbreakers": ["rudeness"], "green_flags": ["curiosity"]},
+    "screening_questions": HARNESS_QUESTIONS,
+}
+_SUITOR_ANSWER = (
+    "Honestly I think it was curiosity at first but then I read the bio and "
+    "thought it sounded like someone I would actually get along with"
+)
+_ACKNOWLEDGEMENT = "Love that."
+
+
+@dataclass
+class HarnessLatencies:
+    """Simulated provider latencies (milliseconds) and pacing."""
+
+    stt_ms: float = 250.0
+    llm_ttft_ms: float = 600.0
+    llm_ms_per_token: float = 15.0
+    tts_first_audio_ms: float = 200.0
+    suitor_speech_s: float = 3.0
+    # Synchronous CPU burned per second of suitor audio (VAD/resampling stand-in).
+    vad_cpu_ms_per_s: float = 5.0
+    # Fraction of agent audio duration actually slept; 0 skips playback time.
+    playback_scale: float = 0.1
+    jitter: float = 0.2
+
+    def sample(self, rng: random.Random, value_ms: float) -> float:
+        """One jittered draw, in seconds."""
+        spread = 1.0 + rng.uniform(-self.jitter, self.jitter)
+        return max(0.0, value_ms * spread) / 1000.0
+
+
+class FakeSTT:
+    """Returns the scripted utterance after a simulated recognition delay."""
+
+    def __init__(self, latencies: HarnessLatencies, rng: random.Random):
+        self._latencies = latencies
+        self._rng = rng
+
+    async def recognize(self, text: str) -> str:
+        await asyncio.sleep(self._latencies.sample(self._rng, self._latencies.stt_ms))
+        return text
+
+
+class FakeLLM:
+    """Echoes scripted text after a TTFT plus per-token generation delay."""
+
+    def __init__(self, latencies: HarnessLatencies, rng: random.Random):
+        self._latencies = latencies
+        self._rng = rng
+        self.requests = 0
+
+    async def generate(self, text: str, on_first_token: Callable[[], None]) -> str:
+        self.requests += 1
+        lat = self._latencies
+        await asyncio.sleep(lat.sample(self._rng, lat.llm_ttft_ms))
+        on_first_token()
+        tokens = max(1, len(text.split()))
+        await asyncio.sleep(lat.sample(self._rng, lat.llm_ms_per_token * tokens))
+        return text
+
+
+class _FakeSynthesis:
+    def __init__(self, tts: FakeTTS, text: str):
+        self._tts = tts
+        self._text = text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def __aiter__(self):
+        return self._frames()
+
+    async def _frames(self):
+        lat = self._tts.latencies
+        await asyncio.sleep(lat.sample(self._tts.rng, lat.tts_first_audio_ms))
+        # ~70ms of speech per character at 24kHz mono int16, in 100ms frames.
+        samples = int(len(self._text) * 0.07 * self._tts.sample_rate)
+        frame_samples = self._tts.sample_rate // 10
+        for _ in range(0, samples, frame_samples):
+            yield SimpleNamespace(
+                frame=SimpleNamespace(
+                    data=bytes(frame_samples * 2),
+                    sample_rate=self._tts.sample_rate,
+                    num_channels=1,
+                    samples_per_channel=frame_samples,
+                )
+            )
+
+
+class FakeTTS:
+    """`synthesize()`-compatible TTS producing silent PCM after a delay."""
+
+    def __init__(
+        self,
+        latencies: HarnessLatencies,
+        rng: random.Random,
+        sample_rate: int = 24000,
+    ):
+        self.latencies = latencies
+        self.rng = rng
+        self.sample_rate = sample_rate
+
+    def synthesize(self, text: str) -> _FakeSynthesis:
+        return _FakeSynthesis(self, text)
+
+
+@dataclass
+class RoomResult:
+    """Outcome of one simulated interview."""
+
+    session_id: str
+    turns: list[dict[str, int]]
+    llm_requests: int
+    bridges_played: int
+    bridges_synthesized: int
+    db_write_ms: float | None
+    error: str | None = None
+    transcript: dict = field(default_factory=dict)
+
+
+@dataclass
+class HarnessReport:
+    """Aggregate numbers printed at the end of a run."""
+
+    rooms: int
+    failed_rooms: int
+    wall_seconds: float
+    loop_lag_ms: dict
+    turn_latency: dict
+    memory: dict
+    db_write_ms: dict | None
+    llm_requests: int
+    question_bridge: dict = field(default_factory=dict)
+    transcript: dict = field(default_factory=dict)
+
+
+def _burn_cpu(ms: float) -> None:
+    deadline = time.perf_counter() + ms / 1000.0
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _play(frames, latencies: HarnessLatencies, on_first_audio) -> None:
+    started = False
+    samples = 0
+    sample_rate = 24000
+    async for frame in frames:
+        if not started:
+            on_first_audio()
+            started = True
+        sample_rate = frame.sample_rate
+        samples += frame.samples_per_channel
+    if latencies.playback_scale > 0:
+        await asyncio.sleep(samples / sample_rate * latencies.playback_scale)
+
+
+async def run_room(
+    session_id: str,
+    latencies: HarnessLatencies,
+    *,
+    seed: int,
+    save: Callable[[str, dict], Awaitable[None]] | None,
+    questions: list[dict] = HARNESS_QUESTIONS,
+) -> RoomResult:
+    """Simulate one full interview through the real agent tools."""
+    rng = random.Random(seed)
+    stt = FakeSTT(latencies, rng)
+    llm = FakeLLM(latencies, rng)
+    tts = FakeTTS(latencies, rng)
+    session_mgr = SessionManager(session_id, questions, max_duration_seconds=600)
+    bridge = QuestionBridge(tts)
+    agent = InterviewAgent(
+        instructions=build_system_prompt(HARNESS_HEART, suitor_name="Harness"),
+        session_manager=session_mgr,
+        question_bridge=bridge,
+    )
+    tracker = TurnLatencyTracker()
+
+    async def speak(text: str, *, new_question: bool = False) -> None:
+        # Mirrors InterviewAgent.tts_node: the bridge leads a new question.
+        audio = _synth_frames(tts, text)
+        lead = await bridge.take() if new_question else None
+        if lead is not None:
+            session_mgr.add_transcript_entry(speaker="avatar", text=lead[0])
+            audio = lead_in(lead[1], audio)
+        session_mgr.add_transcript_entry(speaker="avatar", text=text)
+        await _play(audio, latencies, tracker.on_first_audio)
+
+    # Opening turn: greeting, then the first question.
+    await llm.generate("Hey there!", lambda: None)
+    question = session_mgr.get_next_question()
+    await speak(str(question["text"]))
+
+    while session_mgr.end_reason is None:
+        # Suitor talks; the next question's lead-in is buffered meanwhile.
+        speech_s = latencies.sample(rng, latencies.suitor_speech_s * 1000)
+        agent.prepare_bridge()
+        elapsed = 0.0
+        words = _SUITOR_ANSWER.split()
+        while elapsed < speech_s:
+            step = min(0.1, speech_s - elapsed)
+            await asyncio.sleep(step)
+            _burn_cpu(latencies.vad_cpu_ms_per_s * step)
+            elapsed += step
+            # Streaming STT: growing interim hypotheses while the suitor talks.
+            heard = max(1, int(len(words) * elapsed / speech_s))
+            session_mgr.add_suitor_transcript(" ".join(words[:heard]), is_final=False)
+        tracker.on_user_stopped()
+        transcript = await stt.recognize(_SUITOR_ANSWER)
+        tracker.on_final_transcript()
+        session_mgr.add_suitor_transcript(transcript, is_final=True)
+
+        # LLM round 1: acknowledgement + tool call.
+        await llm.generate(_ACKNOWLEDGEMENT, _first_token(tracker))
+        answered = session_mgr.current_question_index - 1
+        summary = transcript[:80]
+        question = await agent.record_and_get_next(None, answered, summary, "good")
+        tracker.on_tool_call()
+        if session_mgr.end_reason is not None:
+            break
+        # Final LLM round: speak the question it was handed.
+        spoken = await llm.generate(_spoken_question(question, questions), lambda: None)
+        await speak(spoken, new_question=True)
+
+    save_ms = None
+    if save is not None:
+        started = time.perf_counter()
+        await save(session_id, session_mgr.get_session_data())
+        save_ms = (time.perf_counter() - started) * 1000
+    session_mgr.flush_suitor_turn()
+    return RoomResult(
+        session_id=session_id,
+        turns=tracker.turns,
+        llm_requests=llm.requests,
+        bridges_played=bridge.played,
+        bridges_synthesized=bridge.synthesized,
+        db_write_ms=save_ms,
+        transcript=session_mgr.transcript_assembler.snapshot(),
+    )
+
+
+def _first_token(tracker: TurnLatencyTracker) -> Callable[[], None]:
+    def mark() -> None:
+        now = time.time()
+        tracker.on_llm_metrics(timestamp=now, duration=0.0, ttft=0.0)
+
+    return mark
+
+
+def _spoken_question(tool_output: str, questions: list[dict]) -> str:
+    # The fake LLM speaks the question it was handed.
+    for question in questions:
+        if str(question["text"]) in tool_output:
+            return str(question["text"])
+    return tool_output
+
+
+async def _synth_frames(tts: FakeTTS, text: str):
+    async with tts.synthesize(text) as stream:
+        async for chunk in stream:
+            yield chunk.frame
+
+
+def _rss_mb() -> float:
+    # ru_maxrss is KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 1) if value is not None else None
+
+
+def _summary_ms(values: list[float]) -> dict:
+    return {
+        "count": len(values),
+        "p50": _round(percentile(values, 50)),
+        "p95": _round(percentile(values, 95)),
+        "max": round(max(values), 1) if values else None,
+    }
+
+
+async def run_harness(
+    rooms: int,
+    latencies: HarnessLatencies,
+    *,
+    ramp_seconds: float = 0.0,
+    save: Callable[[str, dict], Awaitable[None]] | None = None,
+    session_ids: list[str] | None = None,
+    seed: int = 0,
+) -> HarnessReport:
+    """Run `rooms` concurrent interviews and aggregate the measurements."""
+    session_ids = session_ids or [str(uuid.uuid4()) for _ in range(rooms)]
+    lag = LoopLagMonitor(interval=0.05, smoothing=0.3, history=100_000)
+    lag.ensure_started()
+    rss_before = _rss_mb()
+    started = time.perf_counter()
+
+    async def _room(index: int) -> RoomResult:
+        if ramp_seconds > 0:
+            await asyncio.sleep(ramp_seconds * index / max(rooms, 1))
+        try:
+            return await run_room(
+                session_ids[index],
+                latencies,
+                seed=seed + index,
+                save=save,
+            )
+        except Exception as exc:
+            logger.exception("Harness room %s failed", session_ids[index])
+            return RoomResult(session_ids[index], [], 0, 0, 0, None, error=str(exc))
+
+    results = await asyncio.gather(*(_room(i) for i in range(rooms)))
+    wall = time.perf_counter() - started
+    lag.stop()
+    rss_after = _rss_mb()
+
+    combined = TurnLatencyTracker()
+    for result in results:
+        combined.turns.extend(result.turns)
+    db_times = [r.db_write_ms for r in results if r.db_write_ms is not None]
+    return HarnessReport(
+        rooms=rooms,
+        failed_rooms=sum(1 for r in results if r.error),
+        wall_seconds=round(wall, 2),
+        loop_lag_ms=_summary_ms(list(lag.samples)),
+        turn_latency=combined.summary(),
+        memory={
+            "rss_peak_mb": round(rss_after, 1),
+            "per_session_kb": round((rss_after - rss_before) * 1024 / rooms, 1),
+        },
+        db_write_ms=_summary_ms(db_times) if save is not None else None,
+        llm_requests=sum(r.llm_requests for r in results),
+        question_bridge={
+            "played": sum(r.bridges_played for r in results),
+            "synthesized": sum(r.bridges_synthesized for r in results),
+        },
+        transcript={
+            key: sum(r.transcript.get(key, 0) for r in results)
+            for key in ("rows_raw", "rows_persisted", "tokens_raw", "tokens_persisted")
+        },
+    )
+
+
+async def _seed_sessions(rooms: int) -> tuple[list[str], uuid.UUID]:
+    """Create a throwaway suitor plus one in-progress session per room."""
+    from sqlmodel import select
+
+    from agent.db import AsyncSessionLocal
+    from src.models.domain_enums import SessionStatus
+    from src.models.heart_model import HeartDb
+    from src.models.session_model import SessionDb
+    from src.models.suitor_model import SuitorDb
+
+    async with AsyncSessionLocal() as db:
+        heart = (
+            (await db.execute(select(HeartDb).order_by(HeartDb.created_at.desc())))
+            .scalars()
+            .first()
+        )
+        if heart is None:
+            raise RuntimeError("No Heart profile found; seed the database first")
+        suitor = SuitorDb(id=uuid.uuid4(), name="Load Harness")
+        db.add(suitor)
+        session_ids = []
+        for _ in range(rooms):
+            session_id = uuid.uuid4()
+            db.add(
+                SessionDb(
+                    id=session_id,
+                    heart_id=heart.id,
+                    suitor_id=suitor.id,
+                    livekit_room_name=f"session-{session_id}",
+                    status=SessionStatus.IN_PROGRESS,
+                )
+            )
+            session_ids.append(str(session_id))
+        await db.commit()
+    return session_ids, suitor.id
+
+
+async def _drop_seeded(suitor_id: uuid.UUID) -> None:
+    from sqlalchemy import delete
+
+    from agent.db import AsyncSessionLocal
+    from src.models.session_model import SessionDb
+    from src.models.suitor_model import SuitorDb
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(SessionDb).where(SessionDb.suitor_id == suitor_id))
+        await db.execute(delete(SuitorDb).where(SuitorDb.id == suitor_id))
+        await db.commit()
+
+
+async def _main(args: argparse.Namespace) -> HarnessReport:
+    latencies = HarnessLatencies(
+        stt_ms=args.stt_ms,
+        llm_ttft_ms=args.llm_ttft_ms,
+        llm_ms_per_token=args.llm_ms_per_token,
+        tts_first_audio_ms=args.tts_ms,
+        suitor_speech_s=args.speech_s,
+        vad_cpu_ms_per_s=args.vad_cpu_ms,
+        playback_scale=args.playback_scale,
+    )
+    if args.no_db:
+        return await run_harness(
+            args.rooms,
+            latencies,
+            ramp_seconds=args.ramp_s,
+        )
+
+    import agent.db as agent_db
+
+    async def _no_scoring(session_id: str) -> None:
+        # Scoring would call Claude; the harness only measures the agent side.
+        return None
+
+    agent_db.enqueue_scoring_job = _no_scoring
+    session_ids, suitor_id = await _seed_sessions(args.rooms)
+    try:
+        return await run_harness(
+            args.rooms,
+            latencies,
+            ramp_seconds=args.ramp_s,
+            save=agent_db.save_conversation_data,
+            session_ids=session_ids,
+        )
+    finally:
+        if not args.keep:
+            await _drop_seeded(suitor_id)
+        await agent_db.engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=10)
+    parser.add_argument("--ramp-s", type=float, default=0.0)
+    parser.add_argument("--stt-ms", type=float, default=250.0)
+    parser.add_argument("--llm-ttft-ms", type=float, default=600.0)
+    parser.add_argument("--llm-ms-per-token", type=float, default=15.0)
+    parser.add_argument("--tts-ms", type=float, default=200.0)
+    parser.add_argument("--speech-s", type=float, default=3.0)
+    parser.add_argument("--vad-cpu-ms", type=float, default=5.0)
+    parser.add_argument("--playback-scale", type=float, default=0.1)
+    parser.add_argument("--no-db", action="store_true", help="skip Postgres writes")
+    parser.add_argument("--keep", action="store_true", help="keep seeded rows")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    report = asyncio.run(_main(args))
+    print(json.dumps(asdict(report), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,28 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 import uuid
+from collections.abc import Callable
 
+from agent.backchannel import BACKCHANNEL_PHRASES, BackchannelFiller
 from agent.db import (
     get_heart_config,
     get_session_by_room,
+    mark_session_in_progress,
     save_conversation_data,
-    update_session_status,
 )
+from agent.endpointing import AdaptiveEndpointing
+from agent.hedged_llm import HedgeDelay, HedgedLLM
 from agent.interview_agent import InterviewAgent
+from agent.latency import PhaseTimer, TurnLatencyTracker
+from agent.load import LoopLagMonitor, WorkerLoad
+from agent.phrase_cache import PhraseAudioCache
 from agent.prompt_builder import build_system_prompt
+from agent.prompt_cache import PromptCacheStats
+from agent.question_bridge import BRIDGE_PHRASES, QuestionBridge
 from agent.session_manager import SessionManager
+from agent.silence import SILENT_END_REASON, SilenceWatchdog
 from src.core.config import LLMProvider, TTSProvider, config
 
 logger = logging.getLogger("valentine-agent")
@@ -40,8 +51,37 @@ else:
     except Exception:  # pragma: no cover - optional plugin
         lk_openai = None  # type: ignore[assignment]
 
-server = AgentServer() if AgentServer else None
+worker_load = WorkerLoad(config.AGENT_MAX_SESSIONS_PER_WORKER)
+
+
+def _compute_load(agent_server) -> float:
+    """`load_fnc` for AgentServer; above the threshold LiveKit routes elsewhere."""
+    return worker_load.compute(len(agent_server.active_jobs))
+
+
+# Each job runs in its own process, so the hedge delay learns only from that
+# session's own requests.
+_hedge_delay = HedgeDelay(initial=config.AGENT_LLM_HEDGE_DELAY_MS / 1000)
+server = (
+    AgentServer(load_fnc=_compute_load, load_threshold=config.AGENT_LOAD_THRESHOLD)
+    if AgentServer
+    else None
+)
 AGENT_NAME = "valentine-interview-agent"
+TTS_SAMPLE_RATE = 24000
+SMALLEST_TTS_VOICE = "irisha"
+CLOSING_LINE = (
+    "Thanks for taking the time to chat with me. "
+    "I am ending the call now and your results will be ready shortly."
+)
+RAMBLE_INTERRUPT_LINE = "I appreciate the detail, but let's keep moving."
+SILENCE_PROMPT_LINE = (
+    "Are you still there? Take your time, just say something when you're ready."
+)
+SILENT_CLOSING_LINE = (
+    "I haven't heard from you in a while, so I'm going to end the call now. "
+    "Feel free to try again whenever you're ready."
+)
 HARD_CODED_QUESTIONS: list[dict[str, object]] = [
     {
         "text": "So, what made you click on this link? Be honest — was it curiosity, boredom, or genuine interest?",
@@ -69,6 +109,15 @@ HARD_CODED_QUESTIONS: list[dict[str, object]] = [
         "order_index": 4,
     },
 ]
+STATIC_PHRASES: list[str] = [
+    CLOSING_LINE,
+    RAMBLE_INTERRUPT_LINE,
+    SILENCE_PROMPT_LINE,
+    SILENT_CLOSING_LINE,
+    *BACKCHANNEL_PHRASES,
+    *BRIDGE_PHRASES,
+    *(str(question["text"]) for question in HARD_CODED_QUESTIONS),
+]
 
 
 def _build_stt():
@@ -92,49 +141,78 @@ def _build_stt():
     )
 
 
-def _build_llm():
-    """Build an LLM client with stable provider preference."""
+def _llm_candidates() -> list[tuple[str, Callable[[], object]]]:
+    """Configured LLM providers in preference order, as lazy factories."""
+    candidates: list[tuple[str, Callable[[], object]]] = []
     if smallestai is not None and hasattr(smallestai, "LLM"):
-        logger.info("Using native SmallestAI LLM plugin (model=electron)")
-        return smallestai.LLM(model="electron")
-
+        candidates.append(("smallestai", lambda: smallestai.LLM(model="electron")))
     if lk_openai is None:
-        raise RuntimeError(
-            "LLM plugin unavailable. Install `livekit-plugins-openai` or enable the "
-            "`openai` extra in `livekit-agents`."
-        )
+        return candidates
 
     # Prefer OpenAI whenever it is configured (unless explicitly set to HuggingFace).
     if config.OPENAI_API_KEY and config.LLM_PROVIDER != LLMProvider.HUGGINGFACE:
         model_name = config.MODEL_NAME or "gpt-4o-mini"
-        logger.info("Using OpenAI LLM (model=%s)", model_name)
-        return lk_openai.LLM(
-            model=model_name,
-            api_key=config.OPENAI_API_KEY.get_secret_value(),
+        candidates.append(
+            (
+                "openai",
+                lambda: lk_openai.LLM(
+                    model=model_name,
+                    api_key=config.OPENAI_API_KEY.get_secret_value(),
+                ),
+            )
         )
 
     if config.SMALLEST_AI_API_KEY:
-        logger.info(
-            "Using Smallest OpenAI-compatible LLM (base_url=%s, model=%s)",
-            config.SMALLEST_LLM_BASE_URL,
-            config.SMALLEST_LLM_MODEL,
-        )
-        return lk_openai.LLM(
-            model=config.SMALLEST_LLM_MODEL,
-            api_key=config.SMALLEST_AI_API_KEY.get_secret_value(),
-            base_url=config.SMALLEST_LLM_BASE_URL,
+        candidates.append(
+            (
+                "smallest-openai",
+                lambda: lk_openai.LLM(
+                    model=config.SMALLEST_LLM_MODEL,
+                    api_key=config.SMALLEST_AI_API_KEY.get_secret_value(),
+                    base_url=config.SMALLEST_LLM_BASE_URL,
+                ),
+            )
         )
+    return candidates
+
 
-    if config.LLM_PROVIDER == LLMProvider.HUGGINGFACE:
+def _build_llm():
+    """Build an LLM client with stable provider preference (optionally hedged)."""
+    candidates = _llm_candidates()
+    if not candidates:
+        if lk_openai is None:
+            raise RuntimeError(
+                "LLM plugin unavailable. Install `livekit-plugins-openai` or enable "
+                "the `openai` extra in `livekit-agents`."
+            )
+        if config.LLM_PROVIDER == LLMProvider.HUGGINGFACE:
+            raise RuntimeError(
+                "LLM_PROVIDER=huggingface is not supported by the LiveKit voice "
+                "runtime. Set `LLM_PROVIDER=openai` and provide `OPENAI_API_KEY`."
+            )
         raise RuntimeError(
-            "LLM_PROVIDER=huggingface is not supported by the LiveKit voice runtime. "
-            "Set `LLM_PROVIDER=openai` and provide `OPENAI_API_KEY`."
+            "No LLM credentials found. Set `OPENAI_API_KEY` (preferred) or "
+            "`SMALLEST_AI_API_KEY`."
         )
 
-    raise RuntimeError(
-        "No LLM credentials found. Set `OPENAI_API_KEY` (preferred) or "
-        "`SMALLEST_AI_API_KEY`."
-    )
+    (primary_label, primary), *fallbacks = candidates
+    if config.AGENT_LLM_HEDGING and fallbacks and HedgedLLM is not None:
+        secondary_label, secondary = fallbacks[0]
+        logger.info(
+            "Using hedged LLM (primary=%s, secondary=%s, delay=%.2fs)",
+            primary_label,
+            secondary_label,
+            _hedge_delay.current(),
+        )
+        return HedgedLLM(
+            primary(),
+            secondary(),
+            labels=(primary_label, secondary_label),
+            delay=_hedge_delay,
+        )
+    llm = primary()
+    logger.info("Using %s LLM (model=%s)", primary_label, getattr(llm, "model", "?"))
+    return llm
 
 
 def _build_tts():
@@ -150,7 +228,7 @@ def _build_tts():
         return deepgram.TTS(
             model=config.DEEPGRAM_TTS_MODEL,
             encoding="linear16",
-            sample_rate=24000,
+            sample_rate=TTS_SAMPLE_RATE,
             api_key=config.DEEPGRAM_API_KEY.get_secret_value(),
         )
 
@@ -160,13 +238,14 @@ def _build_tts():
         if not config.SMALLEST_AI_API_KEY:
             raise RuntimeError("TTS=smallestai requires `SMALLEST_AI_API_KEY`.")
         logger.info(
-            "Using SmallestAI TTS (model=%s, voice_id=irisha)",
+            "Using SmallestAI TTS (model=%s, voice_id=%s)",
             config.SMALLEST_TTS_MODEL,
+            SMALLEST_TTS_VOICE,
         )
         return smallestai.TTS(
             model=config.SMALLEST_TTS_MODEL,
-            voice_id="irisha",
-            sample_rate=24000,
+            voice_id=SMALLEST_TTS_VOICE,
+            sample_rate=TTS_SAMPLE_RATE,
             api_key=config.SMALLEST_AI_API_KEY.get_secret_value(),
         )
 
@@ -175,12 +254,94 @@ def _build_tts():
     )
 
 
+def _build_phrase_cache() -> PhraseAudioCache:
+    """Phrase cache keyed on the same voice settings `_build_tts` uses."""
+    if config.TTS == TTSProvider.SMALLESTAI:
+        model, voice = config.SMALLEST_TTS_MODEL, SMALLEST_TTS_VOICE
+    else:
+        # Deepgram Aura voices are encoded in the model name.
+        model, voice = config.DEEPGRAM_TTS_MODEL, config.DEEPGRAM_TTS_MODEL
+    return PhraseAudioCache(
+        config.AGENT_TTS_CACHE_DIR,
+        provider=config.TTS.value,
+        model=model,
+        voice=voice,
+        sample_rate=TTS_SAMPLE_RATE,
+    )
+
+
+def prewarm(proc) -> None:
+    """Load VAD weights and cached static-phrase audio once per worker process."""
+    if silero is not None:
+        proc.userdata["vad"] = silero.VAD.load()
+    phrase_cache = _build_phrase_cache()
+    loaded = phrase_cache.preload(STATIC_PHRASES)
+    proc.userdata["phrase_cache"] = phrase_cache
+    logger.info(
+        "Phrase cache prewarmed (%s/%s static phrases on disk)",
+        loaded,
+        len(STATIC_PHRASES),
+    )
+
+
+async def _warm_phrase_cache(phrase_cache: PhraseAudioCache) -> None:
+    """Fill a cold phrase cache with a dedicated TTS client, not the live one."""
+    missing = phrase_cache.missing(STATIC_PHRASES)
+    if not missing:
+        # Warm already (the usual case): don't build a TTS client for nothing.
+        return
+    tts = _build_tts()
+    try:
+        added = await phrase_cache.warm(tts, missing)
+        if added:
+            logger.info("Phrase cache warmed (%s phrases synthesized)", added)
+    finally:
+        await _aclose_plugins(tts)
+
+
+async def _aclose_plugins(*plugins) -> None:
+    """Close plugin clients (TTS/STT/LLM) that were built but will not be used."""
+    for plugin in plugins:
+        aclose = getattr(plugin, "aclose", None)
+        if not callable(aclose):
+            continue
+        try:
+            await aclose()
+        except Exception as exc:
+            logger.warning("Failed to close %s: %s", type(plugin).__name__, exc)
+
+
+def _say(session, text: str, phrase_cache: PhraseAudioCache | None):
+    """Speak `text`, playing cached PCM instead of live TTS when available."""
+    audio = phrase_cache.frames(text) if phrase_cache is not None else None
+    if audio is not None:
+        return session.say(text, audio=audio)
+    return session.say(text)
+
+
+async def _on_request(req) -> None:
+    """Reject rooms once this worker is at its session cap so LiveKit reroutes."""
+    active_sessions = len(server.active_jobs)
+    if not worker_load.has_capacity(active_sessions):
+        logger.warning(
+            "Rejecting job %s: at session cap (%s)",
+            req.job.id,
+            worker_load.snapshot(),
+        )
+        await req.reject()
+        return
+    await req.accept()
+
+
 if server:
+    server.setup_fnc = prewarm
 
-    @server.rtc_session(agent_name=AGENT_NAME)
+    @server.rtc_session(agent_name=AGENT_NAME, on_request=_on_request)
     async def entrypoint(ctx: JobContext):  # type: ignore[misc]
         """Handle one room interview session lifecycle."""
+        join = PhaseTimer()
         await ctx.connect()
+        join.mark("connected")
 
         room_name = ctx.room.name
         session_id = room_name.removeprefix("session-")
@@ -190,12 +351,58 @@ if server:
             logger.error("Invalid room name/session id: %s", room_name)
             return
 
-        heart_config = await get_heart_config()
-        session_data = await get_session_by_room(session_id)
+        # The two DB lookups run concurrently with each other. Plugin
+        # construction below is synchronous and holds the loop, so it overlaps
+        # them only as far as the first step each takes in the yield.
+        lookups = asyncio.gather(get_heart_config(), get_session_by_room(session_id))
+        await asyncio.sleep(0)
+
+        screening_questions = HARD_CODED_QUESTIONS
+        session_mgr = SessionManager(
+            session_id=session_id,
+            questions=screening_questions,
+            max_duration_seconds=600,
+        )
+        phrase_cache = ctx.proc.userdata.get("phrase_cache")
+        endpointing = AdaptiveEndpointing(min_delay=0.5, max_delay=3.0)
+        latency = TurnLatencyTracker()
+        prompt_cache = PromptCacheStats()
+        applied_delays = endpointing.delays()
+        plugins: list = []
+        try:
+            tts = _build_tts()
+            plugins.append(tts)
+            stt = _build_stt()
+            plugins.append(stt)
+            llm = _build_llm()
+            plugins.append(llm)
+            session = AgentSession(
+                vad=ctx.proc.userdata.get("vad") or silero.VAD.load(),
+                stt=stt,
+                llm=llm,
+                tts=tts,
+                allow_interruptions=True,
+                min_endpointing_delay=applied_delays[0],
+                max_endpointing_delay=applied_delays[1],
+            )
+            join.mark("plugins_ready")
+            heart_config, session_data = await lookups
+        except BaseException:
+            # Retrieve the lookups' outcome so a failure here is not masked
+            # by "exception was never retrieved" noise or left running.
+            lookups.cancel()
+            await asyncio.gather(lookups, return_exceptions=True)
+            await _aclose_plugins(*plugins)
+            raise
+        join.mark("db_loaded")
+        hedge_stats = getattr(llm, "stats", None)
         if not session_data:
             logger.error("No DB session found for room %s", room_name)
+            await _aclose_plugins(*plugins)
             return
-        screening_questions = HARD_CODED_QUESTIONS
+        # Sampled here, in the job process that actually runs the interview.
+        loop_lag = LoopLagMonitor()
+        loop_lag.ensure_started()
         logger.info(
             "Starting agent session %s with %s screening questions",
             session_id,
@@ -208,36 +415,38 @@ if server:
             heart_config=prompt_config,
             suitor_name=session_data["suitor_name"],
         )
-        session_mgr = SessionManager(
-            session_id=session_id,
-            questions=screening_questions,
-            max_duration_seconds=600,
+        filler = BackchannelFiller(
+            # Cached audio only: a live TTS round trip would defeat the purpose.
+            phrase_cache.frames if phrase_cache is not None else lambda text: None,
+            delay_seconds=config.AGENT_BACKCHANNEL_DELAY_MS / 1000,
         )
         interview_agent = InterviewAgent(
             instructions=prompt,
             session_manager=session_mgr,
+            question_bridge=QuestionBridge(tts, phrase_cache),
+            backchannel=filler,
         )
 
-        session = AgentSession(
-            vad=silero.VAD.load(),
-            stt=_build_stt(),
-            llm=_build_llm(),
-            tts=_build_tts(),
-            allow_interruptions=True,
-            min_endpointing_delay=0.5,
-            max_endpointing_delay=3.0,
+        def _end_silent(reason: str) -> None:
+            logger.warning("Suitor silent in session %s; ending early", session_id)
+            session_mgr.end(reason)
+
+        watchdog = SilenceWatchdog(
+            lambda: _say(session, SILENCE_PROMPT_LINE, phrase_cache),
+            _end_silent,
+            prompt_after_seconds=config.AGENT_SILENCE_PROMPT_MS / 1000,
+            end_after_seconds=config.AGENT_SILENCE_END_MS / 1000,
         )
 
         already_saved = False
         save_lock = asyncio.Lock()
         closed = False
         close_lock = asyncio.Lock()
-        closing_line = (
-            "Thanks for taking the time to chat with me. "
-            "I am ending the call now and your results will be ready shortly."
-        )
+        closing_line = CLOSING_LINE
         closing_commit_event = asyncio.Event()
         closing_pending = False
+        # Monotonic start of the suitor's current speech (VAD), for endpointing.
+        user_speech_started_at: float | None = None
 
         def _spawn(coro):
             task = asyncio.create_task(coro)
@@ -252,6 +461,28 @@ if server:
             task.add_done_callback(_on_done)
             return task
 
+        def _apply_endpointing() -> None:
+            nonlocal applied_delays
+            delays = endpointing.delays()
+            if delays == applied_delays:
+                return
+            try:
+                session.update_options(
+                    min_endpointing_delay=delays[0],
+                    max_endpointing_delay=delays[1],
+                )
+            except Exception as exc:
+                logger.warning("Failed to update endpointing delays: %s", exc)
+                return
+            applied_delays = delays
+            logger.info(
+                "Session %s endpointing tuned min=%.2fs max=%.2fs (wps=%s)",
+                session_id,
+                delays[0],
+                delays[1],
+                endpointing.words_per_second,
+            )
+
         async def save_once(reason: str) -> None:
             nonlocal already_saved
             async with save_lock:
@@ -260,6 +491,20 @@ if server:
                 if session_mgr.end_reason is None:
                     session_mgr.end(reason)
                 data = session_mgr.get_session_data()
+                data["agent_metrics"] = {
+                    "endpointing": endpointing.snapshot(),
+                    "latency": latency.summary(),
+                    "prompt_cache": prompt_cache.snapshot(),
+                    "backchannel": filler.snapshot(),
+                    "join": join.snapshot(),
+                    "context": interview_agent.context_snapshot(),
+                    "silence": watchdog.snapshot(),
+                    "question_bridge": interview_agent.question_bridge.snapshot(),
+                    "loop_lag": loop_lag.snapshot(),
+                    "transcript": session_mgr.transcript_assembler.snapshot(),
+                }
+                if hedge_stats is not None:
+                    data["agent_metrics"]["llm_hedge"] = hedge_stats.snapshot()
                 await save_conversation_data(session_id, data)
                 already_saved = True
                 logger.info(
@@ -268,33 +513,137 @@ if server:
                     data["duration_seconds"],
                     len(data["turns"]),
                 )
+                bridge_stats = data["agent_metrics"]["question_bridge"]
+                logger.info(
+                    "Session %s question bridge played=%s synthesized=%s",
+                    session_id,
+                    bridge_stats["played"],
+                    bridge_stats["synthesized"],
+                )
+                logger.info(
+                    "Session %s backchannel filler fired=%s armed=%s",
+                    session_id,
+                    filler.fired,
+                    filler.armed,
+                )
+                transcript_stats = data["agent_metrics"]["transcript"]
+                logger.info(
+                    "Session %s transcript rows %s -> %s, tokens %s -> %s",
+                    session_id,
+                    transcript_stats["rows_raw"],
+                    transcript_stats["rows_persisted"],
+                    transcript_stats["tokens_raw"],
+                    transcript_stats["tokens_persisted"],
+                )
+                logger.info(
+                    "Session %s LLM prompt cache hit_rate=%s cached_tokens=%s/%s",
+                    session_id,
+                    prompt_cache.hit_rate,
+                    prompt_cache.cached_tokens,
+                    prompt_cache.prompt_tokens,
+                )
 
         async def _handle_user_speech(event):
-            text = getattr(event, "text", "").strip()
+            # v1 events carry `transcript`; interim hypotheses arrive too.
+            text = (
+                getattr(event, "transcript", None) or getattr(event, "text", "")
+            ).strip()
             if not text:
                 return
-            session_mgr.add_transcript_entry(
-                speaker="suitor",
-                text=text,
-            )
-            if session_mgr.ramble_detector.should_interrupt():
+            is_final = getattr(event, "is_final", True)
+            session_mgr.add_suitor_transcript(text, is_final=is_final)
+            # Have the next question's lead-in ready before the suitor stops.
+            interview_agent.prepare_bridge()
+            if is_final:
+                endpointing.on_user_speech(
+                    session_mgr.ramble_detector.current_turn_words,
+                    spoken_at=user_speech_started_at,
+                )
+                _apply_endpointing()
+            if session_mgr.ramble_detector.take_interrupt():
                 session_mgr.add_transcript_entry(
                     speaker="avatar",
-                    text="I appreciate the detail, but let's keep moving.",
+                    text=RAMBLE_INTERRUPT_LINE,
                 )
 
         @session.on("user_input_transcribed")
         def on_user_speech(event):
+            watchdog.on_suitor_activity()
+            if getattr(event, "is_final", True):
+                latency.on_final_transcript(getattr(event, "created_at", None))
             _spawn(_handle_user_speech(event))
 
-        @session.on("agent_speech_committed")
-        def on_agent_speech(event):
-            nonlocal closing_pending
-            text = getattr(event, "text", "").strip()
-            if text:
-                session_mgr.add_transcript_entry(speaker="avatar", text=text)
-                if closing_pending and "results will be ready shortly" in text.lower():
-                    closing_commit_event.set()
+        @session.on("user_state_changed")
+        def on_user_state_changed(event):
+            nonlocal user_speech_started_at
+            new_state = getattr(event, "new_state", None)
+            if new_state == "speaking":
+                user_speech_started_at = time.monotonic()
+                watchdog.on_suitor_activity()
+                filler.cancel()
+            elif (
+                getattr(event, "old_state", None) == "speaking"
+                and new_state == "listening"
+            ):
+                latency.on_user_stopped(getattr(event, "created_at", None))
+                filler.on_user_stopped()
+
+        @session.on("metrics_collected")
+        def on_metrics_collected(event):
+            metrics = getattr(event, "metrics", None)
+            if getattr(metrics, "type", None) == "llm_metrics":
+                latency.on_llm_metrics(
+                    metrics.timestamp, metrics.duration, metrics.ttft
+                )
+                prompt_cache.on_llm_metrics(
+                    getattr(metrics, "prompt_tokens", 0),
+                    getattr(metrics, "prompt_cached_tokens", 0),
+                )
+
+        @session.on("function_tools_executed")
+        def on_function_tools_executed(event):
+            latency.on_tool_call(getattr(event, "created_at", None))
+
+        @session.on("agent_state_changed")
+        def on_agent_state_changed(event):
+            new_state = getattr(event, "new_state", None)
+            if new_state == "listening":
+                watchdog.on_agent_idle()
+            elif new_state in ("thinking", "speaking"):
+                watchdog.on_agent_busy()
+            if new_state == "speaking" and "first_audio" not in join.phases:
+                join.mark("first_audio")
+                logger.info(
+                    "Session %s room join -> first audio %sms (%s)",
+                    session_id,
+                    join.phases["first_audio"],
+                    join.snapshot(),
+                )
+            if new_state != "speaking":
+                return
+            latency.on_first_audio(getattr(event, "created_at", None))
+            endpointing.on_agent_speaking()
+            _apply_endpointing()
+
+        @session.on("conversation_item_added")
+        def on_conversation_item_added(event):
+            item = getattr(event, "item", None)
+            role = getattr(item, "role", None)
+            if role == "user":
+                # Committed user turn: close the suitor's utterance here, not
+                # on a VAD pause mid-answer.
+                session_mgr.end_suitor_turn()
+                return
+            if role != "assistant":
+                return
+            text = (getattr(item, "text_content", None) or "").strip()
+            if not text:
+                return
+            session_mgr.add_transcript_entry(speaker="avatar", text=text)
+            if closing_pending and (
+                "results will be ready shortly" in text.lower() or text == closing_line
+            ):
+                closing_commit_event.set()
 
         async def on_close(reason: str) -> None:
             nonlocal closed
@@ -321,41 +670,51 @@ if server:
             _spawn(_handle_participant_disconnected(participant))
 
         await session.start(room=ctx.room, agent=interview_agent)
-        await update_session_status(session_id, "in_progress")
+        join.mark("session_started")
+        if phrase_cache is not None:
+            # First session on a cold disk cache synthesizes the static phrases
+            # once; every later session (and worker restart) plays them from disk.
+            _spawn(_warm_phrase_cache(phrase_cache))
 
         # Ensure the agent always speaks first immediately after joining.
         first_question = session_mgr.get_next_question()
         if first_question:
-            opener = (
+            greeting = (
                 f"Hey {session_data['suitor_name']} — thanks for joining. "
-                f"Let's jump in. {first_question['text']}"
+                "Let's jump in."
             )
             try:
-                session_mgr.add_transcript_entry(speaker="avatar", text=opener)
-                await session.say(opener)
+                # Both lines reach the transcript via conversation_item_added.
+                session.say(greeting)
+                _say(session, str(first_question["text"]), phrase_cache)
+                join.mark("opener_queued")
             except Exception as exc:
                 logger.warning(
                     "Failed to deliver opener for session %s: %s",
                     session_id,
                     exc,
                 )
+        # Nothing downstream waits on this; keep it off the first-word path.
+        _spawn(mark_session_in_progress(session_id))
 
-        while session_mgr.end_reason is None and not session_mgr.is_overtime():
-            await asyncio.sleep(1)
-        if session_mgr.end_reason is None:
-            session_mgr.end("max_duration_reached")
+        session_mgr.arm_deadline()
+        await session_mgr.wait_for_end()
+        watchdog.stop()
+        if session_mgr.end_reason == SILENT_END_REASON:
+            closing_line = SILENT_CLOSING_LINE
 
         async def _say_closing_message() -> None:
             nonlocal closing_pending
-            # Track intended close line even if runtime speak hooks differ by SDK version.
-            session_mgr.add_transcript_entry(speaker="avatar", text=closing_line)
             for method_name in ("say", "speak"):
                 maybe_method = getattr(session, method_name, None)
                 if not callable(maybe_method):
                     continue
                 try:
                     closing_pending = True
-                    result = maybe_method(closing_line)
+                    if method_name == "say":
+                        result = _say(session, closing_line, phrase_cache)
+                    else:
+                        result = maybe_method(closing_line)
                     if asyncio.iscoroutine(result):
                         await result
                     try:
@@ -392,6 +751,8 @@ if server:
                 session_id,
                 exc,
             )
+        finally:
+            loop_lag.stop()
 
 else:
 
@@ -0,0 +1,220 @@
+"""On-disk PCM cache for static agent utterances (closing line, fixed questions)."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import wave
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    from livekit import rtc
+except Exception:  # pragma: no cover - optional dependency guard
+    rtc = None  # type: ignore[assignment]
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+_SAMPLE_WIDTH_BYTES = 2  # 16-bit signed PCM, the format LiveKit AudioFrames carry.
+_WARM_LOCK_NAME = ".warm.lock"
+
+
+@dataclass(frozen=True)
+class CachedPhrase:
+    """Raw PCM for one synthesized phrase."""
+
+    pcm: bytes
+    sample_rate: int
+    num_channels: int
+
+    @property
+    def duration_seconds(self) -> float:
+        """Playback length of the cached audio."""
+        frame_bytes = _SAMPLE_WIDTH_BYTES * self.num_channels
+        return len(self.pcm) / frame_bytes / self.sample_rate
+
+
+class PhraseAudioCache:
+    """TTS phrase cache keyed by (provider, model, voice, sample_rate, text)."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        *,
+        provider: str,
+        model: str,
+        voice: str,
+        sample_rate: int,
+        chunk_ms: int = 20,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.provider = provider
+        self.model = model
+        self.voice = voice
+        self.sample_rate = sample_rate
+        self.chunk_ms = chunk_ms
+        self._entries: dict[str, CachedPhrase] = {}
+        self._warmed = False
+
+    def key(self, text: str) -> str:
+        """Stable content key for one phrase under the configured voice."""
+        raw = "\x1f".join(
+            [self.provider, self.model, self.voice, str(self.sample_rate), text]
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, text: str) -> Path:
+        return self.cache_dir / f"{self.key(text)}.wav"
+
+    def has(self, text: str) -> bool:
+        """True when the phrase is loaded in memory and ready to play."""
+        return self.key(text) in self._entries
+
+    def preload(self, texts: Iterable[str]) -> int:
+        """Load already-persisted phrases from disk; returns how many were found."""
+        return sum(1 for text in texts if self._load(text) is not None)
+
+    def missing(self, texts: Iterable[str]) -> list[str]:
+        """Phrases neither in memory nor on disk, i.e. what `warm` would synthesize."""
+        return [text for text in texts if self._load(text) is None]
+
+    def _load(self, text: str) -> CachedPhrase | None:
+        key = self.key(text)
+        if key in self._entries:
+            return self._entries[key]
+        path = self._path(text)
+        if not path.exists():
+            return None
+        try:
+            with wave.open(str(path), "rb") as wav:
+                entry = CachedPhrase(
+                    pcm=wav.readframes(wav.getnframes()),
+                    sample_rate=wav.getframerate(),
+                    num_channels=wav.getnchannels(),
+                )
+        except (OSError, EOFError, wave.Error) as exc:
+            logger.warning("Ignoring unreadable phrase cache file %s: %s", path, exc)
+            return None
+        self._entries[key] = entry
+        return entry
+
+    def store(self, text: str, entry: CachedPhrase) -> None:
+        """Keep one phrase in memory and persist it atomically to disk."""
+        self._entries[self.key(text)] = entry
+        path = self._path(text)
+        tmp_name = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Unique per writer: job processes share the cache directory.
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_dir, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_name = tmp.name
+                with wave.open(tmp, "wb") as wav:
+                    wav.setnchannels(entry.num_channels)
+                    wav.setsampwidth(_SAMPLE_WIDTH_BYTES)
+                    wav.setframerate(entry.sample_rate)
+                    wav.writeframes(entry.pcm)
+            os.replace(tmp_name, path)
+        except OSError as exc:
+            logger.warning("Failed to persist phrase cache file %s: %s", path, exc)
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    def _try_warm_lock(self):
+        """Exclusive non-blocking lock on the cache dir, or None if held elsewhere."""
+        if fcntl is None:
+            return open(os.devnull, "a")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            handle = open(self.cache_dir / _WARM_LOCK_NAME, "a")
+        except OSError as exc:
+            logger.warning("Phrase cache lock unavailable: %s", exc)
+            return None
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return None
+        return handle
+
+    async def warm(self, tts, texts: Iterable[str]) -> int:
+        """Synthesize phrases missing from the cache; returns how many were added.
+
+        Runs at most once per process, and only in the one process holding the
+        cache directory's warm lock; the others skip and read the files it
+        writes lazily in `frames`.
+        """
+        if self._warmed:
+            return 0
+        lock = self._try_warm_lock()
+        if lock is None:
+            return 0
+        self._warmed = True
+        try:
+            return await self._synthesize_missing(tts, texts)
+        finally:
+            lock.close()
+
+    async def _synthesize_missing(self, tts, texts: Iterable[str]) -> int:
+        added = 0
+        for text in texts:
+            # Another process may have written it since this one prewarmed.
+            if self._load(text) is not None:
+                continue
+            try:
+                pcm = bytearray()
+                sample_rate = self.sample_rate
+                num_channels = 1
+                async with tts.synthesize(text) as stream:
+                    async for chunk in stream:
+                        frame = chunk.frame
+                        sample_rate = frame.sample_rate
+                        num_channels = frame.num_channels
+                        pcm.extend(bytes(frame.data))
+            except Exception as exc:
+                logger.warning("Phrase cache synthesis failed for %r: %s", text, exc)
+                continue
+            if not pcm:
+                continue
+            self.store(
+                text,
+                CachedPhrase(
+                    pcm=bytes(pcm), sample_rate=sample_rate, num_channels=num_channels
+                ),
+            )
+            added += 1
+        return added
+
+    def frames(self, text: str) -> AsyncIterator | None:
+        """Return an AudioFrame stream for a cached phrase, or None on a miss."""
+        if rtc is None:
+            return None
+        entry = self._load(text)
+        if entry is None:
+            return None
+        return self._iter_frames(entry)
+
+    async def _iter_frames(self, entry: CachedPhrase) -> AsyncIterator:
+        samples_per_chunk = max(1, entry.sample_rate * self.chunk_ms // 1000)
+        bytes_per_chunk = samples_per_chunk * entry.num_channels * _SAMPLE_WIDTH_BYTES
+        for offset in range(0, len(entry.pcm), bytes_per_chunk):
+            chunk = entry.pcm[offset : offset + bytes_per_chunk]
+            yield rtc.AudioFrame(
+                data=chunk,
+                sample_rate=entry.sample_rate,
+                num_channels=entry.num_channels,
+                samples_per_channel=len(chunk)
+                // (entry.num_channels * _SAMPLE_WIDTH_BYTES),
+            )
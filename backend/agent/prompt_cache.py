@@ -0,0 +1,34 @@
+"""Prompt-prefix cache accounting for the interview LLM."""
+
+from __future__ import annotations
+
+
+class PromptCacheStats:
+    """Accumulates prompt vs. cached prompt tokens from LiveKit `LLMMetrics`."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+
+    def on_llm_metrics(self, prompt_tokens: int, cached_tokens: int) -> None:
+        """Record one LLM request's usage."""
+        self.requests += 1
+        self.prompt_tokens += max(prompt_tokens, 0)
+        self.cached_tokens += max(cached_tokens, 0)
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Share of prompt tokens served from the provider's prefix cache."""
+        if self.prompt_tokens <= 0:
+            return None
+        return round(self.cached_tokens / self.prompt_tokens, 3)
+
+    def snapshot(self) -> dict:
+        """Metrics for persistence alongside latency and endpointing."""
+        return {
+            "requests": self.requests,
+            "prompt_tokens": self.prompt_tokens,
+            "cached_tokens": self.cached_tokens,
+            "hit_rate": self.hit_rate,
+        }
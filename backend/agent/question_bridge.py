@@ -0,0 +1,131 @@
+"""Pre-synthesized lead-in played ahead of each new screening question."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+
+from agent.phrase_cache import PhraseAudioCache
+
+logger = logging.getLogger(__name__)
+
+BRIDGE_PHRASES: tuple[str, ...] = (
+    "Okay, next one.",
+    "Alright, here's another.",
+    "Got it. Moving on.",
+)
+
+_END = object()
+
+
+class QuestionBridge:
+    """Fixed bridge phrase whose audio is ready before the next question is.
+
+    The LLM words every question in its own style, so the question itself
+    cannot be synthesized ahead of time; a templated lead-in can. `prepare()`
+    buffers the next phrase while the suitor is still talking (a no-op once
+    the phrase cache holds it), and `take()` hands it to `tts_node`, which
+    plays it while the reply's own TTS is still producing its first frame.
+    """
+
+    def __init__(
+        self,
+        tts,
+        phrase_cache: PhraseAudioCache | None = None,
+        phrases: tuple[str, ...] = BRIDGE_PHRASES,
+    ):
+        self._tts = tts
+        self._phrase_cache = phrase_cache
+        self._phrases = phrases
+        self._next = 0
+        self._task: asyncio.Task | None = None
+        self.played = 0
+        self.synthesized = 0
+
+    @property
+    def next_text(self) -> str:
+        """The phrase the next `take()` will play."""
+        return self._phrases[self._next % len(self._phrases)]
+
+    def _cached(self, text: str) -> AsyncIterator | None:
+        if self._phrase_cache is None:
+            return None
+        return self._phrase_cache.frames(text)
+
+    def prepare(self) -> None:
+        """Buffer the next phrase unless it is cached or already buffering."""
+        if self._task is not None:
+            return
+        text = self.next_text
+        if self._phrase_cache is not None and self._phrase_cache.has(text):
+            return
+        self.synthesized += 1
+        self._task = asyncio.create_task(self._synthesize(text))
+        self._task.add_done_callback(_swallow_exception)
+
+    async def _synthesize(self, text: str) -> list:
+        frames: list = []
+        async with self._tts.synthesize(text) as stream:
+            async for chunk in stream:
+                frames.append(chunk.frame)
+        return frames
+
+    async def take(self) -> tuple[str, AsyncIterator] | None:
+        """Consume the prepared phrase as (text, frames); None if not ready."""
+        text = self.next_text
+        task, self._task = self._task, None
+        audio = self._cached(text)
+        if audio is None and task is not None:
+            if not task.done():
+                # Still synthesizing: waiting would add latency, not hide it.
+                task.cancel()
+                return None
+            try:
+                audio = _iterate(task.result())
+            except Exception as exc:
+                logger.warning("Question bridge synthesis failed: %s", exc)
+                return None
+        if audio is None:
+            return None
+        self._next += 1
+        self.played += 1
+        return text, audio
+
+    def snapshot(self) -> dict:
+        """Bridges played vs. paid TTS syntheses (zero once the cache is warm)."""
+        return {"played": self.played, "synthesized": self.synthesized}
+
+
+async def lead_in(bridge: AsyncIterator, reply: AsyncIterator) -> AsyncIterator:
+    """Yield `bridge` frames, then `reply`'s, pulling `reply` concurrently."""
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def _pump() -> None:
+        try:
+            async for frame in reply:
+                await queue.put(frame)
+        finally:
+            await queue.put(_END)
+
+    pump = asyncio.create_task(_pump())
+    try:
+        async for frame in bridge:
+            yield frame
+        while (frame := await queue.get()) is not _END:
+            yield frame
+        await pump
+    finally:
+        if not pump.done():
+            pump.cancel()
+
+
+def _swallow_exception(task: asyncio.Task) -> None:
+    # A cancelled or failed synthesis may finish after nobody is waiting on it.
+    if not task.cancelled():
+        task.exception()
+
+
+async def _iterate(frames: list) -> AsyncIterator:
+    for frame in frames:
+        yield frame
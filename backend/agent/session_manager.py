@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from dataclasses import dataclass
 
+from agent.transcript import TranscriptAssembler
+
 
 @dataclass
 class ConversationTurn:
@@ -25,6 +28,7 @@ class RambleDetector:
         self.word_threshold = word_threshold
         self.current_turn_start: float | None = None
         self.current_turn_words = 0
+        self.interrupted = False
 
     def on_user_speech(self, text: str) -> None:
         """Track partial transcript chunks for one turn."""
@@ -42,10 +46,18 @@ class RambleDetector:
             or self.current_turn_words > self.word_threshold
         )
 
+    def take_interrupt(self) -> bool:
+        """True the first time this turn exceeds the thresholds, then False."""
+        if self.interrupted or not self.should_interrupt():
+            return False
+        self.interrupted = True
+        return True
+
     def reset(self) -> None:
         """Reset counters when a turn commits."""
         self.current_turn_start = None
         self.current_turn_words = 0
+        self.interrupted = False
 
 
 class SessionManager:
@@ -64,6 +76,9 @@ class SessionManager:
         self.end_reason: str | None = None
         self.full_transcript: list[dict] = []
         self.ramble_detector = RambleDetector()
+        self.transcript_assembler = TranscriptAssembler()
+        self._ended = asyncio.Event()
+        self._deadline_handle: asyncio.TimerHandle | None = None
 
     def get_next_question(self) -> dict | None:
         """Return next question or None when done."""
@@ -106,7 +121,10 @@ class SessionManager:
         return max(0, len(self.questions) - self.current_question_index)
 
     def add_transcript_entry(self, speaker: str, text: str):
-        """Append raw transcript event."""
+        """Append a finalized transcript entry."""
+        if speaker != "suitor":
+            # The suitor's open turn ends when the avatar speaks; keep order.
+            self.flush_suitor_turn()
         self.full_transcript.append(
             {
                 "speaker": speaker,
@@ -118,6 +136,34 @@ class SessionManager:
         if speaker == "suitor":
             self.ramble_detector.on_user_speech(text)
 
+    def add_suitor_transcript(self, text: str, is_final: bool = True) -> None:
+        """Feed one streaming STT event; only final segments count and persist."""
+        finalized = self.transcript_assembler.add(text, is_final=is_final)
+        if finalized:
+            self.ramble_detector.on_user_speech(finalized)
+
+    def flush_suitor_turn(self) -> None:
+        """Persist the suitor's open turn as one utterance with its offsets."""
+        utterance = self.transcript_assembler.flush()
+        if utterance is None:
+            return
+        self.full_transcript.append(
+            {
+                "speaker": "suitor",
+                "text": utterance.text,
+                "timestamp": utterance.started_at,
+                "index": len(self.full_transcript),
+                "start_offset": round(utterance.started_at - self.started_at, 3),
+                "end_offset": round(utterance.ended_at - self.started_at, 3),
+                "duration": round(utterance.ended_at - utterance.started_at, 3),
+            }
+        )
+
+    def end_suitor_turn(self) -> None:
+        """The suitor's turn was committed: persist it and restart ramble counts."""
+        self.flush_suitor_turn()
+        self.ramble_detector.reset()
+
     def is_overtime(self) -> bool:
         """True when session duration has exceeded configured max."""
         return (time.time() - self.started_at) > self.max_duration
@@ -126,9 +172,34 @@ class SessionManager:
         """Mark session ended and capture reason."""
         self.ended_at = time.time()
         self.end_reason = reason
+        self._cancel_deadline()
+        self._ended.set()
+
+    def arm_deadline(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """Schedule a one-shot `max_duration_reached` end on the event loop."""
+        loop = loop or asyncio.get_running_loop()
+        self._cancel_deadline()
+        remaining = max(0.0, self.max_duration - (time.time() - self.started_at))
+        self._deadline_handle = loop.call_at(loop.time() + remaining, self._on_deadline)
+
+    def _on_deadline(self) -> None:
+        self._deadline_handle = None
+        if self.end_reason is None:
+            self.end("max_duration_reached")
+
+    def _cancel_deadline(self) -> None:
+        if self._deadline_handle is not None:
+            self._deadline_handle.cancel()
+            self._deadline_handle = None
+
+    async def wait_for_end(self) -> str:
+        """Block until `end()` runs (explicitly or via the deadline timer)."""
+        await self._ended.wait()
+        return self.end_reason or "unknown"
 
     def get_session_data(self) -> dict:
         """Serialize all tracked state for persistence/scoring."""
+        self.flush_suitor_turn()
         return {
             "session_id": self.session_id,
             "turns": [
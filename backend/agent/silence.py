@@ -0,0 +1,91 @@
+"""Silence watchdog that ends interviews the suitor has abandoned."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+SILENT_END_REASON = "suitor_silent"
+
+
+class SilenceWatchdog:
+    """Nudges a silent suitor once, then ends the session.
+
+    The clock only runs while the agent is idle and listening: `on_agent_idle`
+    arms it, `on_agent_busy` pauses it, and any suitor activity (VAD speech or
+    a transcript) resets it, including the one-nudge allowance.
+    """
+
+    def __init__(
+        self,
+        prompt: Callable[[], object],
+        end: Callable[[str], object],
+        *,
+        prompt_after_seconds: float,
+        end_after_seconds: float,
+    ):
+        self._prompt = prompt
+        self._end = end
+        self.prompt_after_seconds = prompt_after_seconds
+        self.end_after_seconds = end_after_seconds
+        self._timer: asyncio.TimerHandle | None = None
+        self.prompted = False
+        self.prompts = 0
+        self.fired = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.prompt_after_seconds > 0
+
+    def on_suitor_activity(self) -> None:
+        """Suitor spoke (VAD or STT); start a fresh silence window."""
+        self._cancel()
+        self.prompted = False
+
+    def on_agent_busy(self) -> None:
+        """Agent is thinking or speaking; silence is not the suitor's fault."""
+        self._cancel()
+
+    def on_agent_idle(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """Agent is listening; start counting suitor silence."""
+        if not self.enabled or self.fired:
+            return
+        self._cancel()
+        loop = loop or asyncio.get_running_loop()
+        wait = self.end_after_seconds if self.prompted else self.prompt_after_seconds
+        self._timer = loop.call_later(max(0.0, wait), self._fire)
+
+    def stop(self) -> None:
+        self._cancel()
+        self.fired = True
+
+    def _cancel(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _fire(self) -> None:
+        self._timer = None
+        if not self.prompted:
+            self.prompted = True
+            self.prompts += 1
+            try:
+                self._prompt()
+            except Exception as exc:
+                logger.warning("Silence prompt failed: %s", exc)
+                # Without a nudge the agent never goes busy/idle again; keep counting.
+                self.on_agent_idle()
+            return
+        self.fired = True
+        self._end(SILENT_END_REASON)
+
+    def snapshot(self) -> dict:
+        return {
+            "prompt_after_ms": int(self.prompt_after_seconds * 1000),
+            "end_after_ms": int(self.end_after_seconds * 1000),
+            "prompts": self.prompts,
+            "ended_session": self.fired,
+        }
@@ -0,0 +1,94 @@
+"""Coalesce streaming STT events into one finalized utterance per suitor turn."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+_CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class Utterance:
+    """Finalized suitor speech for one turn, with offsets into the session."""
+
+    text: str
+    started_at: float
+    ended_at: float
+
+
+class TranscriptAssembler:
+    """Merges interim hypotheses and final segments until the turn is flushed.
+
+    Interim results only replace the pending hypothesis (they are never
+    persisted); final segments are appended to the current turn. `flush()`
+    closes the turn, normally when the avatar speaks or the session ends.
+    """
+
+    def __init__(self) -> None:
+        self._segments: list[str] = []
+        self._interim = ""
+        self._started_at: float | None = None
+        self._ended_at: float | None = None
+        self.events = 0
+        self.interim_events = 0
+        self.dropped_interims = 0
+        self.utterances = 0
+        self.raw_chars = 0
+        self.final_chars = 0
+
+    @property
+    def pending_text(self) -> str:
+        """Finalized text of the open turn plus the live hypothesis."""
+        return " ".join([*self._segments, self._interim]).strip()
+
+    def add(self, text: str, *, is_final: bool, at: float | None = None) -> str:
+        """Feed one STT event; returns the newly finalized text ("" for interims)."""
+        text = text.strip()
+        if not text:
+            return ""
+        now = time.time() if at is None else at
+        self.events += 1
+        self.raw_chars += len(text)
+        if self._started_at is None:
+            self._started_at = now
+        if not is_final:
+            self.interim_events += 1
+            self._interim = text
+            return ""
+        self._interim = ""
+        self._segments.append(text)
+        self._ended_at = now
+        return text
+
+    def flush(self) -> Utterance | None:
+        """Close the current turn; interim-only speech is discarded."""
+        if self._interim:
+            self.dropped_interims += 1
+        segments, started_at, ended_at = (
+            self._segments,
+            self._started_at,
+            self._ended_at,
+        )
+        self._segments = []
+        self._interim = ""
+        self._started_at = None
+        self._ended_at = None
+        if not segments or started_at is None or ended_at is None:
+            return None
+        text = " ".join(segments)
+        self.utterances += 1
+        self.final_chars += len(text)
+        return Utterance(text=text, started_at=started_at, ended_at=ended_at)
+
+    def snapshot(self) -> dict:
+        """Rows and approximate tokens saved versus persisting every event."""
+        return {
+            "events": self.events,
+            "interim_events": self.interim_events,
+            "dropped_interims": self.dropped_interims,
+            "rows_raw": self.events,
+            "rows_persisted": self.utterances,
+            "tokens_raw": self.raw_chars // _CHARS_PER_TOKEN,
+            "tokens_persisted": self.final_chars // _CHARS_PER_TOKEN,
+        }
@@ -0,0 +1,35 @@
+"""add_score_cache_tokens
+
+Revision ID: 5b2f8c1d9a47
+Revises: 1e820b0afd83
+Create Date: 2026-10-19 10:12:31.402118
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b2f8c1d9a47"
+down_revision: Union[str, Sequence[str], None] = "1e820b0afd83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "scores", sa.Column("claude_cache_read_tokens", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "scores",
+        sa.Column("claude_cache_creation_tokens", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("scores", "claude_cache_creation_tokens")
+    op.drop_column("scores", "claude_cache_read_tokens")
@@ -0,0 +1,34 @@
+"""add_score_prompt_tokens
+
+Revision ID: 7f3b1d8e5a29
+Revises: 2a6c9e4b7d13
+Create Date: 2026-10-19 18:22:45.930114
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7f3b1d8e5a29"
+down_revision: Union[str, Sequence[str], None] = "2a6c9e4b7d13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "scores", sa.Column("prompt_tokens_before", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "scores", sa.Column("prompt_tokens_after", sa.Integer(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("scores", "prompt_tokens_after")
+    op.drop_column("scores", "prompt_tokens_before")
@@ -0,0 +1,31 @@
+"""add_session_scoring_claim
+
+Revision ID: 9d4e7a2c1f60
+Revises: 5b2f8c1d9a47
+Create Date: 2026-10-19 14:03:52.551870
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4e7a2c1f60"
+down_revision: Union[str, Sequence[str], None] = "5b2f8c1d9a47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "sessions",
+        sa.Column("scoring_claimed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("sessions", "scoring_claimed_at")
@@ -6,14 +6,13 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
-from arq import create_pool
-from arq.connections import RedisSettings
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy import text
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import ValidationError
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.config import config
 from src.core.exceptions import NotFoundError
+from src.core.redis_pool import ArqPool
 from src.dependencies import (
     get_calcom_service,
     get_db_session,
@@ -21,18 +20,25 @@ from src.dependencies import (
     get_tavus_service,
     verify_admin_key,
 )
+from src.models.session_model import SessionDb
 from src.repository.heart_repository import HeartRepository
+from src.repository.scoring_cache_repository import ScoringCacheRepository
 from src.schemas.admin_schema import (
     AvatarCreateResponse,
     CalcomStatusInfo,
     CalendarStatusResponse,
+    LatencyReportResponse,
+    LatencyStageReport,
     LinkToggleRequest,
+    ScoringCacheStatsResponse,
+    SessionLatencyEntry,
     SystemHealthResponse,
     TavusStatusInfo,
 )
 from src.schemas.common_schema import SuccessResponse
 from src.services.calcom_service import CalcomService
 from src.services.tavus_service import TavusService
+from src.util.stats import percentile
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -51,6 +57,22 @@ def get_heart_repo(request: Request) -> HeartRepository:
 HeartRepoDep = Annotated[HeartRepository, Depends(get_heart_repo)]
 
 
+def get_arq_pool(request: Request) -> ArqPool:
+    """Resolve the process-wide arq pool from the app container."""
+    return request.app.state.container.arq_pool()
+
+
+ArqPoolDep = Annotated[ArqPool, Depends(get_arq_pool)]
+
+
+def get_scoring_cache_repo(request: Request) -> ScoringCacheRepository:
+    """Resolve ScoringCacheRepository from the app container."""
+    return request.app.state.container.scoring_cache_repository()
+
+
+ScoringCacheRepoDep = Annotated[ScoringCacheRepository, Depends(get_scoring_cache_repo)]
+
+
 async def _get_heart_or_404(
     heart_repo: HeartRepository, heart_id: uuid.UUID
 ):  # pragma: no cover - trivial guard
@@ -83,6 +105,7 @@ async def create_avatar(
     heart_repo: HeartRepoDep,
     heart_id: HeartIdDep,
     tavus: TavusDep,
+    arq_pool: ArqPoolDep,
 ):
     """Trigger Tavus replica creation from the configured Heart video URL."""
     heart = await _get_heart_or_404(heart_repo, heart_id)
@@ -118,18 +141,13 @@ async def create_avatar(
 
     await heart_repo.update_attr(heart.id, "tavus_avatar_id", str(replica_id))
 
-    redis_pool = None
     try:
-        redis_pool = await create_pool(RedisSettings.from_dsn(config.REDIS_URL))
-        await redis_pool.enqueue_job(
+        await arq_pool.enqueue_job(
             "poll_tavus_replica_status", str(heart.id), str(replica_id)
         )
     except Exception:
         # Do not fail setup when queue is temporarily unavailable.
         pass
-    finally:
-        if redis_pool is not None:
-            await redis_pool.aclose()
 
     return AvatarCreateResponse(
         replica_id=str(replica_id),
@@ -234,6 +252,7 @@ async def health(
     tavus: TavusDep,
     calcom: CalcomDep,
     db: DbDep,
+    arq_pool: ArqPoolDep,
 ):
     """Return overall system health for DB, Redis, Tavus, cal.com, and Heart config."""
     heart = await _get_heart_or_404(heart_repo, heart_id)
@@ -246,15 +265,10 @@ async def health(
     except Exception:
         db_status = "error"
 
-    redis_pool = None
     try:
-        redis_pool = await create_pool(RedisSettings.from_dsn(config.REDIS_URL))
-        await redis_pool.ping()
+        await arq_pool.ping()
     except Exception:
         redis_status = "error"
-    finally:
-        if redis_pool is not None:
-            await redis_pool.aclose()
 
     if heart.tavus_avatar_id:
         try:
@@ -300,3 +314,83 @@ async def health(
         tavus=tavus_info,
         calcom=calcom_info,
     )
+
+
+def _latency_entry(row: SessionDb) -> SessionLatencyEntry | None:
+    """The session's recorded latency summary, or None if missing or malformed."""
+    metadata = row.session_metadata if isinstance(row.session_metadata, dict) else {}
+    agent_metrics = metadata.get("agent_metrics")
+    latency = agent_metrics.get("latency") if isinstance(agent_metrics, dict) else None
+    if not isinstance(latency, dict):
+        return None
+    try:
+        return SessionLatencyEntry(
+            session_id=str(row.id),
+            ended_at=row.ended_at,
+            turns=latency.get("turns") or 0,
+            stages=latency.get("stages") or {},
+        )
+    except ValidationError:
+        # Legacy or hand-edited metadata must not take the whole report down.
+        return None
+
+
+@router.get("/latency", response_model=LatencyReportResponse)
+async def latency_report(
+    _admin: AdminKey,
+    heart_id: HeartIdDep,
+    db: DbDep,
+    limit: int = Query(default=50, ge=1, le=500),
+):
+    """Aggregate per-session voice pipeline latency (p50/p95) across recent calls."""
+    rows = (
+        (
+            await db.execute(
+                select(SessionDb)
+                .where(
+                    SessionDb.heart_id == heart_id,
+                    SessionDb.ended_at.is_not(None),
+                )
+                .order_by(SessionDb.ended_at.desc())
+                .limit(limit)
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    entries = [entry for row in rows if (entry := _latency_entry(row)) is not None]
+
+    stage_names = sorted({name for entry in entries for name in entry.stages})
+    stages: dict[str, LatencyStageReport] = {}
+    for name in stage_names:
+        p50s = [
+            entry.stages[name]["p50_ms"]
+            for entry in entries
+            if entry.stages.get(name, {}).get("p50_ms") is not None
+        ]
+        p95s = [
+            entry.stages[name]["p95_ms"]
+            for entry in entries
+            if entry.stages.get(name, {}).get("p95_ms") is not None
+        ]
+        stages[name] = LatencyStageReport(
+            sessions=len(p50s),
+            p50_ms=percentile(p50s, 50),
+            p95_ms=percentile(p95s, 95),
+        )
+
+    return LatencyReportResponse(
+        sessions_considered=len(entries),
+        stages=stages,
+        sessions=entries,
+    )
+
+
+@router.get("/scoring/cache", response_model=ScoringCacheStatsResponse)
+async def scoring_cache_stats(
+    _admin: AdminKey,
+    cache_repo: ScoringCacheRepoDep,
+):
+    """Report how often scoring was served from the result cache."""
+    return ScoringCacheStatsResponse(**await cache_repo.stats())
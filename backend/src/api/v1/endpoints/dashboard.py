@@ -8,6 +8,7 @@ from datetime import date, datetime, time, timedelta, timezone
 from typing import Annotated, Any, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import ValidationError
 from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import col
@@ -32,6 +33,7 @@ from src.schemas.dashboard_schema import (
     DashboardScoresBlock,
     DashboardSessionBlock,
     DashboardSessionDetailResponse,
+    DashboardSessionLatency,
     DashboardSessionScores,
     DashboardSessionsResponse,
     DashboardSessionSummary,
@@ -88,6 +90,21 @@ def _extract_turns(turn_summaries: Any) -> list[dict[str, Any]]:
     return []
 
 
+def _extract_latency(metadata: Any) -> DashboardSessionLatency | None:
+    if not isinstance(metadata, dict):
+        return None
+    agent_metrics = metadata.get("agent_metrics")
+    if not isinstance(agent_metrics, dict):
+        return None
+    latency = agent_metrics.get("latency")
+    if not isinstance(latency, dict):
+        return None
+    try:
+        return DashboardSessionLatency.model_validate(latency)
+    except ValidationError:
+        return None
+
+
 def _session_duration_seconds(
     started_at: datetime | None, ended_at: datetime | None
 ) -> int | None:
@@ -513,6 +530,7 @@ async def get_dashboard_session_detail(
         verdict=verdict_value,
         feedback=feedback_block,
         booking=booking_block,
+        latency=_extract_latency(session.session_metadata),
     )
 
 
@@ -479,11 +479,14 @@ async def end_session(
     if session.suitor_id != suitor.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
 
-    now = datetime.now(timezone.utc)
-    await session_repo.update_attr(id, "ended_at", now)
-    await session_repo.update_attr(id, "end_reason", "manual_end")
-    if session.status in {SessionStatus.PENDING, SessionStatus.IN_PROGRESS}:
-        await session_repo.update_status(id, SessionStatus.COMPLETED)
+    # A session the agent already finished keeps its own end_reason/ended_at.
+    await session_repo.transition(
+        id,
+        {SessionStatus.PENDING, SessionStatus.IN_PROGRESS},
+        status=SessionStatus.COMPLETED,
+        ended_at=datetime.now(timezone.utc),
+        end_reason="manual_end",
+    )
 
     if session.livekit_room_name:
         try:
@@ -608,8 +611,12 @@ async def get_session_verdict(
             },
         )
 
+    # Streamed scoring publishes the verdict before the feedback is written.
+    feedback_pending = verdict_status == "feedback_pending"
+    # The verdict stands but its feedback failed; a retry job fills it in.
+    feedback_failed = verdict_status == "feedback_failed"
     heart = await heart_repo.read_by_id(session.heart_id)
-    feedback = _feedback_payload(score)
+    feedback = None if feedback_failed else _feedback_payload(score)
     aggregate = float(score.final_score or score.weighted_total or 0.0)
     scores_payload = {
         key: {
@@ -638,10 +645,19 @@ async def get_session_verdict(
         creativity_score=score.creativity_score,
         intent_clarity_score=score.intent_clarity_score,
         emotional_intelligence_score=score.emotional_intelligence_score,
-        feedback_text=feedback.get("summary"),
-        feedback_strengths=feedback.get("strengths"),
-        feedback_improvements=feedback.get("improvements"),
+        feedback_text=feedback.get("summary") if feedback else None,
+        feedback_strengths=feedback.get("strengths") if feedback else None,
+        feedback_improvements=feedback.get("improvements") if feedback else None,
         per_question_scores=score.per_question_scores,
+        feedback_pending=feedback_pending,
+        feedback_failed=feedback_failed,
+        message=(
+            "Your detailed feedback is still being written."
+            if feedback_pending
+            else "Your detailed feedback isn't ready yet. Check back later."
+            if feedback_failed
+            else None
+        ),
     )
 
 
@@ -64,6 +64,7 @@ class Config(BaseSettings):
     DB_SSL: Optional[str] = None
     DB_FORCE_ROLL_BACK: bool = False
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_HEALTH_CHECK_INTERVAL_S: int = 30
     ADMIN_API_KEY: Optional[str] = None
     DASHBOARD_API_KEY: Optional[str] = None
     MAX_SESSIONS_PER_DAY: int = 3
@@ -149,6 +150,14 @@ class Config(BaseSettings):
     TTS: TTSProvider = TTSProvider.DEEPGRAM
     DEEPGRAM_TTS_MODEL: str = "aura-2-andromeda-en"
     SMALLEST_TTS_MODEL: str = "lightning-v2"
+    AGENT_TTS_CACHE_DIR: str = "/tmp/valentine-hotline/tts-cache"
+    AGENT_MAX_SESSIONS_PER_WORKER: int = 4
+    AGENT_LOAD_THRESHOLD: float = 0.9
+    AGENT_BACKCHANNEL_DELAY_MS: int = 1200
+    AGENT_LLM_HEDGING: bool = False
+    AGENT_LLM_HEDGE_DELAY_MS: int = 1000
+    AGENT_SILENCE_PROMPT_MS: int = 20000
+    AGENT_SILENCE_END_MS: int = 15000
 
     # Clerk Authentication (Suitor auth)
     CLERK_JWKS_URL: str
@@ -169,6 +178,18 @@ class Config(BaseSettings):
     SMALLEST_LLM_MODEL: str = "electron-v2"
     DEEPGRAM_API_KEY: Optional[SecretStr] = None
     ANTHROPIC_API_KEY: Optional[SecretStr] = None
+    SCORING_HTTP_MAX_CONNECTIONS: int = 10
+    SCORING_HTTP_KEEPALIVE_EXPIRY_S: float = 120.0
+    SCORING_INPUT_TOKEN_BUDGET: int = 6000
+    SCORING_MAX_TURN_CHARS: int = 1200
+    SCORING_STREAM: bool = True
+    SCORING_LEASE_TTL_S: int = 360
+    SCORING_RETRY_LIMIT: int = 20
+    SCORING_RETRY_CONCURRENCY: int = 5
+    SCORING_CLAIM_TTL_S: int = 600
+    SCORING_BATCH_MIN_SESSIONS: int = 25
+    SCORING_BATCH_MAX_SESSIONS: int = 500
+    SCORING_BATCH_POLL_S: int = 60
     CALCOM_API_KEY: Optional[SecretStr] = None
     CALCOM_EVENT_TYPE_ID: Optional[str] = None
 
@@ -2,10 +2,12 @@ from dependency_injector import containers, providers
 
 from src.core.config import Config, get_config
 from src.core.database import Database
+from src.core.redis_pool import get_arq_pool
 from src.repository.booking_repository import BookingRepository
 from src.repository.conversation_turn_repository import ConversationTurnRepository
 from src.repository.heart_repository import HeartRepository
 from src.repository.score_repository import ScoreRepository
+from src.repository.scoring_cache_repository import ScoringCacheRepository
 from src.repository.screening_question_repository import ScreeningQuestionRepository
 from src.repository.session_repository import SessionRepository
 from src.repository.suitor_repository import SuitorRepository
@@ -31,6 +33,9 @@ class Container(containers.DeclarativeContainer):
 
     database = providers.Singleton(Database, config=config)
 
+    # Same instance the agent and enqueue helpers use via get_arq_pool().
+    arq_pool = providers.Singleton(get_arq_pool)
+
     user_repository = providers.Factory(
         UserRepository,
         session_factory=database.provided.session,
@@ -66,6 +71,11 @@ class Container(containers.DeclarativeContainer):
         session_factory=database.provided.session,
     )
 
+    scoring_cache_repository = providers.Factory(
+        ScoringCacheRepository,
+        session_factory=database.provided.session,
+    )
+
     booking_repository = providers.Factory(
         BookingRepository,
         session_factory=database.provided.session,
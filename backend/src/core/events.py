@@ -5,8 +5,9 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from src.core.logging_conf import configure_logging
+from src.core.redis_pool import get_arq_pool
 from src.services.calcom_service import CalcomService
-from src.services.config_loader import HeartConfigLoader
+from src.services.config_loader import heart_config_provider
 from src.services.tavus_service import TavusService
 
 logger = logging.getLogger(__name__)
@@ -21,8 +22,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         app.state.container.init_resources()
         logger.info("Container resources initialized")
 
-    loader = HeartConfigLoader()
-    loaded_config = loader.load()
+    loaded_config = heart_config_provider.get()
     logger.info(
         "Heart config loaded for '%s' (slug: %s)",
         loaded_config.profile.display_name,
@@ -31,7 +31,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     database = app.state.container.database()
     async with database.session() as db:
-        heart = await loader.seed_database(db)
+        heart = await heart_config_provider.loader.seed_database(db)
         app.state.heart_config = loaded_config
         app.state.heart_id = heart.id
         logger.info("Heart seeded in database with id=%s", heart.id)
@@ -72,10 +72,18 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             "Tavus replica not initialized. Run POST /api/v1/admin/avatar/create"
         )
 
+    # Open the shared enqueue connection now rather than on the first handoff.
+    try:
+        await get_arq_pool().ping()
+    except Exception as exc:
+        logger.warning("Redis not reachable at startup: %s", exc)
+
     logger.info("Startup event completed")
 
     yield
 
+    await get_arq_pool().close()
+
     # Shutdown container resources
     if hasattr(app.state, "container"):
         app.state.container.shutdown_resources()
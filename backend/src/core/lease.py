@@ -0,0 +1,43 @@
+"""Short-lived Redis leases for work that must not run twice at once."""
+
+from __future__ import annotations
+
+import uuid
+
+from redis.asyncio import Redis
+
+# Delete the key only if we still own it (the lease may have expired and
+# been taken by someone else in the meantime).
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisLease:
+    """`SET key token NX PX ttl` lease released by compare-and-delete.
+
+    The TTL bounds how long a crashed holder can block others, so it should
+    exceed the longest the protected work can legitimately take.
+    """
+
+    def __init__(self, redis: Redis, key: str, ttl_seconds: float):
+        self.redis = redis
+        self.key = key
+        self.ttl_ms = max(1, int(ttl_seconds * 1000))
+        self.token = uuid.uuid4().hex
+        self.held = False
+
+    async def acquire(self) -> bool:
+        self.held = bool(
+            await self.redis.set(self.key, self.token, nx=True, px=self.ttl_ms)
+        )
+        return self.held
+
+    async def release(self) -> None:
+        if not self.held:
+            return
+        self.held = False
+        await self.redis.eval(_RELEASE_SCRIPT, 1, self.key, self.token)
@@ -0,0 +1,79 @@
+"""Process-wide arq Redis pool used to enqueue background jobs."""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import Any
+
+from arq.connections import ArqRedis
+from arq.jobs import Job
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError, TimeoutError
+
+from src.core.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class ArqPool:
+    """Lazily connected arq client shared by every caller in the process.
+
+    Connections are health-checked (PING) after `health_check_interval`
+    seconds idle, and commands that hit a dropped connection reconnect and
+    retry with backoff, so callers never need to build their own pool.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        *,
+        health_check_interval: int = 30,
+        retries: int = 3,
+    ):
+        self.redis_url = redis_url
+        self.health_check_interval = health_check_interval
+        self.retries = retries
+        self._redis: ArqRedis | None = None
+        self._owned = True
+
+    @property
+    def redis(self) -> ArqRedis:
+        """The underlying client; created on first use, connects on first command."""
+        if self._redis is None:
+            self._redis = ArqRedis.from_url(
+                self.redis_url,
+                health_check_interval=self.health_check_interval,
+                socket_connect_timeout=1,
+                retry=Retry(ExponentialBackoff(cap=1.0, base=0.05), self.retries),
+                retry_on_error=[ConnectionError, TimeoutError],
+            )
+            self._owned = True
+        return self._redis
+
+    def use(self, redis: ArqRedis) -> None:
+        """Adopt an existing client (the arq worker's own) instead of opening one."""
+        self._redis = redis
+        self._owned = False
+
+    async def enqueue_job(self, function: str, *args: Any, **kwargs: Any) -> Job | None:
+        return await self.redis.enqueue_job(function, *args, **kwargs)
+
+    async def ping(self) -> bool:
+        """Health check: True when Redis answered a PING."""
+        return bool(await self.redis.ping())
+
+    async def close(self) -> None:
+        redis, owned = self._redis, self._owned
+        self._redis = None
+        if redis is not None and owned:
+            await redis.aclose()
+
+
+@lru_cache()
+def get_arq_pool() -> ArqPool:
+    return ArqPool(
+        config.REDIS_URL,
+        health_check_interval=config.REDIS_HEALTH_CHECK_INTERVAL_S,
+    )
@@ -3,6 +3,7 @@ from src.models.booking_model import BookingDb
 from src.models.conversation_turn_model import ConversationTurnDb
 from src.models.heart_model import HeartDb
 from src.models.score_model import ScoreDb
+from src.models.scoring_cache_model import ScoringCacheDb
 from src.models.screening_question_model import ScreeningQuestionDb
 from src.models.session_model import SessionDb
 from src.models.suitor_model import SuitorDb
@@ -15,6 +16,7 @@ __all__ = [
     "ConversationTurnDb",
     "HeartDb",
     "ScoreDb",
+    "ScoringCacheDb",
     "ScreeningQuestionDb",
     "SessionDb",
     "SuitorDb",
@@ -80,6 +80,18 @@ class ScoreDb(SQLModel, table=True):
     claude_output_tokens: Optional[int] = Field(
         default=None, sa_column=Column(Integer, nullable=True)
     )
+    claude_cache_read_tokens: Optional[int] = Field(
+        default=None, sa_column=Column(Integer, nullable=True)
+    )
+    claude_cache_creation_tokens: Optional[int] = Field(
+        default=None, sa_column=Column(Integer, nullable=True)
+    )
+    prompt_tokens_before: Optional[int] = Field(
+        default=None, sa_column=Column(Integer, nullable=True)
+    )
+    prompt_tokens_after: Optional[int] = Field(
+        default=None, sa_column=Column(Integer, nullable=True)
+    )
     scoring_duration_ms: Optional[int] = Field(
         default=None, sa_column=Column(Integer, nullable=True)
     )
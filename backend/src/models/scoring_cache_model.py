@@ -0,0 +1,30 @@
+"""Scoring result cache model."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import Column, DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+
+class ScoringCacheDb(SQLModel, table=True):
+    """Parsed Claude scoring result keyed by a hash of everything in the prompt."""
+
+    __tablename__ = "scoring_cache"
+
+    cache_key: str = Field(sa_column=Column(String(64), primary_key=True))
+    claude_model: str = Field(sa_column=Column(String(100), nullable=False))
+    prompt_version: str = Field(sa_column=Column(String(32), nullable=False))
+    payload: dict[str, Any] = Field(sa_column=Column(JSONB, nullable=False))
+    hits: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default="0")
+    )
+    last_hit_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
+    created_at: datetime = Field(
+        sa_column=Column(
+            DateTime(timezone=True), nullable=False, server_default=func.now()
+        )
+    )
@@ -81,6 +81,9 @@ class SessionDb(SQLModel, table=True):
     session_metadata: Optional[dict[str, Any]] = Field(
         default=None, sa_column=Column("metadata", JSONB, nullable=True)
     )
+    scoring_claimed_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
     audio_recording_url: Optional[str] = Field(
         default=None, sa_column=Column(Text, nullable=True)
     )
@@ -3,6 +3,8 @@
 import uuid
 from typing import Any, Callable
 
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import select
 
 from src.models.score_model import ScoreDb
@@ -20,6 +22,26 @@ class ScoreRepository(BaseRepository):
         score = self.model(**score_data)
         return await super().create(score)
 
+    async def bulk_create(self, scores: list[dict[str, Any]]) -> list[uuid.UUID]:
+        """Insert many scores in one statement; sessions already scored are skipped.
+
+        Every payload must carry the same keys (as `ScoringService` payloads
+        do). Returns the session ids that were actually inserted.
+        """
+        if not scores:
+            return []
+        rows = [{"id": uuid.uuid4(), **score} for score in scores]
+        async with self.session_factory() as session:
+            result = await session.execute(
+                insert(self.model)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["session_id"])
+                .returning(self.model.session_id)
+            )
+            inserted = list(result.scalars().all())
+            await session.commit()
+            return inserted
+
     async def find_by_session_id(self, session_id: uuid.UUID) -> ScoreDb | None:
         """Get score for one session."""
         async with self.session_factory() as session:
@@ -35,3 +57,27 @@ class ScoreRepository(BaseRepository):
                 select(self.model.id).where(self.model.session_id == session_id)
             )
             return result.scalar_one_or_none() is not None
+
+    async def delete_for_session(self, session_id: uuid.UUID) -> None:
+        """Remove a session's score so it can be rescored."""
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(self.model).where(self.model.session_id == session_id)
+            )
+            await session.commit()
+
+    async def update_for_session(
+        self, session_id: uuid.UUID, score_data: dict[str, Any]
+    ) -> bool:
+        """Overwrite a session's score fields; False when it has no score."""
+        fields = {k: v for k, v in score_data.items() if k != "session_id"}
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(self.model)
+                .where(self.model.session_id == session_id)
+                .values(**fields)
+                .returning(self.model.id)
+            )
+            updated = result.scalar_one_or_none() is not None
+            await session.commit()
+            return updated
@@ -0,0 +1,70 @@
+"""Repository for cached scoring results."""
+
+from typing import Any, Callable
+
+from sqlalchemy import func, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+
+from src.models.scoring_cache_model import ScoringCacheDb
+from src.repository.base_repository import BaseRepository
+
+
+class ScoringCacheRepository(BaseRepository):
+    """Content-addressed store of parsed Claude scoring payloads."""
+
+    def __init__(self, session_factory: Callable[..., Any]):
+        super().__init__(session_factory, ScoringCacheDb)
+
+    async def get(self, cache_key: str) -> dict[str, Any] | None:
+        """Return the cached payload and count the hit, in one statement."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(self.model)
+                .where(self.model.cache_key == cache_key)
+                .values(hits=self.model.hits + 1, last_hit_at=func.now())
+                .returning(self.model.payload)
+            )
+            payload = result.scalar_one_or_none()
+            await session.commit()
+            return payload
+
+    async def put(
+        self,
+        cache_key: str,
+        *,
+        claude_model: str,
+        prompt_version: str,
+        payload: dict[str, Any],
+    ) -> None:
+        """Store a payload; an existing entry for the key is kept."""
+        async with self.session_factory() as session:
+            await session.execute(
+                insert(self.model)
+                .values(
+                    cache_key=cache_key,
+                    claude_model=claude_model,
+                    prompt_version=prompt_version,
+                    payload=payload,
+                )
+                .on_conflict_do_nothing(index_elements=["cache_key"])
+            )
+            await session.commit()
+
+    async def stats(self) -> dict[str, Any]:
+        """Entries (one per paid call), total hits, and hits / lookups."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(
+                    func.count(self.model.cache_key),
+                    func.coalesce(func.sum(self.model.hits), 0),
+                )
+            )
+            entries, hits = result.first() or (0, 0)
+        entries, hits = int(entries or 0), int(hits or 0)
+        lookups = entries + hits
+        return {
+            "entries": entries,
+            "hits": hits,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+        }
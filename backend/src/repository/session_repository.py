@@ -1,13 +1,16 @@
 """Repository for interview sessions."""
 
 import uuid
+from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable
 
-from sqlalchemy import func
+from sqlalchemy import TIMESTAMP, Text, cast, exists, func, literal, or_, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import select
 
 from src.models.domain_enums import SessionStatus
+from src.models.score_model import ScoreDb
 from src.models.session_model import SessionDb
 from src.repository.base_repository import BaseRepository
 
@@ -42,6 +45,180 @@ class SessionRepository(BaseRepository):
             await session.refresh(db_obj)
             return db_obj
 
+    async def transition(
+        self,
+        session_id: uuid.UUID,
+        from_states: Iterable[SessionStatus],
+        **fields: Any,
+    ) -> SessionDb | None:
+        """Apply `fields` in one conditional UPDATE if status is in `from_states`.
+
+        Returns the updated row, or None when the session is missing or has
+        already moved to another state (so callers can treat it as lost).
+        """
+        self._check_fields(fields)
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(self.model)
+                .where(
+                    self.model.id == session_id,
+                    self.model.status.in_(list(from_states)),
+                )
+                .values(**fields)
+                .returning(self.model)
+            )
+            db_obj = result.scalars().first()
+            await session.commit()
+            return db_obj
+
+    async def transition_many(
+        self,
+        session_ids: Iterable[uuid.UUID],
+        from_states: Iterable[SessionStatus],
+        **fields: Any,
+    ) -> list[SessionDb]:
+        """`transition` for many sessions in one statement; returns the rows changed."""
+        ids = list(session_ids)
+        if not ids:
+            return []
+        self._check_fields(fields)
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(self.model)
+                .where(
+                    self.model.id.in_(ids),
+                    self.model.status.in_(list(from_states)),
+                )
+                .values(**fields)
+                .returning(self.model)
+            )
+            rows = list(result.scalars().all())
+            await session.commit()
+            return rows
+
+    def _check_fields(self, fields: dict[str, Any]) -> None:
+        # Attribute names, not column names (session_metadata maps to "metadata").
+        unknown = set(fields) - set(self.model.__mapper__.column_attrs.keys())
+        if unknown:
+            # A programming error in the caller, not bad client input (no 422).
+            raise TypeError(f"Unknown session columns: {', '.join(sorted(unknown))}")
+
+    @staticmethod
+    def metadata_patch(
+        values: dict[str, Any] | None = None, *, drop: Iterable[str] = ()
+    ):
+        """SQL expression merging top-level keys into session_metadata in place.
+
+        Unlike read-modify-write, concurrent patches to different keys both land.
+        """
+        expr = func.coalesce(SessionDb.session_metadata, cast({}, JSONB))
+        for key in drop:
+            expr = expr.op("-")(literal(key, Text))
+        if values:
+            expr = expr.op("||")(literal(values, JSONB))
+        return expr
+
+    async def claim_for_scoring(
+        self,
+        *,
+        ended_before: datetime,
+        claim_expired_before: datetime,
+        batch_expired_before: datetime,
+        limit: int,
+    ) -> list[uuid.UUID]:
+        """Stamp up to `limit` unscored sessions as claimed; returns their ids.
+
+        Candidates are locked with FOR UPDATE SKIP LOCKED, so callers racing
+        each other get disjoint sets. A claim older than `claim_expired_before`
+        counts as abandoned, and sessions owned by a scoring batch submitted
+        after `batch_expired_before` are left to that batch.
+        """
+        # Stored as an ISO-8601 string (JSON has no timestamp type); compare
+        # it as a timestamptz, not lexically.
+        batch_submitted_at = cast(
+            self.model.session_metadata["scoring_batch"]["submitted_at"].astext,
+            TIMESTAMP(timezone=True),
+        )
+        candidates = (
+            select(self.model.id)
+            .where(
+                self.model.status.in_(
+                    [
+                        SessionStatus.COMPLETED,
+                        SessionStatus.SCORING,
+                        SessionStatus.FAILED,
+                    ]
+                ),
+                ~exists().where(ScoreDb.session_id == self.model.id),
+                self.model.ended_at.is_not(None),
+                self.model.ended_at < ended_before,
+                or_(
+                    self.model.scoring_claimed_at.is_(None),
+                    self.model.scoring_claimed_at < claim_expired_before,
+                ),
+                or_(
+                    self.model.status != SessionStatus.SCORING,
+                    batch_submitted_at.is_(None),
+                    batch_submitted_at < batch_expired_before,
+                ),
+            )
+            .order_by(self.model.ended_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return await self._claim(candidates)
+
+    async def claim_missing_feedback(
+        self, *, ended_before: datetime, claim_expired_before: datetime, limit: int
+    ) -> list[uuid.UUID]:
+        """Claim sessions whose verdict was published but whose feedback never was.
+
+        Covers runs that failed or were cancelled after the early verdict
+        (`feedback_failed`) and runs that died without reaching their cleanup
+        (`feedback_pending` past the claim TTL). Locked like `claim_for_scoring`.
+        """
+        candidates = (
+            select(self.model.id)
+            .where(
+                self.model.verdict_status.in_(["feedback_pending", "feedback_failed"]),
+                self.model.ended_at.is_not(None),
+                self.model.ended_at < ended_before,
+                or_(
+                    self.model.scoring_claimed_at.is_(None),
+                    self.model.scoring_claimed_at < claim_expired_before,
+                ),
+            )
+            .order_by(self.model.ended_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return await self._claim(candidates)
+
+    async def _claim(self, candidates) -> list[uuid.UUID]:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(self.model)
+                .where(self.model.id.in_(candidates.scalar_subquery()))
+                .values(scoring_claimed_at=datetime.now(timezone.utc))
+                .returning(self.model.id)
+            )
+            claimed = list(result.scalars().all())
+            await session.commit()
+            return claimed
+
+    async def release_scoring_claims(self, session_ids: Iterable[uuid.UUID]) -> None:
+        """Drop claims so the next retry pass can pick these sessions up again."""
+        ids = list(session_ids)
+        if not ids:
+            return
+        async with self.session_factory() as session:
+            await session.execute(
+                update(self.model)
+                .where(self.model.id.in_(ids))
+                .values(scoring_claimed_at=None)
+            )
+            await session.commit()
+
     async def find_active_by_suitor_heart(
         self, suitor_id: uuid.UUID, heart_id: uuid.UUID
     ) -> SessionDb | None:
@@ -1,5 +1,7 @@
 """Schemas for admin endpoints."""
 
+from datetime import datetime
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -74,3 +76,47 @@ class CalendarStatusResponse(BaseModel):
     slot_preview: list[str] = Field(
         default_factory=list, description="Preview list of upcoming slot timestamps."
     )
+
+
+class LatencyStageReport(BaseModel):
+    """Cross-session latency aggregate for one voice pipeline stage."""
+
+    sessions: int = Field(description="Sessions that reported this stage.")
+    p50_ms: int | None = Field(
+        default=None, description="Median of per-session p50 latency (ms)."
+    )
+    p95_ms: int | None = Field(
+        default=None, description="95th percentile of per-session p95 latency (ms)."
+    )
+
+
+class SessionLatencyEntry(BaseModel):
+    """Per-session latency summary recorded by the voice agent."""
+
+    session_id: str
+    ended_at: datetime | None = None
+    turns: int = 0
+    stages: dict[str, dict[str, int | None]] = Field(default_factory=dict)
+
+
+class LatencyReportResponse(BaseModel):
+    """Voice pipeline latency report across recent sessions."""
+
+    sessions_considered: int = Field(
+        description="Recent sessions with persisted latency metrics."
+    )
+    stages: dict[str, LatencyStageReport] = Field(
+        default_factory=dict,
+        description="final_transcript | llm_first_token | tool_call | first_audio",
+    )
+    sessions: list[SessionLatencyEntry] = Field(default_factory=list)
+
+
+class ScoringCacheStatsResponse(BaseModel):
+    """Durable scoring result cache effectiveness."""
+
+    entries: int = Field(description="Cached results (one paid Claude call each).")
+    hits: int = Field(description="Scoring calls served from the cache.")
+    hit_rate: float | None = Field(
+        default=None, description="hits / (hits + entries); null when empty."
+    )
@@ -140,6 +140,17 @@ class DashboardBookingBlock(BaseModel):
     status: str
 
 
+class DashboardLatencyStage(BaseModel):
+    count: int = 0
+    p50_ms: int | None = None
+    p95_ms: int | None = None
+
+
+class DashboardSessionLatency(BaseModel):
+    turns: int = 0
+    stages: dict[str, DashboardLatencyStage] = Field(default_factory=dict)
+
+
 class DashboardSessionDetailResponse(BaseModel):
     session_id: str
     suitor: DashboardSuitorBlock
@@ -149,6 +160,7 @@ class DashboardSessionDetailResponse(BaseModel):
     verdict: Literal["date", "no_date"] | None = None
     feedback: DashboardFeedbackBlock | None = None
     booking: DashboardBookingBlock | None = None
+    latency: DashboardSessionLatency | None = None
 
 
 class DashboardHeartStatusResponse(BaseModel):
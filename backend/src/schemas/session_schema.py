@@ -62,7 +62,11 @@ class SessionStatusResponse(BaseModel):
     )
     has_verdict: bool = Field(description="Whether a final verdict exists.")
     verdict_status: str | None = Field(
-        default=None, description="Verdict pipeline status: pending, scoring, ready."
+        default=None,
+        description=(
+            "Verdict pipeline status: pending, scoring, feedback_pending, "
+            "feedback_failed, ready."
+        ),
     )
 
 
@@ -87,6 +91,14 @@ class SessionVerdictResponse(BaseModel):
     message: str | None = Field(
         default=None, description="Status message for scoring state."
     )
+    feedback_pending: bool = Field(
+        default=False,
+        description="True while the verdict is out but feedback is still being written.",
+    )
+    feedback_failed: bool = Field(
+        default=False,
+        description="True when the verdict is out but its feedback could not be written.",
+    )
     scores: dict | None = Field(
         default=None, description="Structured weighted scoring payload."
     )
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import re
+import threading
 from pathlib import Path
+from typing import Any
 
 import yaml
 from pydantic import BaseModel, Field
@@ -80,18 +83,23 @@ class HeartConfig(BaseModel):
     avatar: AvatarConfig = Field(default_factory=AvatarConfig)
 
 
+_ENV_TOKEN = re.compile(r"\$\{(\w+)\}")
+
+
 class HeartConfigLoader:
     """Loads and persists static Heart configuration."""
 
     def __init__(self, config_path: str = "config/heart_config.yaml"):
         self.config_path = config_path
         self.config: HeartConfig | None = None
+        self.env_vars: list[str] = []
 
     def _resolve_env_vars(self, value: str) -> str:
         """Replace ${ENV_VAR} tokens with values from os.environ."""
 
         def replacer(match: re.Match[str]) -> str:
             var_name = match.group(1)
+            self.env_vars.append(var_name)
             env_val = os.environ.get(var_name)
             if env_val is None:
                 raise ValueError(
@@ -99,7 +107,7 @@ class HeartConfigLoader:
                 )
             return env_val
 
-        return re.sub(r"\$\{(\w+)\}", replacer, value)
+        return _ENV_TOKEN.sub(replacer, value)
 
     def _resolve_env_recursive(self, data):
         """Recursively resolve env vars in nested YAML payloads."""
@@ -111,12 +119,16 @@ class HeartConfigLoader:
             return [self._resolve_env_recursive(item) for item in data]
         return data
 
-    def load(self) -> HeartConfig:
-        """Load, resolve env vars, and validate static Heart YAML config."""
+    def resolve_path(self) -> Path:
+        """Absolute path of the YAML file (relative paths are backend-rooted)."""
         path = Path(self.config_path)
         if not path.is_absolute():
             path = Path(__file__).resolve().parents[2] / path
+        return path
 
+    def load(self) -> HeartConfig:
+        """Load, resolve env vars, and validate static Heart YAML config."""
+        path = self.resolve_path()
         if not path.exists():
             raise FileNotFoundError(f"Heart config not found at {path}")
 
@@ -128,6 +140,7 @@ class HeartConfigLoader:
                 f"got {type(raw).__name__} ({raw!r})"
             )
 
+        self.env_vars = []
         resolved = self._resolve_env_recursive(raw)
         self.config = HeartConfig(**resolved)
         return self.config
@@ -190,3 +203,66 @@ class HeartConfigLoader:
         await db_session.commit()
         await db_session.refresh(heart)
         return heart
+
+
+def heart_scoring_payload(cfg: HeartConfig) -> dict[str, Any]:
+    """Heart section of the scoring prompt input."""
+    return {
+        "display_name": cfg.profile.display_name,
+        "bio": cfg.profile.bio,
+        "persona": cfg.persona.model_dump(),
+        "expectations": cfg.expectations.model_dump(),
+        "screening_questions": [q.model_dump() for q in cfg.screening_questions],
+    }
+
+
+class HeartConfigProvider:
+    """Process-wide cache of the validated Heart config.
+
+    Re-reads the YAML only when its mtime/size or any `${ENV_VAR}` it
+    references changes; the scoring payload is built once per load.
+    """
+
+    def __init__(self, config_path: str = "config/heart_config.yaml"):
+        self.loader = HeartConfigLoader(config_path)
+        self._key: tuple | None = None
+        self._scoring_payload: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def _cache_key(self) -> tuple:
+        stat = self.loader.resolve_path().stat()
+        env = "\0".join(
+            f"{name}={os.environ.get(name, '')}"
+            for name in sorted(set(self.loader.env_vars))
+        )
+        return (
+            stat.st_mtime_ns,
+            stat.st_size,
+            hashlib.sha256(env.encode()).hexdigest(),
+        )
+
+    def get(self) -> HeartConfig:
+        """Return the cached config, reloading it if the file or env changed."""
+        with self._lock:
+            key = self._cache_key()
+            if self.loader.config is None or key != self._key:
+                cfg = self.loader.load()
+                self._scoring_payload = heart_scoring_payload(cfg)
+                # env_vars is only known after parsing, so key again.
+                self._key = self._cache_key()
+                self.loads += 1
+            return self.loader.config
+
+    def scoring_payload(self) -> dict[str, Any]:
+        """Prebuilt scoring payload for the current config (treat as read-only)."""
+        self.get()
+        return self._scoring_payload
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._key = None
+            self.loader.config = None
+
+
+heart_config_provider = HeartConfigProvider()
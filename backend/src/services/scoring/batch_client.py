@@ -0,0 +1,55 @@
+"""Thin wrapper over the Anthropic Message Batches API used for backlog scoring."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+
+from anthropic import AsyncAnthropic
+
+logger = logging.getLogger(__name__)
+
+
+class ScoringBatchClient:
+    """Submits scoring requests as one batch and streams back the results.
+
+    Everything goes through the wrapped `AsyncAnthropic`, so tests can point
+    it at a fake server with `base_url` or an `httpx.MockTransport`.
+    """
+
+    def __init__(self, client: AsyncAnthropic):
+        self.client = client
+
+    async def submit(self, requests: dict[str, dict[str, Any]]) -> str:
+        """Create a batch from {custom_id: messages params}; returns the batch id."""
+        batch = await self.client.messages.batches.create(
+            requests=[
+                {"custom_id": custom_id, "params": params}
+                for custom_id, params in requests.items()
+            ]
+        )
+        logger.info("Submitted scoring batch %s (%s requests)", batch.id, len(requests))
+        return batch.id
+
+    async def is_done(self, batch_id: str) -> bool:
+        batch = await self.client.messages.batches.retrieve(batch_id)
+        return batch.processing_status == "ended"
+
+    async def results(
+        self, batch_id: str
+    ) -> AsyncIterator[tuple[str, Any | None, str | None]]:
+        """Yield (custom_id, message, error) for every request in an ended batch."""
+        async for entry in await self.client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == "succeeded":
+                yield entry.custom_id, result.message, None
+            elif result.type == "errored":
+                error = getattr(result.error, "error", result.error)
+                yield (
+                    entry.custom_id,
+                    None,
+                    f"errored: {getattr(error, 'message', error)}",
+                )
+            else:
+                yield entry.custom_id, None, result.type
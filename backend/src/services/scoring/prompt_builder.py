@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
 
+def compact_json(value: Any) -> str:
+    """Minified JSON without empty fields (far cheaper than a dict repr)."""
+    if isinstance(value, dict):
+        value = {k: v for k, v in value.items() if v not in (None, "", [], {})}
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
 def format_list(items: list[Any]) -> str:
     if not items:
         return "None specified"
@@ -66,12 +74,22 @@ def format_turn_analysis(turn_summaries: list[dict[str, Any]]) -> str:
     return "\n\n".join(sections)
 
 
-def build_scoring_prompt(
+# Bump whenever the prompt text or rubric changes; it is part of the
+# scoring cache key, so old cached results stop matching.
+SCORING_PROMPT_VERSION = "2"
+
+
+def build_scoring_prompt_parts(
     heart_config: dict[str, Any],
     session_data: dict[str, Any],
     turn_summaries: list[dict[str, Any]],
     transcript: list[dict[str, Any]],
-) -> str:
+) -> tuple[str, str]:
+    """Return `(static_prefix, session_suffix)`.
+
+    The prefix only depends on the heart, so it can be sent as a cached block
+    and reused across every session scored for that heart.
+    """
     display_name = heart_config.get("display_name") or heart_config.get(
         "profile", {}
     ).get("display_name", "the Heart")
@@ -82,12 +100,12 @@ def build_scoring_prompt(
     transcript_text = format_transcript(transcript)
     turn_analysis = format_turn_analysis(turn_summaries)
 
-    return f"""You are the scoring engine for Valentine Hotline, an AI-powered dating screening system.
+    static_prefix = f"""You are the scoring engine for Valentine Hotline, an AI-powered dating screening system.
 
 ## The Heart
 Name: {display_name}
 Bio: {bio}
-Persona: {persona}
+Persona: {compact_json(persona)}
 
 What {display_name} is looking for:
 {format_expectations(expectations)}
@@ -95,15 +113,6 @@ What {display_name} is looking for:
 Dealbreakers:
 {format_list(expectations.get("dealbreakers", []))}
 
-## Session metadata
-{session_data}
-
-## Full Transcript
-{transcript_text}
-
-## Per-question analysis
-{turn_analysis}
-
 ## Scoring rubric (0-100)
 1. Effort (30%)
 2. Creativity (20%)
@@ -138,3 +147,29 @@ Return ONLY valid JSON with this exact structure:
   ]
 }}
 """
+
+    session_suffix = f"""## Session metadata
+{compact_json(session_data)}
+
+## Full Transcript
+{transcript_text}
+
+## Per-question analysis
+{turn_analysis}
+"""
+    return static_prefix, session_suffix
+
+
+def build_scoring_prompt(
+    heart_config: dict[str, Any],
+    session_data: dict[str, Any],
+    turn_summaries: list[dict[str, Any]],
+    transcript: list[dict[str, Any]],
+) -> str:
+    static_prefix, session_suffix = build_scoring_prompt_parts(
+        heart_config=heart_config,
+        session_data=session_data,
+        turn_summaries=turn_summaries,
+        transcript=transcript,
+    )
+    return f"{static_prefix}\n{session_suffix}"
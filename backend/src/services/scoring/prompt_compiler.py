@@ -0,0 +1,163 @@
+"""Token-budgeted compilation of the Claude scoring prompt."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.services.scoring.prompt_builder import build_scoring_prompt_parts
+
+_CHARS_PER_TOKEN = 4
+# Enough room for feedback plus one per_question_scores entry per question.
+MAX_TOKENS_BASE = 700
+MAX_TOKENS_PER_QUESTION = 300
+MAX_TOKENS_FLOOR = 1024
+MAX_TOKENS_CAP = 4096
+# Never truncate a turn below this, however tight the budget.
+_MIN_TURN_CHARS = 160
+
+# Non-lexical fillers only: a bare "yeah" or "okay" can be a real answer.
+FILLER_WORDS = frozenset(
+    {"ah", "er", "hm", "hmm", "huh", "mhm", "mm", "mmhmm", "uh", "uhhuh", "um", "umm"}
+)
+_WORD = re.compile(r"\w+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 chars/token)."""
+    return len(text) // _CHARS_PER_TOKEN
+
+
+def _normalized(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def is_filler(text: str) -> bool:
+    """True for turns made only of filler words ("um", "uh-huh", "mm-hmm.").
+
+    Numbers, non-Latin script and emoji-only turns are answers, not filler.
+    """
+    words = _WORD.findall(text.lower().replace("-", "").replace("'", ""))
+    return bool(words) and all(word in FILLER_WORDS for word in words)
+
+
+def truncate_middle(text: str, max_chars: int) -> str:
+    """Keep the start and end of an overlong turn, eliding the middle."""
+    if len(text) <= max_chars:
+        return text
+    keep = max(1, max_chars // 2)
+    head = text[:keep].rsplit(" ", 1)[0]
+    tail = text[-keep:].split(" ", 1)[-1]
+    omitted = len(text.split()) - len(head.split()) - len(tail.split())
+    return f"{head} [... {max(omitted, 1)} words omitted ...] {tail}"
+
+
+@dataclass
+class TranscriptStats:
+    dropped_filler: int = 0
+    collapsed_repeats: int = 0
+    truncated_turns: int = 0
+
+
+def compact_transcript(
+    transcript: list[dict[str, Any]], *, max_turn_chars: int
+) -> tuple[list[dict[str, Any]], TranscriptStats]:
+    """Drop filler turns, collapse repeats, and truncate long suitor turns."""
+    stats = TranscriptStats()
+    compacted: list[dict[str, Any]] = []
+    last_key: tuple[str, str] | None = None
+    repeats = 0
+    for turn in transcript:
+        speaker = str(turn.get("speaker", "")).lower()
+        content = " ".join(str(turn.get("content") or "").split())
+        if not content:
+            continue
+        if is_filler(content):
+            stats.dropped_filler += 1
+            continue
+        key = (speaker, _normalized(content))
+        if key == last_key:
+            stats.collapsed_repeats += 1
+            repeats += 1
+            compacted[-1]["content"] = f"{compacted[-1]['base']} (said {repeats + 1}x)"
+            continue
+        last_key, repeats = key, 0
+        if speaker == "suitor" and len(content) > max_turn_chars:
+            stats.truncated_turns += 1
+            content = truncate_middle(content, max_turn_chars)
+        compacted.append({"speaker": speaker, "content": content, "base": content})
+    return [
+        {"speaker": turn["speaker"], "content": turn["content"]} for turn in compacted
+    ], stats
+
+
+def scoring_max_tokens(question_count: int) -> int:
+    """Output budget scaled to the number of per-question scores requested."""
+    wanted = MAX_TOKENS_BASE + MAX_TOKENS_PER_QUESTION * max(question_count, 1)
+    return max(MAX_TOKENS_FLOOR, min(MAX_TOKENS_CAP, wanted))
+
+
+@dataclass
+class CompiledPrompt:
+    """Prompt parts ready to send, with the token accounting behind them."""
+
+    static_prefix: str
+    session_suffix: str
+    max_tokens: int
+    tokens_before: int
+    tokens_after: int
+    stats: dict[str, int] = field(default_factory=dict)
+
+
+def compile_scoring_prompt(
+    *,
+    heart_config: dict[str, Any],
+    session_data: dict[str, Any],
+    turn_summaries: list[dict[str, Any]],
+    transcript: list[dict[str, Any]],
+    input_token_budget: int,
+    max_turn_chars: int,
+) -> CompiledPrompt:
+    """Build the scoring prompt within `input_token_budget` estimated tokens.
+
+    Compaction is lossless in spirit (filler, verbatim repeats); if the result
+    is still over budget, long suitor turns are cut harder, down to
+    `_MIN_TURN_CHARS`. `tokens_before` is the same prompt with the raw
+    transcript, i.e. what would have been sent without compilation.
+    """
+
+    def _build(turns: list[dict[str, Any]]) -> tuple[str, str]:
+        return build_scoring_prompt_parts(
+            heart_config=heart_config,
+            session_data=session_data,
+            turn_summaries=turn_summaries,
+            transcript=turns,
+        )
+
+    raw_prefix, raw_suffix = _build(transcript)
+    tokens_before = estimate_tokens(raw_prefix + raw_suffix)
+
+    turn_cap = max(max_turn_chars, _MIN_TURN_CHARS)
+    while True:
+        turns, stats = compact_transcript(transcript, max_turn_chars=turn_cap)
+        prefix, suffix = _build(turns)
+        tokens_after = estimate_tokens(prefix + suffix)
+        if tokens_after <= input_token_budget or turn_cap <= _MIN_TURN_CHARS:
+            break
+        turn_cap = max(turn_cap // 2, _MIN_TURN_CHARS)
+
+    return CompiledPrompt(
+        static_prefix=prefix,
+        session_suffix=suffix,
+        max_tokens=scoring_max_tokens(len(turn_summaries)),
+        tokens_before=tokens_before,
+        tokens_after=tokens_after,
+        stats={
+            "dropped_filler": stats.dropped_filler,
+            "collapsed_repeats": stats.collapsed_repeats,
+            "truncated_turns": stats.truncated_turns,
+            "turn_cap_chars": turn_cap,
+            "over_budget": int(tokens_after > input_token_budget),
+        },
+    )
@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
-from anthropic import AsyncAnthropic
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 
 from src.core.config import config
 from src.models.domain_enums import Verdict
-from src.services.scoring.prompt_builder import build_scoring_prompt
+from src.services.scoring.prompt_builder import SCORING_PROMPT_VERSION
+from src.services.scoring.prompt_compiler import (
+    MAX_TOKENS_CAP,
+    CompiledPrompt,
+    compile_scoring_prompt,
+)
+from src.services.scoring.stream_parser import ScoresObjectParser
+
+if TYPE_CHECKING:
+    from src.repository.scoring_cache_repository import ScoringCacheRepository
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +33,69 @@ SCORING_WEIGHTS: dict[str, float] = {
     "emotional_intelligence": 0.25,
 }
 
+PROVISIONAL_FEEDBACK = "Your detailed feedback is still being written."
+# Set once by an early-published verdict; completing its feedback (or a
+# max_tokens retry) must never change them.
+VERDICT_FIELDS = frozenset(
+    {
+        "effort_score",
+        "creativity_score",
+        "intent_clarity_score",
+        "emotional_intelligence_score",
+        "weighted_total",
+        "raw_score",
+        "final_score",
+        "verdict",
+        "verdict_threshold",
+    }
+)
+
+VerdictCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+def scoring_cache_key(
+    *,
+    model: str,
+    heart_config: dict[str, Any],
+    session_data: dict[str, Any],
+    turn_summaries: list[dict[str, Any]],
+    transcript: list[dict[str, Any]],
+) -> str:
+    """SHA-256 over everything that shapes the verdict, minus session identity.
+
+    Transcript text is whitespace-normalized and reduced to speaker + content,
+    so ids, timestamps and offsets do not defeat the cache.
+    """
+    material = {
+        "prompt_version": SCORING_PROMPT_VERSION,
+        "model": model,
+        "heart": heart_config,
+        "end_reason": session_data.get("end_reason"),
+        "turn_summaries": turn_summaries,
+        "transcript": [
+            [
+                str(entry.get("speaker") or ""),
+                " ".join(str(entry.get("content") or "").split()),
+            ]
+            for entry in transcript
+        ],
+    }
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
 
 class ScoringService:
     """Scores completed interviews with Claude and normalizes output."""
 
-    def __init__(self) -> None:
+    cache: ScoringCacheRepository | None = None
+    cache_hits = 0
+    cache_misses = 0
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        cache: ScoringCacheRepository | None = None,
+    ) -> None:
         api_key = (
             config.ANTHROPIC_API_KEY.get_secret_value()
             if config.ANTHROPIC_API_KEY is not None
@@ -35,8 +104,78 @@ class ScoringService:
         if not api_key or not api_key.strip():
             raise RuntimeError("ANTHROPIC_API_KEY is missing or empty")
 
-        self.client = AsyncAnthropic(api_key=api_key.strip())
+        self.client = AsyncAnthropic(api_key=api_key.strip(), http_client=http_client)
         self.model = "claude-sonnet-4-20250514"
+        self.cache = cache
+
+    @property
+    def cache_hit_rate(self) -> float | None:
+        """Hits / lookups served by this instance (None before any lookup)."""
+        lookups = self.cache_hits + self.cache_misses
+        return round(self.cache_hits / lookups, 4) if lookups else None
+
+    @classmethod
+    def pooled(cls, cache: ScoringCacheRepository | None = None) -> ScoringService:
+        """Service with a keep-alive pool sized for a worker's concurrent jobs."""
+        return cls(
+            cache=cache,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=config.SCORING_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=config.SCORING_HTTP_MAX_CONNECTIONS,
+                    keepalive_expiry=config.SCORING_HTTP_KEEPALIVE_EXPIRY_S,
+                ),
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP pool."""
+        await self.client.close()
+
+    def compile_prompt(
+        self,
+        *,
+        heart_config: dict[str, Any],
+        session_data: dict[str, Any],
+        turn_summaries: list[dict[str, Any]],
+        transcript: list[dict[str, Any]],
+    ) -> CompiledPrompt:
+        """Scoring prompt fitted to SCORING_INPUT_TOKEN_BUDGET."""
+        return compile_scoring_prompt(
+            heart_config=heart_config,
+            session_data=session_data,
+            turn_summaries=turn_summaries,
+            transcript=transcript,
+            input_token_budget=config.SCORING_INPUT_TOKEN_BUDGET,
+            max_turn_chars=config.SCORING_MAX_TURN_CHARS,
+        )
+
+    def build_request(self, **inputs: Any) -> dict[str, Any]:
+        """Messages API parameters for one session (shared by the batch path)."""
+        return self._request_params(self.compile_prompt(**inputs))
+
+    def _request_params(
+        self, prompt: CompiledPrompt, max_tokens: int | None = None
+    ) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens or prompt.max_tokens,
+            "temperature": 0.3,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        # Heart + rubric prefix is identical across sessions.
+                        {
+                            "type": "text",
+                            "text": prompt.static_prefix,
+                            "cache_control": {"type": "ephemeral"},
+                        },
+                        {"type": "text", "text": prompt.session_suffix},
+                    ],
+                }
+            ],
+        }
 
     async def score_session(
         self,
@@ -45,28 +184,189 @@ class ScoringService:
         session_data: dict[str, Any],
         turn_summaries: list[dict[str, Any]],
         transcript: list[dict[str, Any]],
+        use_cache: bool = True,
+        on_verdict: VerdictCallback | None = None,
     ) -> dict[str, Any]:
-        """Return normalized score payload ready for the scores table."""
-        prompt = build_scoring_prompt(
+        """Return normalized score payload ready for the scores table.
+
+        With a cache attached, identical inputs are served from the scoring
+        cache (zero tokens) instead of calling Claude again. `use_cache=False`
+        (explicit rescores) skips the cache entirely.
+
+        With `on_verdict` (and SCORING_STREAM on), the response is streamed and
+        `on_verdict` is awaited with a `provisional_payload` as soon as the
+        `scores` object is complete, before Claude has written the feedback.
+        It is not called on a cache hit or if the scores never parse.
+        """
+        cache_key = None
+        if self.cache is not None and use_cache:
+            started = time.monotonic()
+            cache_key = scoring_cache_key(
+                model=self.model,
+                heart_config=heart_config,
+                session_data=session_data,
+                turn_summaries=turn_summaries,
+                transcript=transcript,
+            )
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                self.cache_hits += 1
+                logger.info(
+                    "Scoring cache hit %s (hit_rate=%s)",
+                    cache_key[:12],
+                    self.cache_hit_rate,
+                )
+                return {
+                    **cached,
+                    # Category scores are what the inputs determine; the
+                    # verdict follows the current VERDICT_THRESHOLD.
+                    **self.verdict_fields(
+                        {
+                            category: cached[f"{category}_score"]
+                            for category in SCORING_WEIGHTS
+                        }
+                    ),
+                    "claude_input_tokens": 0,
+                    "claude_output_tokens": 0,
+                    "claude_cache_read_tokens": 0,
+                    "claude_cache_creation_tokens": 0,
+                    "scoring_duration_ms": int((time.monotonic() - started) * 1000),
+                }
+            self.cache_misses += 1
+
+        prompt = self.compile_prompt(
             heart_config=heart_config,
             session_data=session_data,
             turn_summaries=turn_summaries,
             transcript=transcript,
         )
-
-        started = time.monotonic()
-        response = await self.client.messages.create(
-            model=self.model,
-            max_tokens=4096,
-            temperature=0.3,
-            messages=[{"role": "user", "content": prompt}],
+        logger.info(
+            "Scoring prompt compiled: tokens %s -> %s, max_tokens=%s, %s",
+            prompt.tokens_before,
+            prompt.tokens_after,
+            prompt.max_tokens,
+            prompt.stats,
         )
+        started = time.monotonic()
+        if on_verdict is not None and config.SCORING_STREAM:
+            response = await self._stream_message(
+                self._request_params(prompt), on_verdict
+            )
+        else:
+            response = await self.client.messages.create(**self._request_params(prompt))
+        if (
+            getattr(response, "stop_reason", None) == "max_tokens"
+            and prompt.max_tokens < MAX_TOKENS_CAP
+        ):
+            # The scaled output budget was too tight; one retry at the cap.
+            logger.warning("Scoring output hit max_tokens=%s", prompt.max_tokens)
+            response = await self.client.messages.create(
+                **self._request_params(prompt, max_tokens=MAX_TOKENS_CAP)
+            )
         scoring_duration_ms = int((time.monotonic() - started) * 1000)
+        payload = self.normalize_response(
+            response, scoring_duration_ms=scoring_duration_ms, prompt=prompt
+        )
+        if cache_key is not None:
+            await self._cache_put(cache_key, payload)
+        return payload
+
+    async def _stream_message(
+        self, params: dict[str, Any], on_verdict: VerdictCallback
+    ) -> Any:
+        parser = ScoresObjectParser()
+        async with self.client.messages.stream(**params) as stream:
+            async for text in stream.text_stream:
+                category_scores = parser.feed(text)
+                if category_scores is None:
+                    continue
+                try:
+                    await on_verdict(self.provisional_payload(category_scores))
+                except Exception as exc:
+                    # The full score is still written once the stream ends.
+                    logger.warning("Publishing early verdict failed: %s", exc)
+            return await stream.get_final_message()
+
+    async def _cache_get(self, cache_key: str) -> dict[str, Any] | None:
+        try:
+            return await self.cache.get(cache_key)
+        except Exception as exc:
+            # A cache outage must never block scoring.
+            logger.warning("Scoring cache lookup failed: %s", exc)
+            return None
+
+    async def _cache_put(self, cache_key: str, payload: dict[str, Any]) -> None:
+        try:
+            await self.cache.put(
+                cache_key,
+                claude_model=self.model,
+                prompt_version=SCORING_PROMPT_VERSION,
+                payload={**payload, "verdict": Verdict(payload["verdict"]).value},
+            )
+        except Exception as exc:
+            logger.warning("Scoring cache write failed: %s", exc)
+
+    def normalize_response(
+        self,
+        response: Any,
+        *,
+        scoring_duration_ms: int | None,
+        prompt: CompiledPrompt | None = None,
+    ) -> dict[str, Any]:
+        """Turn a Claude scoring message into a scores-table payload."""
+        usage = response.usage
+        cache_read_tokens = getattr(usage, "cache_read_input_tokens", None)
+        cache_creation_tokens = getattr(usage, "cache_creation_input_tokens", None)
+        logger.info(
+            "Scoring prompt cache: read=%s created=%s uncached_input=%s",
+            cache_read_tokens,
+            cache_creation_tokens,
+            getattr(usage, "input_tokens", None),
+        )
 
         response_text = self._extract_text(response)
         result = self._parse_json(response_text)
 
         category_scores = result.get("scores") or result.get("category_scores", {})
+        scores = self.verdict_fields(category_scores)
+
+        feedback = result.get("feedback", {})
+        feedback_summary = str(feedback.get("summary") or "")
+        if not feedback_summary:
+            feedback_summary = "Interview scored successfully."
+        feedback_json = {
+            "summary": feedback_summary,
+            "strengths": self._as_list(feedback.get("strengths")),
+            "improvements": self._as_list(feedback.get("improvements")),
+            "favorite_moment": str(feedback.get("favorite_moment") or ""),
+        }
+
+        return {
+            **scores,
+            "feedback_text": feedback_summary,
+            "feedback_summary": feedback_summary,
+            "feedback_strengths": feedback_json["strengths"],
+            "feedback_improvements": feedback_json["improvements"],
+            "feedback_json": feedback_json,
+            "feedback_heart_note": (
+                str(feedback.get("heart_note"))
+                if feedback.get("heart_note") is not None
+                else None
+            ),
+            "per_question_scores": result.get("per_question_scores", []),
+            "claude_model": self.model,
+            "claude_input_tokens": getattr(usage, "input_tokens", None),
+            "claude_output_tokens": getattr(usage, "output_tokens", None),
+            "claude_cache_read_tokens": cache_read_tokens,
+            "claude_cache_creation_tokens": cache_creation_tokens,
+            "prompt_tokens_before": prompt.tokens_before if prompt else None,
+            "prompt_tokens_after": prompt.tokens_after if prompt else None,
+            "scoring_duration_ms": scoring_duration_ms,
+            "raw_llm_response": response_text,
+        }
+
+    def verdict_fields(self, category_scores: dict[str, Any]) -> dict[str, Any]:
+        """Category scores clamped, weighted, and compared to the threshold."""
         effort = self._clamp(category_scores.get("effort", 50), 0, 100)
         creativity = self._clamp(category_scores.get("creativity", 50), 0, 100)
         intent_clarity = self._clamp(category_scores.get("intent_clarity", 50), 0, 100)
@@ -85,17 +385,6 @@ class ScoringService:
         verdict_threshold = float(config.VERDICT_THRESHOLD)
         verdict = Verdict.DATE if final_score >= verdict_threshold else Verdict.NO_DATE
 
-        feedback = result.get("feedback", {})
-        feedback_summary = str(feedback.get("summary") or "")
-        if not feedback_summary:
-            feedback_summary = "Interview scored successfully."
-        feedback_json = {
-            "summary": feedback_summary,
-            "strengths": self._as_list(feedback.get("strengths")),
-            "improvements": self._as_list(feedback.get("improvements")),
-            "favorite_moment": str(feedback.get("favorite_moment") or ""),
-        }
-
         return {
             "effort_score": float(effort),
             "creativity_score": float(creativity),
@@ -106,22 +395,25 @@ class ScoringService:
             "final_score": round(final_score, 2),
             "verdict": verdict,
             "verdict_threshold": verdict_threshold,
-            "feedback_text": feedback_summary,
-            "feedback_summary": feedback_summary,
-            "feedback_strengths": feedback_json["strengths"],
-            "feedback_improvements": feedback_json["improvements"],
-            "feedback_json": feedback_json,
-            "feedback_heart_note": (
-                str(feedback.get("heart_note"))
-                if feedback.get("heart_note") is not None
-                else None
-            ),
-            "per_question_scores": result.get("per_question_scores", []),
+        }
+
+    def provisional_payload(self, category_scores: dict[str, Any]) -> dict[str, Any]:
+        """Scores-table payload for a verdict whose feedback is still streaming."""
+        return {
+            **self.verdict_fields(category_scores),
+            "feedback_text": PROVISIONAL_FEEDBACK,
+            "feedback_summary": PROVISIONAL_FEEDBACK,
+            "feedback_strengths": [],
+            "feedback_improvements": [],
+            "feedback_json": {
+                "summary": PROVISIONAL_FEEDBACK,
+                "strengths": [],
+                "improvements": [],
+                "favorite_moment": "",
+            },
+            "feedback_heart_note": None,
+            "per_question_scores": [],
             "claude_model": self.model,
-            "claude_input_tokens": getattr(response.usage, "input_tokens", None),
-            "claude_output_tokens": getattr(response.usage, "output_tokens", None),
-            "scoring_duration_ms": scoring_duration_ms,
-            "raw_llm_response": response_text,
         }
 
     def _extract_text(self, response: Any) -> str:
@@ -170,3 +462,52 @@ class ScoringService:
         except (TypeError, ValueError):
             numeric = min_value
         return max(min_value, min(max_value, numeric))
+
+
+def feedback_fields(payload: dict[str, Any]) -> dict[str, Any]:
+    """A full score payload minus its verdict, to complete a provisional score."""
+    return {key: value for key, value in payload.items() if key not in VERDICT_FIELDS}
+
+
+def is_provisional(score: Any) -> bool:
+    """True for a score row published early whose feedback was never written."""
+    return getattr(score, "feedback_summary", None) == PROVISIONAL_FEEDBACK
+
+
+def silent_session_score() -> dict[str, Any]:
+    """Fixed no-date score for a session the suitor never spoke in (no Claude call)."""
+    summary = "The suitor did not answer any questions, so there was nothing to score."
+    return {
+        "effort_score": 0.0,
+        "creativity_score": 0.0,
+        "intent_clarity_score": 0.0,
+        "emotional_intelligence_score": 0.0,
+        "weighted_total": 0.0,
+        "raw_score": 0.0,
+        "final_score": 0.0,
+        "verdict": Verdict.NO_DATE,
+        "verdict_threshold": float(config.VERDICT_THRESHOLD),
+        "feedback_text": summary,
+        "feedback_summary": summary,
+        "feedback_strengths": [],
+        "feedback_improvements": [
+            "Answer the questions so there is something to go on."
+        ],
+        "feedback_json": {
+            "summary": summary,
+            "strengths": [],
+            "improvements": ["Answer the questions so there is something to go on."],
+            "favorite_moment": "",
+        },
+        "feedback_heart_note": None,
+        "per_question_scores": [],
+        "claude_model": "none",
+        "claude_input_tokens": 0,
+        "claude_output_tokens": 0,
+        "claude_cache_read_tokens": 0,
+        "claude_cache_creation_tokens": 0,
+        "prompt_tokens_before": 0,
+        "prompt_tokens_after": 0,
+        "scoring_duration_ms": 0,
+        "raw_llm_response": None,
+    }
@@ -0,0 +1,83 @@
+"""Incremental JSON scanning for streamed Claude scoring output."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+SCORES_KEYS = ("scores", "category_scores")
+
+
+class ScoresObjectParser:
+    """Spots the top-level `scores` object in a JSON stream as soon as it closes.
+
+    Feed text deltas as they arrive; `feed` returns the parsed object exactly
+    once, the moment its closing brace is seen, without waiting for (or
+    needing) the rest of the document. Leading prose or a ```json fence
+    before the first `{` is ignored.
+    """
+
+    def __init__(self, keys: tuple[str, ...] = SCORES_KEYS):
+        self.keys = keys
+        self.buffer = ""
+        self.result: dict[str, Any] | None = None
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_key: str | None = None
+        self._object_start = -1
+        self._done = False
+
+    def feed(self, text: str) -> dict[str, Any] | None:
+        if self._done:
+            return None
+        self.buffer += text
+        while self._pos < len(self.buffer):
+            index = self._pos
+            char = self.buffer[index]
+            self._pos += 1
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_key = json.loads(
+                            self.buffer[self._string_start : index + 1]
+                        )
+                continue
+            if char == '"':
+                if self._depth >= 1:
+                    self._in_string = True
+                    self._string_start = index
+            elif char in "{[":
+                self._depth += 1
+                if (
+                    char == "{"
+                    and self._depth == 2
+                    and self._last_key in self.keys
+                    and self._object_start < 0
+                ):
+                    self._object_start = index
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 1 and self._object_start >= 0:
+                    return self._finish(index)
+            elif char == "," and self._depth == 1:
+                self._last_key = None
+        return None
+
+    def _finish(self, end: int) -> dict[str, Any] | None:
+        self._done = True
+        try:
+            parsed = json.loads(self.buffer[self._object_start : end + 1])
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(parsed, dict):
+            return None
+        self.result = parsed
+        return parsed
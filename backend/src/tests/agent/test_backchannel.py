@@ -0,0 +1,78 @@
+"""Unit tests for the backchannel filler."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from agent.backchannel import BackchannelFiller
+
+
+async def _frames(items, delay: float = 0.0):
+    if delay:
+        await asyncio.sleep(delay)
+    for item in items:
+        yield item
+
+
+async def _collect(stream) -> list:
+    return [frame async for frame in stream]
+
+
+async def test_filler_leads_a_late_reply_in_the_same_stream():
+    filler = BackchannelFiller(
+        lambda text: _frames([f"{text}#1", f"{text}#2"]),
+        delay_seconds=0.02,
+        phrases=("Mm-hm.",),
+    )
+    filler.on_user_stopped()
+
+    out = await _collect(filler.cover(_frames(["reply"], delay=0.08)))
+
+    assert out == ["Mm-hm.#1", "Mm-hm.#2", "reply"]
+    assert filler.snapshot()["fire_rate"] == 1.0
+
+
+async def test_reply_in_time_plays_without_filler():
+    filler = BackchannelFiller(lambda text: _frames([text]), delay_seconds=0.2)
+    filler.on_user_stopped()
+
+    out = await _collect(filler.cover(_frames(["a", "b"])))
+
+    assert out == ["a", "b"]
+    assert filler.snapshot()["armed"] == 1
+    assert filler.snapshot()["fired"] == 0
+
+
+async def test_delay_counts_from_user_stop_and_uncached_is_counted():
+    filler = BackchannelFiller(lambda text: None, delay_seconds=0.5)
+    filler.on_user_stopped(now=time.monotonic() - 1.0)
+
+    out = await _collect(filler.cover(_frames(["reply"], delay=0.01)))
+
+    assert out == ["reply"]
+    assert filler.fired == 0
+    assert filler.uncached == 1
+
+
+async def test_only_the_first_reply_after_the_suitor_stops_is_covered():
+    filler = BackchannelFiller(lambda text: _frames([text]), delay_seconds=0.01)
+    filler.on_user_stopped()
+    await _collect(filler.cover(_frames(["ack"], delay=0.03)))
+
+    out = await _collect(filler.cover(_frames(["question"], delay=0.03)))
+
+    assert out == ["question"]
+    assert filler.armed == 1
+
+
+async def test_suitor_resuming_or_disabled_filler_never_arms():
+    filler = BackchannelFiller(lambda text: _frames([text]), delay_seconds=0.01)
+    filler.on_user_stopped()
+    filler.cancel()
+    assert await _collect(filler.cover(_frames(["r"], delay=0.03))) == ["r"]
+
+    disabled = BackchannelFiller(lambda text: _frames([text]), delay_seconds=0)
+    disabled.on_user_stopped()
+    assert await _collect(disabled.cover(_frames(["r"], delay=0.03))) == ["r"]
+    assert filler.armed == 0 and disabled.armed == 0
@@ -0,0 +1,79 @@
+"""Unit tests for rolling chat-context compaction."""
+
+from __future__ import annotations
+
+from livekit.agents import llm
+
+from agent.context_compaction import compact_items, estimate_tokens
+from agent.interview_agent import InterviewAgent
+from agent.session_manager import SessionManager
+
+
+def _interview_ctx() -> llm.ChatContext:
+    ctx = llm.ChatContext()
+    ctx.add_message(role="system", content="You are Luna's AI twin.")
+    ctx.add_message(role="assistant", content="Hey! What made you click the link?")
+    ctx.add_message(role="user", content="Curiosity, honestly. " * 40)
+    for call_id, index, question in (("c1", 0, "Q2"), ("c2", 1, "Q3")):
+        ctx.items.append(
+            llm.FunctionCall(
+                call_id=call_id,
+                name="record_and_get_next",
+                arguments=f'{{"question_index": {index}, "response_summary": "s"}}',
+            )
+        )
+        ctx.items.append(
+            llm.FunctionCallOutput(
+                call_id=call_id,
+                name="record_and_get_next",
+                output=f"Response recorded. Ask this question next: {question}",
+                is_error=False,
+            )
+        )
+        ctx.add_message(role="assistant", content=f"{question}?")
+        ctx.add_message(role="user", content="A long rambling answer. " * 40)
+    return ctx
+
+
+def _manager() -> SessionManager:
+    mgr = SessionManager("s1", [{"text": "Q1"}, {"text": "Q2"}, {"text": "Q3"}])
+    mgr.record_response(0, "Came out of curiosity", "good")
+    mgr.record_response(1, "Picnic under the stars", "great")
+    return mgr
+
+
+def test_compaction_keeps_system_summary_and_live_question():
+    ctx = _interview_ctx()
+    items = compact_items(
+        ctx.items,
+        _manager().turns,
+        lambda text: llm.ChatMessage(role="system", content=[text]),
+    )
+
+    assert items is not None
+    assert items[0].text_content == "You are Luna's AI twin."
+    assert "Q2 (great): Picnic under the stars" in items[1].text_content
+    assert [item.type for item in items[2:4]] == [
+        "function_call",
+        "function_call_output",
+    ]
+    assert items[2].call_id == "c2"
+    assert "Q3" in items[3].output
+    assert estimate_tokens(items) < estimate_tokens(ctx.items)
+
+
+def test_nothing_to_compact_before_first_recording():
+    ctx = llm.ChatContext()
+    ctx.add_message(role="system", content="prompt")
+    ctx.add_message(role="user", content="hi")
+    assert compact_items(ctx.items, _manager().turns, lambda text: text) is None
+
+
+def test_agent_reports_context_tokens_per_request():
+    agent = InterviewAgent(instructions="x", session_manager=_manager())
+    compacted = agent.compact_chat_ctx(_interview_ctx())
+
+    snapshot = agent.context_snapshot()
+    assert snapshot["requests"] == 1
+    assert snapshot["sent_tokens"] < snapshot["raw_tokens"]
+    assert len(compacted.items) == 6
@@ -0,0 +1,26 @@
+"""Unit tests for the agent process's database bridge."""
+
+from __future__ import annotations
+
+import uuid
+
+from agent import db
+from src.models.domain_enums import SessionStatus
+
+
+async def test_in_progress_is_a_conditional_transition_from_pending(monkeypatch):
+    calls: list[tuple] = []
+
+    async def transition(self, session_id, from_states, **fields):
+        calls.append((session_id, set(from_states), fields))
+        return None
+
+    monkeypatch.setattr(db.SessionRepository, "transition", transition)
+    session_id = uuid.uuid4()
+
+    assert await db.mark_session_in_progress(str(session_id)) is False
+    [(called_id, from_states, fields)] = calls
+    assert called_id == session_id
+    assert from_states == {SessionStatus.PENDING}
+    assert fields["status"] == SessionStatus.IN_PROGRESS
+    assert fields["started_at"] is not None
@@ -0,0 +1,77 @@
+"""Unit tests for adaptive endpointing delays."""
+
+from __future__ import annotations
+
+from agent.endpointing import AdaptiveEndpointing, EndpointingBounds
+
+
+def _turn(controller: AdaptiveEndpointing, start: float, words: int, secs: float):
+    controller.on_user_speech(words // 2, now=start)
+    controller.on_user_speech(words, now=start + secs)
+    return controller.on_agent_speaking(now=start + secs + 0.8)
+
+
+def test_fast_talker_gets_shorter_delays():
+    controller = AdaptiveEndpointing(min_delay=0.5, max_delay=3.0)
+    for i in range(3):
+        _turn(controller, start=i * 30.0, words=40, secs=10.0)
+
+    min_delay, max_delay = controller.delays()
+    assert min_delay < 0.5
+    assert max_delay < 3.0
+
+
+def test_slow_talker_gets_longer_delays_within_bounds():
+    bounds = EndpointingBounds(max_delay_ceiling=3.5)
+    controller = AdaptiveEndpointing(min_delay=0.5, max_delay=3.0, bounds=bounds)
+    for i in range(10):
+        _turn(controller, start=i * 30.0, words=10, secs=10.0)
+
+    min_delay, max_delay = controller.delays()
+    assert min_delay > 0.5
+    assert max_delay == 3.5
+
+
+def test_cutoff_raises_delays_and_is_counted():
+    controller = AdaptiveEndpointing(min_delay=0.5, max_delay=3.0)
+    controller.on_user_speech(5, now=0.0)
+    controller.on_agent_speaking(now=1.0)
+    controller.on_user_speech(9, now=1.5)
+
+    snapshot = controller.snapshot()
+    assert snapshot["cutoffs"] == 1
+    assert snapshot["min_endpointing_delay"] > 0.5
+    assert snapshot["response_latency_avg_s"] == 1.0
+
+
+def test_late_final_for_speech_before_the_reply_is_not_a_cutoff():
+    controller = AdaptiveEndpointing(min_delay=0.5, max_delay=3.0)
+    controller.on_user_speech(5, now=0.0, spoken_at=0.0)
+    controller.on_agent_speaking(now=1.0)
+    # STT final lands after the reply started, for speech that began at 0.2s.
+    controller.on_user_speech(9, now=1.3, spoken_at=0.2)
+
+    assert controller.snapshot()["cutoffs"] == 0
+    assert controller.delays() == (0.5, 3.0)
+
+    # Speech that actually starts just after the reply began is a cut-off.
+    controller.on_user_speech(3, now=2.6, spoken_at=1.4)
+    assert controller.snapshot()["cutoffs"] == 1
+
+
+def test_single_final_rate_is_measured_from_speech_start():
+    controller = AdaptiveEndpointing()
+    controller.on_user_speech(10, now=4.0, spoken_at=0.0)
+
+    assert controller.words_per_second == 2.5
+
+
+def test_rate_over_several_finals_uses_the_whole_speech_duration():
+    controller = AdaptiveEndpointing(min_delay=0.5, max_delay=3.0)
+    controller.on_user_speech(10, now=4.0, spoken_at=0.0)
+    controller.on_user_speech(20, now=8.0, spoken_at=4.2)
+    controller.on_agent_speaking(now=8.8)
+
+    assert controller.words_per_second == 2.5
+    # A normal speaker keeps the default delays.
+    assert controller.delays() == (0.5, 3.0)
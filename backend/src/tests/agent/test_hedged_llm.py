@@ -0,0 +1,215 @@
+"""Unit tests for hedged LLM streaming."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from agent.hedged_llm import HedgeDelay, HedgeStats, hedged_stream
+
+
+class _FakeStream:
+    def __init__(self, chunks, *, first_delay: float, fail: bool = False):
+        self.chunks = chunks
+        self.first_delay = first_delay
+        self.fail = fail
+        self.closed = False
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        await asyncio.sleep(self.first_delay)
+        if self.fail:
+            raise RuntimeError("provider down")
+        for chunk in self.chunks:
+            yield chunk
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _candidates(*streams):
+    return [(f"p{i}", (lambda s=s: s)) for i, s in enumerate(streams)]
+
+
+async def _collect(candidates, delay, stats):
+    return [
+        chunk async for chunk in hedged_stream(candidates, delay=delay, stats=stats)
+    ]
+
+
+async def test_fast_primary_never_starts_secondary():
+    primary = _FakeStream(["a", "b"], first_delay=0.0)
+    secondary = _FakeStream(["x"], first_delay=0.0)
+    stats = HedgeStats(("p0", "p1"))
+
+    chunks = await _collect(_candidates(primary, secondary), HedgeDelay(0.05), stats)
+
+    assert chunks == ["a", "b"]
+    assert stats.hedged == 0
+    assert stats.snapshot()["providers"]["p0"]["win_rate"] == 1.0
+
+
+async def test_slow_primary_is_hedged_and_loser_closed():
+    primary = _FakeStream(["a"], first_delay=0.5)
+    secondary = _FakeStream(["x", "y"], first_delay=0.0)
+    stats = HedgeStats(("p0", "p1"))
+
+    chunks = await _collect(_candidates(primary, secondary), HedgeDelay(0.02), stats)
+
+    assert chunks == ["x", "y"]
+    assert stats.hedged == 1
+    assert primary.closed
+    assert stats.snapshot()["providers"]["p1"]["wins"] == 1
+
+
+async def test_primary_failure_falls_back_without_waiting_for_delay():
+    primary = _FakeStream(["a"], first_delay=0.0, fail=True)
+    secondary = _FakeStream(["x"], first_delay=0.0)
+    stats = HedgeStats(("p0", "p1"))
+
+    chunks = await _collect(_candidates(primary, secondary), HedgeDelay(5.0), stats)
+
+    assert chunks == ["x"]
+    assert stats.failures["p0"] == 1
+
+
+async def test_all_candidates_failing_raises():
+    stats = HedgeStats(("p0", "p1"))
+    streams = _candidates(
+        _FakeStream([], first_delay=0.0, fail=True),
+        _FakeStream([], first_delay=0.0, fail=True),
+    )
+    with pytest.raises(RuntimeError):
+        await _collect(streams, HedgeDelay(0.01), stats)
+
+
+def test_hedge_delay_tracks_primary_p95_within_bounds():
+    delay = HedgeDelay(1.0, floor=0.3, ceiling=2.0, min_samples=3)
+    delay.observe(0.4)
+    delay.observe(0.5)
+    assert delay.current() == 1.0
+    delay.observe(0.6)
+    assert delay.current() == 0.6
+    for _ in range(20):
+        delay.observe(9.0)
+    assert delay.current() == 2.0
+
+
+async def test_hedge_wins_do_not_feed_the_delay():
+    delay = HedgeDelay(0.02, min_samples=1)
+    stats = HedgeStats(("p0", "p1"))
+
+    await _collect(
+        _candidates(
+            _FakeStream(["a"], first_delay=0.5), _FakeStream(["x"], first_delay=0.0)
+        ),
+        delay,
+        stats,
+    )
+    assert delay.current() == 0.02
+
+    await _collect(
+        _candidates(
+            _FakeStream(["a"], first_delay=0.0), _FakeStream(["x"], first_delay=0.0)
+        ),
+        delay,
+        stats,
+    )
+    assert delay.current() == delay.floor
+
+
+async def test_winner_is_reported_before_the_loser_is_closed():
+    primary = _FakeStream(["a"], first_delay=0.5)
+    seen: list[tuple[str, bool]] = []
+
+    chunks = [
+        chunk
+        async for chunk in hedged_stream(
+            _candidates(primary, _FakeStream(["x"], first_delay=0.0)),
+            delay=HedgeDelay(0.02),
+            stats=HedgeStats(("p0", "p1")),
+            on_winner=lambda label: seen.append((label, primary.closed)),
+        )
+    ]
+
+    assert chunks == ["x"]
+    assert seen == [("p1", False)]
+
+
+class _ProviderStream(_FakeStream):
+    """Reports metrics from its own task once finished or closed, like LiveKit's."""
+
+    def __init__(self, chunks, *, first_delay: float, report):
+        super().__init__(chunks, first_delay=first_delay)
+        self._finished = asyncio.Event()
+        self._reporter = asyncio.create_task(self._report(report))
+
+    async def _report(self, report):
+        await self._finished.wait()
+        report()
+
+    async def _iter(self):
+        try:
+            async for chunk in super()._iter():
+                yield chunk
+        finally:
+            self._finished.set()
+
+    async def aclose(self):
+        await super().aclose()
+        self._finished.set()
+        await self._reporter
+
+
+class _FakeProvider:
+    def __init__(self, name: str, first_delay: float):
+        from livekit import rtc
+
+        self.name = name
+        self.first_delay = first_delay
+        self.model = self.provider = name
+        self._events = rtc.EventEmitter()
+        self.on = self._events.on
+        self.off = self._events.off
+
+    def chat(self, **kwargs):
+        from livekit.agents import llm as lk_llm
+
+        chunk = lk_llm.ChatChunk(
+            id=self.name, delta=lk_llm.ChoiceDelta(role="assistant", content="hi")
+        )
+        return _ProviderStream(
+            [chunk],
+            first_delay=self.first_delay,
+            report=lambda: self._events.emit("metrics_collected", self.name),
+        )
+
+    async def aclose(self):
+        pass
+
+
+async def test_hedged_llm_forwards_only_the_winners_metrics():
+    from agent.hedged_llm import HedgedLLM
+
+    if HedgedLLM is None:
+        pytest.skip("livekit-agents not installed")
+    from livekit.agents import llm as lk_llm
+
+    hedged = HedgedLLM(
+        _FakeProvider("slow", first_delay=0.5),
+        _FakeProvider("fast", first_delay=0.0),
+        labels=("slow", "fast"),
+        delay=HedgeDelay(0.02),
+    )
+    forwarded: list[str] = []
+    hedged.on("metrics_collected", forwarded.append)
+
+    async with hedged.chat(chat_ctx=lk_llm.ChatContext.empty()) as stream:
+        chunks = [chunk.id async for chunk in stream]
+    await asyncio.sleep(0.01)
+
+    assert chunks == ["fast"]
+    assert forwarded == ["fast"]
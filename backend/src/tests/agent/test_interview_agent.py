@@ -0,0 +1,75 @@
+"""Unit tests for InterviewAgent function tools."""
+
+from __future__ import annotations
+
+from agent.interview_agent import InterviewAgent
+from agent.session_manager import SessionManager
+
+
+def _agent() -> tuple[InterviewAgent, SessionManager]:
+    mgr = SessionManager("s1", [{"text": "Q1"}, {"text": "Q2"}, {"text": "Q3"}])
+    return InterviewAgent(instructions="x", session_manager=mgr), mgr
+
+
+async def test_record_and_get_next_records_and_returns_next_question():
+    agent, mgr = _agent()
+    await agent.get_next_question(None)
+
+    result = await agent.record_and_get_next(None, 0, "Likes hiking", "good")
+
+    assert mgr.turns[0].response_summary == "Likes hiking"
+    assert "Q2" in result
+    assert mgr.current_question_index == 2
+
+
+async def test_record_and_get_next_wraps_up_after_last_answer():
+    agent, mgr = _agent()
+    await agent.get_next_question(None)
+    await agent.record_and_get_next(None, 0, "a", "good")
+    await agent.record_and_get_next(None, 1, "b", "good")
+
+    result = await agent.record_and_get_next(None, 2, "c", "good")
+
+    assert result == "All questions answered. Wrap up warmly and end now."
+    assert mgr.end_reason == "all_questions_complete"
+    assert len(mgr.turns) == 3
+
+
+async def test_legacy_tools_still_work():
+    agent, mgr = _agent()
+    assert "Q1" in await agent.get_next_question(None)
+    result = await agent.record_suitor_response(None, 0, "a", "good")
+    assert result == "Response recorded. 2 questions remaining."
+
+
+async def test_one_tool_call_per_answer_walks_every_question_in_order():
+    questions = [{"text": "Q1"}, {"text": "Q2"}, {"text": "Q3"}]
+    mgr = SessionManager("s1", questions)
+    agent = InterviewAgent(instructions="x", session_manager=mgr)
+    # The entrypoint asks Q1 itself before the LLM ever runs.
+    assert mgr.get_next_question()["index"] == 0
+
+    replies = [
+        await agent.record_and_get_next(None, index, f"answer {index}", "good")
+        for index in range(len(questions))
+    ]
+
+    assert "Q2" in replies[0] and "Q3" in replies[1]
+    assert replies[2] == "All questions answered. Wrap up warmly and end now."
+    assert [turn.question_index for turn in mgr.turns] == [0, 1, 2]
+    assert [turn.response_summary for turn in mgr.turns] == [
+        "answer 0",
+        "answer 1",
+        "answer 2",
+    ]
+
+
+def test_prompt_does_not_send_the_llm_back_for_the_first_question():
+    from agent.load_harness import HARNESS_HEART
+    from agent.prompt_builder import build_system_prompt
+
+    prompt = build_system_prompt(HARNESS_HEART, suitor_name="Sam")
+
+    assert "do not call `get_next_question`" in prompt
+    assert "Call `get_next_question` once" not in prompt
+    assert "call\n`record_and_get_next` once after every answer" in prompt
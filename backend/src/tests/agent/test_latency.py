@@ -0,0 +1,91 @@
+"""Unit tests for per-turn voice pipeline latency tracking."""
+
+from __future__ import annotations
+
+from agent.latency import PhaseTimer, TurnLatencyTracker
+from src.util.stats import percentile
+
+
+def test_turn_offsets_measured_from_user_stop():
+    tracker = TurnLatencyTracker()
+    tracker.on_user_stopped(at=100.0)
+    tracker.on_final_transcript(at=100.2)
+    # Request started at 100.3, first token 0.4s later, finished at 101.0.
+    tracker.on_llm_metrics(timestamp=101.0, duration=0.7, ttft=0.4)
+    tracker.on_tool_call(at=100.9)
+    tracker.on_first_audio(at=101.5)
+
+    assert tracker.turns == [
+        {
+            "final_transcript": 200,
+            "llm_first_token": 700,
+            "tool_call": 900,
+            "first_audio": 1500,
+        }
+    ]
+
+
+def test_events_outside_an_open_turn_are_ignored():
+    tracker = TurnLatencyTracker()
+    tracker.on_final_transcript(at=1.0)
+    tracker.on_first_audio(at=2.0)
+
+    assert tracker.turns == []
+    assert tracker.summary()["turns"] == 0
+
+
+def test_summary_reports_p50_and_p95():
+    tracker = TurnLatencyTracker()
+    for i, delay in enumerate([0.5, 0.7, 0.9, 2.5]):
+        start = i * 10.0
+        tracker.on_user_stopped(at=start)
+        tracker.on_first_audio(at=start + delay)
+
+    stage = tracker.summary()["stages"]["first_audio"]
+    assert stage == {"count": 4, "p50_ms": 700, "p95_ms": 2500}
+    assert tracker.summary()["stages"]["tool_call"]["count"] == 0
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 50) is None
+    assert percentile([3, 1, 2], 50) == 2
+    assert percentile(range(1, 101), 95) == 95
+
+
+def test_phase_timer_records_each_phase_once():
+    timer = PhaseTimer(start=10.0)
+    assert timer.mark("connected", at=10.25) == 250
+    timer.mark("db_loaded", at=10.4)
+    assert timer.mark("connected", at=11.0) == 250
+    assert timer.snapshot() == {"connected": 250, "db_loaded": 400}
+
+
+async def test_admin_report_skips_sessions_with_malformed_latency():
+    import uuid
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, MagicMock
+
+    from src.api.v1.endpoints.admin import latency_report
+
+    def _row(metadata):
+        return SimpleNamespace(
+            id=uuid.uuid4(), ended_at=None, session_metadata=metadata
+        )
+
+    good = {"turns": 2, "stages": {"first_audio": {"p50_ms": 800, "p95_ms": 1200}}}
+    rows = [
+        _row({"agent_metrics": {"latency": good}}),
+        _row({"agent_metrics": {"latency": {"stages": {"first_audio": "slow"}}}}),
+        _row({"agent_metrics": {"latency": {"stages": {"tts": {"p50_ms": "n/a"}}}}}),
+        _row({"agent_metrics": ["legacy"]}),
+        _row("not a dict"),
+    ]
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    db = AsyncMock()
+    db.execute.return_value = result
+
+    report = await latency_report(None, uuid.uuid4(), db, limit=50)
+
+    assert report.sessions_considered == 1
+    assert report.stages["first_audio"].p95_ms == 1200
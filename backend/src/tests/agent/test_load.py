@@ -0,0 +1,43 @@
+"""Unit tests for agent worker load reporting."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from agent.load import LoopLagMonitor, WorkerLoad
+
+
+def test_load_is_worst_of_sessions_and_cpu():
+    load = WorkerLoad(4, cpu_percent=lambda: 0.3)
+
+    assert load.compute(1) == 0.3
+    assert load.compute(3) == 0.75
+    assert load.snapshot() == {
+        "active_sessions": 3,
+        "cpu": 0.3,
+        "load": 0.75,
+        "max_sessions": 4,
+    }
+
+
+def test_load_is_capped_and_cap_enforced():
+    load = WorkerLoad(2, cpu_percent=lambda: 0.0)
+
+    assert load.compute(5) == 1.0
+    assert load.has_capacity(1)
+    assert not load.has_capacity(2)
+
+
+async def test_lag_monitor_detects_blocked_loop():
+    monitor = LoopLagMonitor(interval=0.01, smoothing=1.0)
+    monitor.ensure_started()
+    await asyncio.sleep(0)
+    time.sleep(0.1)  # block the loop past the probe deadline
+    # A few bare yields let the overdue probe run once, well before its next tick.
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert monitor.lag_ms >= 50
+    assert max(monitor.samples) >= 50
+    assert monitor.snapshot()["max_ms"] >= 50
+    monitor.stop()
@@ -0,0 +1,37 @@
+"""Smoke test for the offline multi-room agent load harness."""
+
+from __future__ import annotations
+
+from agent.load_harness import HARNESS_QUESTIONS, HarnessLatencies, run_harness
+
+
+def _fast() -> HarnessLatencies:
+    return HarnessLatencies(
+        stt_ms=1,
+        llm_ttft_ms=1,
+        llm_ms_per_token=0,
+        tts_first_audio_ms=1,
+        suitor_speech_s=0.01,
+        vad_cpu_ms_per_s=0,
+        playback_scale=0,
+    )
+
+
+async def test_harness_runs_concurrent_rooms_and_reports():
+    saved: dict[str, dict] = {}
+
+    async def save(session_id: str, data: dict) -> None:
+        saved[session_id] = data
+
+    report = await run_harness(3, _fast(), save=save)
+
+    assert report.failed_rooms == 0
+    assert len(saved) == 3
+    for data in saved.values():
+        assert data["end_reason"] == "all_questions_complete"
+        assert len(data["turns"]) == len(HARNESS_QUESTIONS)
+    # One timed turn per answered question except the last (no reply audio).
+    assert report.turn_latency["turns"] == 3 * (len(HARNESS_QUESTIONS) - 1)
+    assert report.db_write_ms["count"] == 3
+    # Every follow-up question is led in by a bridge buffered during the answer.
+    assert report.question_bridge["played"] == report.turn_latency["turns"]
@@ -0,0 +1,135 @@
+"""Unit tests for the static-phrase TTS audio cache."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from agent.phrase_cache import CachedPhrase, PhraseAudioCache
+
+
+def _cache(tmp_path, **overrides) -> PhraseAudioCache:
+    params = {
+        "provider": "deepgram",
+        "model": "aura-2-andromeda-en",
+        "voice": "aura-2-andromeda-en",
+        "sample_rate": 24000,
+    }
+    params.update(overrides)
+    return PhraseAudioCache(tmp_path, **params)
+
+
+class _FakeStream:
+    def __init__(self, frames):
+        self._frames = frames
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+    def __aiter__(self):
+        return self._gen()
+
+    async def _gen(self):
+        for frame in self._frames:
+            yield SimpleNamespace(frame=frame)
+
+
+class _FakeTTS:
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def synthesize(self, text):
+        self.calls.append(text)
+        frame = SimpleNamespace(
+            data=memoryview(b"\x01\x00" * 480), sample_rate=24000, num_channels=1
+        )
+        return _FakeStream([frame, frame])
+
+
+def test_key_depends_on_voice_settings(tmp_path):
+    a = _cache(tmp_path)
+    b = _cache(tmp_path, sample_rate=16000)
+    assert a.key("Hello") != b.key("Hello")
+    assert a.key("Hello") == _cache(tmp_path).key("Hello")
+
+
+def test_store_persists_and_preload_reads_back(tmp_path):
+    writer = _cache(tmp_path)
+    writer.store(
+        "Bye", CachedPhrase(pcm=b"\x00\x01" * 2400, sample_rate=24000, num_channels=1)
+    )
+
+    reader = _cache(tmp_path)
+    assert reader.preload(["Bye", "missing"]) == 1
+    assert reader.has("Bye")
+    assert not reader.has("missing")
+    assert reader.missing(["Bye", "missing"]) == ["missing"]
+
+
+@pytest.mark.asyncio
+async def test_warm_synthesizes_only_missing_phrases(tmp_path):
+    cache = _cache(tmp_path)
+    tts = _FakeTTS()
+
+    assert await cache.warm(tts, ["One", "Two"]) == 2
+    assert await cache.warm(tts, ["One", "Two"]) == 0
+    assert tts.calls == ["One", "Two"]
+
+
+@pytest.mark.asyncio
+async def test_frames_chunks_cached_pcm(tmp_path):
+    cache = _cache(tmp_path, chunk_ms=20)
+    # 50ms of mono 24kHz audio -> 20ms + 20ms + 10ms frames.
+    cache.store(
+        "Hi", CachedPhrase(pcm=b"\x00\x00" * 1200, sample_rate=24000, num_channels=1)
+    )
+
+    frames = [frame async for frame in cache.frames("Hi")]
+
+    assert [f.samples_per_channel for f in frames] == [480, 480, 240]
+    assert cache.frames("not cached") is None
+
+
+@pytest.mark.asyncio
+async def test_warm_runs_in_one_process_and_others_read_its_files(tmp_path):
+    warming = _cache(tmp_path)
+    lock = warming._try_warm_lock()
+    assert lock is not None
+    waiting = _cache(tmp_path)
+    tts = _FakeTTS()
+
+    # Another process holds the warm lock: skip instead of paying for TTS twice.
+    assert await waiting.warm(tts, ["One"]) == 0
+    assert tts.calls == []
+
+    warming.store(
+        "One", CachedPhrase(pcm=b"\x00\x00" * 480, sample_rate=24000, num_channels=1)
+    )
+    lock.close()
+
+    assert waiting.frames("One") is not None
+    assert await waiting.warm(tts, ["One", "Two"]) == 1
+    assert tts.calls == ["Two"]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.asyncio
+async def test_session_warm_builds_no_tts_client_when_cache_is_warm(
+    tmp_path, monkeypatch
+):
+    from agent import main as agent_main
+
+    cache = _cache(tmp_path)
+    for text in agent_main.STATIC_PHRASES:
+        cache.store(
+            text, CachedPhrase(pcm=b"\x00\x01", sample_rate=24000, num_channels=1)
+        )
+    monkeypatch.setattr(
+        agent_main, "_build_tts", lambda: pytest.fail("built a TTS client")
+    )
+
+    await agent_main._warm_phrase_cache(_cache(tmp_path))
@@ -0,0 +1,45 @@
+"""Unit tests for agent prompt prefix layout and cache accounting."""
+
+from __future__ import annotations
+
+from agent.prompt_builder import build_static_prompt, build_system_prompt
+from agent.prompt_cache import PromptCacheStats
+
+HEART = {
+    "profile": {"display_name": "Luna", "bio": "bio"},
+    "persona": {
+        "traits": ["warm"],
+        "vibe": "calm",
+        "tone": "warm",
+        "humor_level": 5,
+        "strictness": 5,
+    },
+    "expectations": {"dealbreakers": ["rudeness"]},
+    "screening_questions": [{"text": "Q1"}, {"text": "Q2"}],
+}
+
+
+def test_system_prompt_shares_static_prefix_across_suitors():
+    prefix = build_static_prompt(HEART)
+    sam = build_system_prompt(HEART, suitor_name="Sam")
+    alex = build_system_prompt(HEART, suitor_name="Alex")
+
+    assert sam.startswith(prefix)
+    assert alex.startswith(prefix)
+    assert "Sam" not in prefix
+    assert "**Sam**" in sam[len(prefix) :]
+
+
+def test_prompt_cache_stats_hit_rate():
+    stats = PromptCacheStats()
+    assert stats.hit_rate is None
+
+    stats.on_llm_metrics(prompt_tokens=1200, cached_tokens=0)
+    stats.on_llm_metrics(prompt_tokens=1300, cached_tokens=1024)
+
+    assert stats.snapshot() == {
+        "requests": 2,
+        "prompt_tokens": 2500,
+        "cached_tokens": 1024,
+        "hit_rate": 0.41,
+    }
@@ -0,0 +1,115 @@
+"""Unit tests for the pre-synthesized question lead-in."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agent.interview_agent import InterviewAgent
+from agent.question_bridge import QuestionBridge, lead_in
+from agent.session_manager import SessionManager
+
+
+class _FakeStream:
+    def __init__(self, text):
+        self._text = text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+    def __aiter__(self):
+        return self._gen()
+
+    async def _gen(self):
+        for word in self._text.split():
+            yield SimpleNamespace(frame=word)
+
+
+class _FakeTTS:
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def synthesize(self, text):
+        self.calls.append(text)
+        return _FakeStream(text)
+
+
+async def _frames(items, delay: float = 0.0):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+@pytest.mark.asyncio
+async def test_prepare_buffers_once_and_take_rotates_phrases():
+    tts = _FakeTTS()
+    bridge = QuestionBridge(tts, phrases=("Okay, next.", "Alright."))
+    bridge.prepare()
+    bridge.prepare()
+    await asyncio.sleep(0)
+
+    text, audio = await bridge.take()
+
+    assert text == "Okay, next."
+    assert [frame async for frame in audio] == ["Okay,", "next."]
+    assert bridge.next_text == "Alright."
+    assert tts.calls == ["Okay, next."]
+    assert bridge.snapshot() == {"played": 1, "synthesized": 1}
+
+
+@pytest.mark.asyncio
+async def test_take_without_ready_audio_returns_none():
+    bridge = QuestionBridge(_FakeTTS())
+    assert await bridge.take() is None
+    assert bridge.played == 0
+
+
+@pytest.mark.asyncio
+async def test_lead_in_plays_bridge_first_while_reply_synthesizes():
+    pulled: list[str] = []
+
+    async def reply():
+        async for frame in _frames(["q1", "q2"]):
+            pulled.append(frame)
+            yield frame
+
+    out = []
+    async for frame in lead_in(_frames(["b1", "b2"], delay=0.01), reply()):
+        out.append((frame, list(pulled)))
+
+    assert [frame for frame, _ in out] == ["b1", "b2", "q1", "q2"]
+    # The reply was already being pulled while the bridge was still playing.
+    assert out[1][1] == ["q1", "q2"]
+
+
+@pytest.mark.asyncio
+async def test_tts_node_leads_only_a_newly_issued_question(monkeypatch):
+    from livekit.agents import Agent
+
+    async def fake_default_tts_node(_agent, text, _settings):
+        async for chunk in text:
+            yield f"tts:{chunk}"
+
+    monkeypatch.setattr(Agent.default, "tts_node", fake_default_tts_node)
+    mgr = SessionManager("s1", [{"text": "Q1"}, {"text": "Q2"}])
+    bridge = QuestionBridge(_FakeTTS(), phrases=("Next one.",))
+    agent = InterviewAgent(
+        instructions="x", session_manager=mgr, question_bridge=bridge
+    )
+    mgr.get_next_question()
+
+    agent.prepare_bridge()
+    await asyncio.sleep(0)
+    ack = [f async for f in agent.tts_node(_frames(["Love that."]), None)]
+    await agent.record_and_get_next(None, 0, "hikes", "good")
+    question = [f async for f in agent.tts_node(_frames(["Q2?"]), None)]
+
+    assert ack == ["tts:Love that."]
+    assert question == ["Next", "one.", "tts:Q2?"]
+    assert mgr.full_transcript[-1]["text"] == "Next one."
@@ -0,0 +1,44 @@
+"""Unit tests for the agent-side SessionManager lifecycle."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from agent.session_manager import SessionManager
+
+
+@pytest.mark.asyncio
+async def test_wait_for_end_resolves_when_end_called():
+    mgr = SessionManager("s1", [{"text": "Q1"}])
+    waiter = asyncio.create_task(mgr.wait_for_end())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    mgr.end("suitor_disconnected")
+
+    assert await asyncio.wait_for(waiter, timeout=1) == "suitor_disconnected"
+
+
+@pytest.mark.asyncio
+async def test_arm_deadline_ends_session_with_max_duration_reason():
+    mgr = SessionManager("s1", [{"text": "Q1"}], max_duration_seconds=0)
+    mgr.arm_deadline()
+
+    reason = await asyncio.wait_for(mgr.wait_for_end(), timeout=1)
+
+    assert reason == "max_duration_reached"
+    assert mgr.ended_at is not None
+
+
+@pytest.mark.asyncio
+async def test_end_cancels_pending_deadline():
+    mgr = SessionManager("s1", [{"text": "Q1"}], max_duration_seconds=600)
+    mgr.arm_deadline()
+    handle = mgr._deadline_handle
+
+    mgr.end("all_questions_complete")
+
+    assert handle is not None and handle.cancelled()
+    assert mgr.end_reason == "all_questions_complete"
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from agent.silence import SILENT_END_REASON, SilenceWatchdog
+
+
+def _watchdog(prompt_after=0.02, end_after=0.02):
+    calls: list[str] = []
+    watchdog = SilenceWatchdog(
+        lambda: calls.append("prompt"),
+        lambda reason: calls.append(reason),
+        prompt_after_seconds=prompt_after,
+        end_after_seconds=end_after,
+    )
+    return watchdog, calls
+
+
+@pytest.mark.asyncio
+async def test_silent_suitor_is_prompted_once_then_ended():
+    watchdog, calls = _watchdog()
+    watchdog.on_agent_idle()
+    await asyncio.sleep(0.05)
+    assert calls == ["prompt"]
+
+    # The nudge is spoken (busy), then the agent listens again.
+    watchdog.on_agent_busy()
+    watchdog.on_agent_idle()
+    await asyncio.sleep(0.05)
+    assert calls == ["prompt", SILENT_END_REASON]
+    assert watchdog.snapshot()["ended_session"] is True
+
+    watchdog.on_agent_idle()
+    await asyncio.sleep(0.05)
+    assert calls == ["prompt", SILENT_END_REASON]
+
+
+@pytest.mark.asyncio
+async def test_suitor_activity_resets_window_and_nudge():
+    watchdog, calls = _watchdog()
+    watchdog.on_agent_idle()
+    await asyncio.sleep(0.05)
+    assert calls == ["prompt"]
+
+    watchdog.on_suitor_activity()
+    watchdog.on_agent_idle()
+    await asyncio.sleep(0.05)
+    assert calls == ["prompt", "prompt"]
+
+
+@pytest.mark.asyncio
+async def test_agent_busy_pauses_the_clock_and_zero_disables():
+    watchdog, calls = _watchdog()
+    watchdog.on_agent_idle()
+    watchdog.on_agent_busy()
+    await asyncio.sleep(0.05)
+    assert calls == []
+
+    disabled, disabled_calls = _watchdog(prompt_after=0)
+    disabled.on_agent_idle()
+    await asyncio.sleep(0.03)
+    assert disabled_calls == []
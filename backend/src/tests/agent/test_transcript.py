@@ -0,0 +1,82 @@
+from agent.session_manager import SessionManager
+from agent.transcript import TranscriptAssembler
+
+
+def test_interims_are_replaced_and_finals_merged_per_turn():
+    assembler = TranscriptAssembler()
+    assert assembler.add("I", is_final=False, at=10.0) == ""
+    assembler.add("I like", is_final=False, at=10.3)
+    assert assembler.add("I like hiking.", is_final=True, at=10.8) == "I like hiking."
+    assembler.add("Mostly", is_final=False, at=11.5)
+    assert assembler.pending_text == "I like hiking. Mostly"
+    assembler.add("Mostly on weekends.", is_final=True, at=12.0)
+
+    utterance = assembler.flush()
+    assert utterance.text == "I like hiking. Mostly on weekends."
+    assert (utterance.started_at, utterance.ended_at) == (10.0, 12.0)
+    assert assembler.flush() is None
+
+    stats = assembler.snapshot()
+    assert stats["rows_raw"] == 5
+    assert stats["rows_persisted"] == 1
+    assert stats["tokens_persisted"] < stats["tokens_raw"]
+
+
+def test_interim_only_speech_is_not_persisted():
+    assembler = TranscriptAssembler()
+    assembler.add("um so", is_final=False)
+    assert assembler.flush() is None
+    assert assembler.snapshot()["dropped_interims"] == 1
+
+
+def test_session_manager_persists_one_row_per_suitor_turn_in_order():
+    mgr = SessionManager(session_id="s1", questions=[{"text": "Q1"}])
+    mgr.add_transcript_entry("avatar", "Q1?")
+    for partial in ("lots", "lots of", "lots of words"):
+        mgr.add_suitor_transcript(partial, is_final=False)
+    mgr.add_suitor_transcript("lots of words", is_final=True)
+    mgr.add_suitor_transcript("and more", is_final=True)
+    # Interims do not inflate the ramble count.
+    assert mgr.ramble_detector.current_turn_words == 5
+    mgr.add_transcript_entry("avatar", "Nice.")
+
+    transcript = mgr.get_session_data()["full_transcript"]
+    assert [(e["speaker"], e["text"]) for e in transcript] == [
+        ("avatar", "Q1?"),
+        ("suitor", "lots of words and more"),
+        ("avatar", "Nice."),
+    ]
+    assert [e["index"] for e in transcript] == [0, 1, 2]
+    suitor = transcript[1]
+    assert suitor["end_offset"] >= suitor["start_offset"] >= 0
+    assert suitor["duration"] >= 0
+
+
+def test_open_turn_is_flushed_when_session_data_is_read():
+    mgr = SessionManager(session_id="s1", questions=[])
+    mgr.add_suitor_transcript("goodbye", is_final=True)
+    assert mgr.get_session_data()["full_transcript"][0]["text"] == "goodbye"
+
+
+def test_committed_user_turn_is_persisted_before_the_next_turn_starts():
+    mgr = SessionManager(session_id="s1", questions=[])
+    mgr.add_suitor_transcript("first answer", is_final=True)
+    mgr.end_suitor_turn()
+    mgr.add_suitor_transcript("second answer", is_final=True)
+
+    transcript = mgr.get_session_data()["full_transcript"]
+    assert [e["text"] for e in transcript] == ["first answer", "second answer"]
+    assert mgr.ramble_detector.current_turn_words == 2
+
+
+def test_ramble_interrupt_fires_once_per_turn():
+    mgr = SessionManager(session_id="s1", questions=[])
+    mgr.ramble_detector.word_threshold = 3
+    mgr.add_suitor_transcript("one two three four", is_final=True)
+    assert mgr.ramble_detector.take_interrupt()
+    mgr.add_suitor_transcript("five six", is_final=True)
+    assert not mgr.ramble_detector.take_interrupt()
+
+    mgr.end_suitor_turn()
+    mgr.add_suitor_transcript("seven eight nine ten", is_final=True)
+    assert mgr.ramble_detector.take_interrupt()
@@ -35,3 +35,71 @@ async def test_find_by_session_id_returns_score(
     result = await repo.find_by_session_id(session_id)
 
     assert result == score
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_inserts_once_and_skips_conflicts(
+    async_session_mock: AsyncMock,
+    execute_result_builder,
+    session_factory,
+):
+    from sqlalchemy.dialects import postgresql
+
+    inserted = uuid.uuid4()
+    async_session_mock.execute.return_value = execute_result_builder(
+        all_values=[inserted]
+    )
+    payload = {
+        "effort_score": 80,
+        "creativity_score": 70,
+        "intent_clarity_score": 90,
+        "emotional_intelligence_score": 85,
+        "weighted_total": 82.75,
+        "verdict": Verdict.DATE,
+        "feedback_text": "Good effort",
+    }
+
+    repo = ScoreRepository(session_factory=session_factory)
+    result = await repo.bulk_create(
+        [
+            {**payload, "session_id": inserted},
+            {**payload, "session_id": uuid.uuid4()},
+        ]
+    )
+
+    assert result == [inserted]
+    async_session_mock.execute.assert_awaited_once()
+    sql = str(
+        async_session_mock.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "ON CONFLICT (session_id) DO NOTHING" in sql
+    assert "RETURNING scores.session_id" in sql
+
+
+@pytest.mark.asyncio
+async def test_update_for_session_overwrites_fields_but_not_session_id(
+    async_session_mock: AsyncMock,
+    session_factory,
+):
+    from unittest.mock import Mock
+
+    from sqlalchemy.dialects import postgresql
+
+    result = Mock()
+    result.scalar_one_or_none.return_value = uuid.uuid4()
+    async_session_mock.execute.return_value = result
+    session_id = uuid.uuid4()
+
+    repo = ScoreRepository(session_factory=session_factory)
+    updated = await repo.update_for_session(
+        session_id, {"session_id": session_id, "feedback_text": "Full feedback"}
+    )
+
+    assert updated is True
+    statement = async_session_mock.execute.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE scores SET feedback_text=")
+    assert "WHERE scores.session_id =" in sql
+    async_session_mock.commit.assert_awaited_once()
@@ -0,0 +1,64 @@
+"""Unit tests for ScoringCacheRepository."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.repository.scoring_cache_repository import ScoringCacheRepository
+
+
+@pytest.mark.asyncio
+async def test_get_counts_hit_and_returns_payload_in_one_statement(
+    async_session_mock: AsyncMock,
+    session_factory,
+):
+    result = Mock()
+    result.scalar_one_or_none.return_value = {"final_score": 80.0}
+    async_session_mock.execute.return_value = result
+
+    repo = ScoringCacheRepository(session_factory=session_factory)
+    payload = await repo.get("abc")
+
+    assert payload == {"final_score": 80.0}
+    async_session_mock.execute.assert_awaited_once()
+    sql = str(
+        async_session_mock.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "hits=(scoring_cache.hits +" in sql
+    assert "RETURNING scoring_cache.payload" in sql
+
+
+@pytest.mark.asyncio
+async def test_put_keeps_existing_entry(
+    async_session_mock: AsyncMock,
+    session_factory,
+):
+    repo = ScoringCacheRepository(session_factory=session_factory)
+    await repo.put("abc", claude_model="m", prompt_version="1", payload={"a": 1})
+
+    sql = str(
+        async_session_mock.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "ON CONFLICT (cache_key) DO NOTHING" in sql
+    async_session_mock.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stats_reports_hit_rate(
+    async_session_mock: AsyncMock,
+    session_factory,
+):
+    result = Mock()
+    result.first.return_value = (3, 9)
+    async_session_mock.execute.return_value = result
+
+    repo = ScoringCacheRepository(session_factory=session_factory)
+
+    assert await repo.stats() == {"entries": 3, "hits": 9, "hit_rate": 0.75}
@@ -151,3 +151,198 @@ async def test_find_stale_in_progress_returns_stale_sessions(
     result = await repo.find_stale_in_progress(datetime.now(timezone.utc))
 
     assert result == [stale]
+
+
+@pytest.mark.asyncio
+async def test_transition_issues_one_conditional_update_returning(
+    async_session_mock: AsyncMock,
+    execute_result_builder,
+    session_factory,
+):
+    from sqlalchemy.dialects import postgresql
+
+    session_id = uuid.uuid4()
+    updated = SessionDb(
+        id=session_id,
+        heart_id=uuid.uuid4(),
+        suitor_id=uuid.uuid4(),
+        status=SessionStatus.SCORED,
+    )
+    async_session_mock.execute.return_value = execute_result_builder(
+        first_value=updated
+    )
+
+    repo = SessionRepository(session_factory=session_factory)
+    result = await repo.transition(
+        session_id,
+        {SessionStatus.SCORING},
+        status=SessionStatus.SCORED,
+        has_verdict=True,
+        verdict_status="ready",
+    )
+
+    assert result == updated
+    async_session_mock.execute.assert_awaited_once()
+    async_session_mock.commit.assert_awaited_once()
+    async_session_mock.get.assert_not_awaited()
+    statement = async_session_mock.execute.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE sessions SET")
+    assert "has_verdict" in sql and "verdict_status" in sql
+    assert "sessions.status IN" in sql
+    assert "RETURNING" in sql
+
+
+@pytest.mark.asyncio
+async def test_transition_returns_none_when_state_moved_on(
+    async_session_mock: AsyncMock,
+    execute_result_builder,
+    session_factory,
+):
+    async_session_mock.execute.return_value = execute_result_builder(first_value=None)
+
+    repo = SessionRepository(session_factory=session_factory)
+    result = await repo.transition(
+        uuid.uuid4(), {SessionStatus.PENDING}, status=SessionStatus.EXPIRED
+    )
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_transition_rejects_unknown_columns(session_factory):
+    repo = SessionRepository(session_factory=session_factory)
+    with pytest.raises(TypeError, match="not_a_column"):
+        await repo.transition(uuid.uuid4(), {SessionStatus.PENDING}, not_a_column=1)
+
+
+@pytest.mark.asyncio
+async def test_transition_accepts_attribute_names_mapped_to_other_columns(
+    async_session_mock: AsyncMock,
+    execute_result_builder,
+    session_factory,
+):
+    from sqlalchemy.dialects import postgresql
+
+    async_session_mock.execute.return_value = execute_result_builder(first_value=None)
+
+    repo = SessionRepository(session_factory=session_factory)
+    await repo.transition(
+        uuid.uuid4(), {SessionStatus.SCORING}, session_metadata={"k": "v"}
+    )
+
+    statement = async_session_mock.execute.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "SET metadata=" in sql
+
+
+@pytest.mark.asyncio
+async def test_transition_many_patches_metadata_in_one_update(
+    async_session_mock: AsyncMock,
+    execute_result_builder,
+    session_factory,
+):
+    from sqlalchemy.dialects import postgresql
+
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    async_session_mock.execute.return_value = execute_result_builder(all_values=[])
+
+    repo = SessionRepository(session_factory=session_factory)
+    await repo.transition_many(
+        ids,
+        {SessionStatus.SCORING},
+        status=SessionStatus.SCORED,
+        session_metadata=SessionRepository.metadata_patch(drop=["scoring_batch"]),
+    )
+
+    async_session_mock.execute.assert_awaited_once()
+    async_session_mock.commit.assert_awaited_once()
+    statement = async_session_mock.execute.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "metadata=(coalesce(sessions.metadata" in sql
+    assert "sessions.id IN" in sql and "sessions.status IN" in sql
+
+
+@pytest.mark.asyncio
+async def test_transition_many_skips_empty_id_list(
+    async_session_mock: AsyncMock, session_factory
+):
+    repo = SessionRepository(session_factory=session_factory)
+    assert await repo.transition_many([], {SessionStatus.SCORING}) == []
+    async_session_mock.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_claim_for_scoring_locks_with_skip_locked_and_stamps_claim(
+    async_session_mock: AsyncMock,
+    execute_result_builder,
+    session_factory,
+):
+    from sqlalchemy.dialects import postgresql
+
+    claimed_id = uuid.uuid4()
+    async_session_mock.execute.return_value = execute_result_builder(
+        all_values=[claimed_id]
+    )
+    now = datetime.now(timezone.utc)
+
+    repo = SessionRepository(session_factory=session_factory)
+    result = await repo.claim_for_scoring(
+        ended_before=now,
+        claim_expired_before=now,
+        batch_expired_before=now,
+        limit=20,
+    )
+
+    assert result == [claimed_id]
+    async_session_mock.execute.assert_awaited_once()
+    async_session_mock.commit.assert_awaited_once()
+    sql = str(
+        async_session_mock.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert sql.startswith("UPDATE sessions SET scoring_claimed_at=")
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "NOT (EXISTS (SELECT" in sql
+    assert "RETURNING sessions.id" in sql
+    # Abandoned claims (older than the TTL) are claimable again.
+    assert (
+        "(sessions.scoring_claimed_at IS NULL OR sessions.scoring_claimed_at <"
+    ) in sql
+    # A live batch keeps its sessions; its submit time compares as a timestamp.
+    batch_submitted_at = (
+        "CAST(((sessions.metadata[%(metadata_1)s::TEXT]) ->> %(param_1)s::TEXT) "
+        "AS TIMESTAMP WITH TIME ZONE)"
+    )
+    assert f"OR {batch_submitted_at} IS NULL OR {batch_submitted_at} <" in sql
+
+
+@pytest.mark.asyncio
+async def test_claim_missing_feedback_claims_published_verdicts_only(
+    async_session_mock: AsyncMock,
+    execute_result_builder,
+    session_factory,
+):
+    from sqlalchemy.dialects import postgresql
+
+    claimed_id = uuid.uuid4()
+    async_session_mock.execute.return_value = execute_result_builder(
+        all_values=[claimed_id]
+    )
+    now = datetime.now(timezone.utc)
+
+    repo = SessionRepository(session_factory=session_factory)
+    result = await repo.claim_missing_feedback(
+        ended_before=now, claim_expired_before=now, limit=5
+    )
+
+    assert result == [claimed_id]
+    async_session_mock.commit.assert_awaited_once()
+    statement = async_session_mock.execute.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE sessions SET scoring_claimed_at=")
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "sessions.verdict_status IN (__[POSTCOMPILE_verdict_status_1])" in sql
+    params = statement.compile(dialect=postgresql.dialect()).params
+    assert params["verdict_status_1"] == ["feedback_pending", "feedback_failed"]
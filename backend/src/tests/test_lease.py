@@ -0,0 +1,53 @@
+"""Redis lease tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.core.lease import RedisLease
+
+
+class FakeRedis:
+    """Just enough of SET NX PX / compare-and-delete EVAL for leases."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def eval(self, _script, _numkeys, key, token):
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+@pytest.mark.asyncio
+async def test_lease_is_exclusive_until_released():
+    redis = FakeRedis()
+    first = RedisLease(redis, "scoring-lease:s1", 360)
+    second = RedisLease(redis, "scoring-lease:s1", 360)
+
+    assert await first.acquire() is True
+    assert await second.acquire() is False
+    await second.release()  # not held: must not drop the first lease
+    assert "scoring-lease:s1" in redis.data
+
+    await first.release()
+    assert await second.acquire() is True
+
+
+@pytest.mark.asyncio
+async def test_release_leaves_a_lease_taken_over_after_expiry():
+    redis = FakeRedis()
+    stale = RedisLease(redis, "k", 1)
+    assert await stale.acquire()
+    redis.data["k"] = "someone-else"  # our TTL ran out and another run took it
+
+    await stale.release()
+
+    assert redis.data["k"] == "someone-else"
@@ -180,10 +180,7 @@ async def test_m1_015_arq_enqueue_and_dequeue(monkeypatch):
 
     fake_pool = AsyncMock()
 
-    async def fake_create_pool(*_args, **_kwargs):
-        return fake_pool
-
-    monkeypatch.setattr("src.workers.tasks.create_pool", fake_create_pool)
+    monkeypatch.setattr("src.workers.tasks.get_arq_pool", lambda: fake_pool)
     await enqueue_scoring_job("session-123")
     fake_pool.enqueue_job.assert_awaited_once()
     assert fake_pool.enqueue_job.await_args.args[0] == "score_session_task"
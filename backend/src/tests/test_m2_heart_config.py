@@ -232,3 +232,55 @@ async def test_m2_014_public_profile_no_sensitive_data(monkeypatch, seeded_heart
     assert "expectations" not in payload
     assert "persona" not in payload
     assert "calcom_api_key" not in str(payload)
+
+
+_PROVIDER_YAML = """
+profile:
+  display_name: Luna
+  bio: test
+persona:
+  traits: [warm]
+  vibe: nice
+  tone: calm
+  humor_level: 5
+  strictness: 5
+expectations: {}
+screening_questions:
+  - text: "Why me?"
+shareable_slug: luna
+calendar:
+  calcom_api_key: "${TEST_HEART_CALCOM_KEY}"
+  calcom_event_type_id: "1"
+"""
+
+
+@pytest.mark.asyncio
+async def test_m2_015_heart_config_provider_caches_until_file_or_env_changes(
+    tmp_path: Path, monkeypatch
+):
+    import os
+
+    from src.services.config_loader import HeartConfigProvider
+
+    path = tmp_path / "heart.yaml"
+    path.write_text(_PROVIDER_YAML, encoding="utf-8")
+    monkeypatch.setenv("TEST_HEART_CALCOM_KEY", "key-1")
+    provider = HeartConfigProvider(str(path))
+
+    first = provider.get()
+    payload = provider.scoring_payload()
+    assert provider.get() is first
+    assert provider.scoring_payload() is payload
+    assert payload["display_name"] == "Luna"
+    assert payload["screening_questions"] == [{"text": "Why me?", "required": True}]
+    assert provider.loads == 1
+
+    monkeypatch.setenv("TEST_HEART_CALCOM_KEY", "key-2")
+    assert provider.get().calendar.calcom_api_key == "key-2"
+    assert provider.loads == 2
+
+    path.write_text(_PROVIDER_YAML.replace("Luna", "Nova"), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert provider.scoring_payload()["display_name"] == "Nova"
+    assert provider.loads == 3
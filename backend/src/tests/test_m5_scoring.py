@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from unittest.mock import AsyncMock
 
@@ -10,7 +11,10 @@ import pytest
 from src.api.v1.endpoints.sessions import get_session_verdict
 from src.models.domain_enums import Verdict
 from src.models.score_model import ScoreDb
-from src.services.scoring.prompt_builder import build_scoring_prompt
+from src.services.scoring.prompt_builder import (
+    build_scoring_prompt,
+    build_scoring_prompt_parts,
+)
 from src.services.scoring.scoring_service import ScoringService
 from workers.main import score_session_task
 
@@ -49,10 +53,7 @@ async def test_m5_001_scoring_job_enqueued_on_session_end(monkeypatch):
 
     pool = AsyncMock()
 
-    async def fake_create_pool(*_args, **_kwargs):
-        return pool
-
-    monkeypatch.setattr("src.workers.tasks.create_pool", fake_create_pool)
+    monkeypatch.setattr("src.workers.tasks.get_arq_pool", lambda: pool)
     await enqueue_scoring_job("abc")
     pool.enqueue_job.assert_awaited_once()
 
@@ -376,3 +377,652 @@ async def test_m5_030_scoring_handles_partial_conversation(sample_transcript):
         transcript=[{"speaker": "suitor", "content": "partial"}],
     )
     assert "suitor_disconnected" in prompt
+
+
+@pytest.mark.asyncio
+async def test_m5_031_scoring_prompt_prefix_is_session_independent(sample_transcript):
+    heart = {"display_name": "Luna", "bio": "b", "persona": {}, "expectations": {}}
+    first_prefix, first_suffix = build_scoring_prompt_parts(
+        heart_config=heart,
+        session_data={"session_id": "s1"},
+        turn_summaries=sample_transcript,
+        transcript=[{"speaker": "suitor", "content": "I like hiking"}],
+    )
+    second_prefix, second_suffix = build_scoring_prompt_parts(
+        heart_config=heart,
+        session_data={"session_id": "s2"},
+        turn_summaries=[],
+        transcript=[],
+    )
+    assert first_prefix == second_prefix
+    assert "I like hiking" in first_suffix
+    assert "s2" in second_suffix and "s2" not in second_prefix
+
+
+@pytest.mark.asyncio
+async def test_m5_032_scoring_sends_cached_prefix_and_records_usage(
+    monkeypatch, sample_transcript
+):
+    import json
+    from types import SimpleNamespace
+
+    service = ScoringService.__new__(ScoringService)
+    service.model = "claude"
+    client = AsyncMock()
+    client.messages.create.return_value = SimpleNamespace(
+        content=[SimpleNamespace(text=json.dumps(_score_payload()))],
+        usage=SimpleNamespace(
+            input_tokens=300,
+            output_tokens=200,
+            cache_read_input_tokens=1500,
+            cache_creation_input_tokens=0,
+        ),
+    )
+    service.client = client
+
+    result = await service.score_session(
+        heart_config={"display_name": "Luna", "persona": {}, "expectations": {}},
+        session_data={"session_id": "s1"},
+        turn_summaries=sample_transcript,
+        transcript=[{"speaker": "suitor", "content": "hello"}],
+    )
+
+    content = client.messages.create.call_args.kwargs["messages"][0]["content"]
+    assert content[0]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in content[1]
+    assert "hello" in content[1]["text"]
+    assert result["claude_cache_read_tokens"] == 1500
+    assert result["claude_cache_creation_tokens"] == 0
+
+
+@pytest.mark.asyncio
+async def test_m5_033_silent_suitor_session_skips_claude(monkeypatch):
+    from types import SimpleNamespace
+
+    from src.models.domain_enums import ConversationSpeaker, SessionStatus
+
+    session_id = uuid.uuid4()
+    session = SimpleNamespace(
+        id=session_id,
+        status=SessionStatus.COMPLETED,
+        end_reason="suitor_silent",
+        heart_id=uuid.uuid4(),
+        suitor_id=uuid.uuid4(),
+        started_at=None,
+        ended_at=None,
+        turn_summaries={"turns": []},
+        session_metadata={},
+        verdict_status=None,
+    )
+    created: list[dict] = []
+
+    class FakeSessionRepo:
+        def __init__(self, **_kwargs):
+            pass
+
+        async def read_by_id(self, _id):
+            return session
+
+        async def transition(self, _id, from_states, **fields):
+            if session.status not in from_states:
+                return None
+            for key, value in fields.items():
+                setattr(session, key, value)
+            return session
+
+    class FakeScoreRepo(FakeSessionRepo):
+        async def find_by_session_id(self, _id):
+            return None
+
+        async def create(self, payload):
+            created.append(payload)
+
+    class FakeTurnRepo(FakeSessionRepo):
+        async def find_by_session_id(self, _id):
+            return [
+                SimpleNamespace(
+                    turn_index=0,
+                    speaker=ConversationSpeaker.AVATAR,
+                    content="Are you still there?",
+                )
+            ]
+
+    class NoClaude:
+        def __init__(self):
+            raise AssertionError("silent sessions must not call Claude")
+
+    monkeypatch.setattr("workers.main.SessionRepository", FakeSessionRepo)
+    monkeypatch.setattr("workers.main.ScoreRepository", FakeScoreRepo)
+    monkeypatch.setattr("workers.main.ConversationTurnRepository", FakeTurnRepo)
+    monkeypatch.setattr(
+        "workers.main.heart_config_provider.scoring_payload",
+        lambda: {"persona": {}},
+    )
+    monkeypatch.setattr("src.services.scoring.scoring_service.ScoringService", NoClaude)
+
+    await score_session_task({}, str(session_id))
+
+    assert created and created[0]["verdict"] == Verdict.NO_DATE
+    assert created[0]["claude_input_tokens"] == 0
+    assert session.status == SessionStatus.SCORED
+
+
+@pytest.mark.asyncio
+async def test_m5_034_scoring_job_is_deduplicated_and_leased(monkeypatch):
+    from types import SimpleNamespace
+
+    from src.tests.test_lease import FakeRedis
+    from src.workers.tasks import enqueue_scoring_job, scoring_job_id
+
+    pool = SimpleNamespace(enqueue_job=AsyncMock(return_value=None))
+    monkeypatch.setattr("src.workers.tasks.get_arq_pool", lambda: pool)
+    await enqueue_scoring_job("s1")
+    await enqueue_scoring_job("s1", rescore=True)
+    first, rescore = pool.enqueue_job.await_args_list
+    assert first.kwargs["_job_id"] == scoring_job_id("s1")
+    assert rescore.args[2] is True
+    assert rescore.kwargs["_job_id"] != scoring_job_id("s1")
+
+    scored: list[str] = []
+
+    async def fake_score(ctx, session_id, *, rescore):
+        scored.append(session_id)
+
+    monkeypatch.setattr("workers.main._score_session", fake_score)
+    redis = FakeRedis()
+    session_id = str(uuid.uuid4())
+    redis.data[f"scoring-lease:{session_id}"] = "another-run"
+
+    await score_session_task({"redis": redis}, session_id)
+    assert scored == []
+
+    del redis.data[f"scoring-lease:{session_id}"]
+    await score_session_task({"redis": redis}, session_id)
+    assert scored == [session_id]
+    assert redis.data == {}
+
+
+@pytest.mark.asyncio
+async def test_m5_035_identical_inputs_are_served_from_scoring_cache(monkeypatch):
+    import json
+    from types import SimpleNamespace
+
+    class FakeCache:
+        def __init__(self):
+            self.rows: dict[str, dict] = {}
+
+        async def get(self, key):
+            return self.rows.get(key)
+
+        async def put(self, key, *, claude_model, prompt_version, payload):
+            self.rows.setdefault(key, payload)
+
+    service = ScoringService.__new__(ScoringService)
+    service.model = "claude"
+    service.cache = FakeCache()
+    client = AsyncMock()
+    client.messages.create.return_value = SimpleNamespace(
+        content=[SimpleNamespace(text=json.dumps(_score_payload()))],
+        usage=SimpleNamespace(input_tokens=300, output_tokens=200),
+    )
+    service.client = client
+    inputs = {
+        "heart_config": {"display_name": "Luna", "persona": {}},
+        "turn_summaries": [],
+    }
+
+    first = await service.score_session(
+        session_data={"session_id": "s1"},
+        transcript=[
+            {"speaker": "suitor", "content": "I love  hiking", "turn_index": 0}
+        ],
+        **inputs,
+    )
+    # Different session, ids and whitespace: same content, so a cache hit.
+    second = await service.score_session(
+        session_data={"session_id": "s2"},
+        transcript=[
+            {"speaker": "suitor", "content": "I love hiking ", "turn_index": 7}
+        ],
+        **inputs,
+    )
+
+    assert client.messages.create.await_count == 1
+    assert second["final_score"] == first["final_score"]
+    assert second["verdict"] == first["verdict"]
+    assert second["claude_input_tokens"] == 0
+    assert service.cache_hit_rate == 0.5
+
+    # A threshold change applies to cached scores too.
+    monkeypatch.setattr(
+        "src.services.scoring.scoring_service.config.VERDICT_THRESHOLD",
+        first["final_score"] + 1,
+    )
+    raised = await service.score_session(
+        session_data={"session_id": "s3"},
+        transcript=[{"speaker": "suitor", "content": "I love hiking"}],
+        **inputs,
+    )
+    assert client.messages.create.await_count == 1
+    assert first["verdict"] == Verdict.DATE
+    assert raised["verdict"] == Verdict.NO_DATE
+    assert raised["verdict_threshold"] == first["final_score"] + 1
+
+    await service.score_session(
+        session_data={"session_id": "s2"},
+        transcript=[{"speaker": "suitor", "content": "I love hiking"}],
+        use_cache=False,
+        **inputs,
+    )
+    assert client.messages.create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_m5_036_prompt_compiler_fits_rambling_interview_in_budget(
+    sample_transcript,
+):
+    from src.services.scoring.prompt_compiler import (
+        compile_scoring_prompt,
+        scoring_max_tokens,
+    )
+
+    monologue = " ".join(f"word{i}" for i in range(1500))
+    transcript = [
+        {"speaker": "avatar", "content": "What do you do for fun?"},
+        {"speaker": "suitor", "content": "Um..."},
+        {"speaker": "suitor", "content": "Can you hear me?"},
+        {"speaker": "suitor", "content": "can you  hear me?"},
+        {"speaker": "suitor", "content": "Yeah."},
+        {"speaker": "suitor", "content": f"I like hiking {monologue} and cooking"},
+    ]
+    compiled = compile_scoring_prompt(
+        heart_config={"display_name": "Luna", "persona": {"tone": "warm"}},
+        session_data={"session_id": "s1", "ended_at": None},
+        turn_summaries=sample_transcript,
+        transcript=transcript,
+        input_token_budget=1500,
+        max_turn_chars=1200,
+    )
+
+    suffix = compiled.session_suffix
+    assert "Um..." not in suffix
+    assert "Yeah." in suffix  # short answers are not filler
+    assert "(said 2x)" in suffix
+    assert "I like hiking" in suffix and "and cooking" in suffix
+    assert "words omitted" in suffix
+    assert '{"session_id":"s1"}' in suffix
+    assert '{"tone":"warm"}' in compiled.static_prefix
+    assert compiled.tokens_after <= 1500 < compiled.tokens_before
+    assert compiled.max_tokens == scoring_max_tokens(len(sample_transcript))
+    assert scoring_max_tokens(1) == 1024
+    assert scoring_max_tokens(40) == 4096
+
+
+@pytest.mark.asyncio
+async def test_m5_037_scoring_records_prompt_tokens_and_retries_truncated_output(
+    sample_transcript,
+):
+    import json
+    from types import SimpleNamespace
+
+    service = ScoringService.__new__(ScoringService)
+    service.model = "claude"
+    truncated = SimpleNamespace(
+        content=[SimpleNamespace(text='{"scores": {"effort"')],
+        stop_reason="max_tokens",
+        usage=SimpleNamespace(input_tokens=300, output_tokens=1900),
+    )
+    complete = SimpleNamespace(
+        content=[SimpleNamespace(text=json.dumps(_score_payload()))],
+        stop_reason="end_turn",
+        usage=SimpleNamespace(input_tokens=300, output_tokens=2100),
+    )
+    client = AsyncMock()
+    client.messages.create.side_effect = [truncated, complete]
+    service.client = client
+
+    result = await service.score_session(
+        heart_config={"display_name": "Luna", "persona": {}, "expectations": {}},
+        session_data={"session_id": "s1"},
+        turn_summaries=sample_transcript[:1],
+        transcript=[{"speaker": "suitor", "content": "hello"}],
+    )
+
+    first, retry = client.messages.create.call_args_list
+    assert first.kwargs["max_tokens"] == 1024
+    assert retry.kwargs["max_tokens"] == 4096
+    assert result["prompt_tokens_before"] >= result["prompt_tokens_after"] > 0
+
+
+def _install_scoring_repos(monkeypatch, **session_fields):
+    """Fake the worker's repositories around one session and its score rows."""
+    from types import SimpleNamespace
+
+    from src.models.domain_enums import ConversationSpeaker, SessionStatus
+
+    session = SimpleNamespace(
+        id=uuid.uuid4(),
+        status=SessionStatus.COMPLETED,
+        end_reason="completed",
+        heart_id=uuid.uuid4(),
+        suitor_id=uuid.uuid4(),
+        started_at=None,
+        ended_at=None,
+        turn_summaries={"turns": []},
+        session_metadata={},
+        verdict_status=None,
+    )
+    vars(session).update(session_fields)
+    scores: dict[uuid.UUID, dict] = {}
+
+    class FakeSessionRepo:
+        def __init__(self, **_kwargs):
+            pass
+
+        async def read_by_id(self, _id):
+            return session
+
+        async def transition(self, _id, from_states, **fields):
+            if session.status not in from_states:
+                return None
+            for key, value in fields.items():
+                setattr(session, key, value)
+            return session
+
+    class FakeScoreRepo(FakeSessionRepo):
+        async def find_by_session_id(self, _id):
+            return SimpleNamespace(**scores[_id]) if _id in scores else None
+
+        async def create(self, payload):
+            scores[payload["session_id"]] = dict(payload)
+
+        async def update_for_session(self, _id, payload):
+            scores[_id].update(payload)
+            return True
+
+    class FakeTurnRepo(FakeSessionRepo):
+        async def find_by_session_id(self, _id):
+            return [
+                SimpleNamespace(
+                    turn_index=0,
+                    speaker=ConversationSpeaker.SUITOR,
+                    content="I plan weekend hikes.",
+                )
+            ]
+
+    monkeypatch.setattr("workers.main.SessionRepository", FakeSessionRepo)
+    monkeypatch.setattr("workers.main.ScoreRepository", FakeScoreRepo)
+    monkeypatch.setattr("workers.main.ConversationTurnRepository", FakeTurnRepo)
+    monkeypatch.setattr(
+        "workers.main.heart_config_provider.scoring_payload",
+        lambda: {"persona": {}},
+    )
+    return session, scores
+
+
+def _streaming_service(
+    text, *, tail=None, stop_reason="end_turn", create=None, on_feedback=None
+):
+    """A ScoringService whose stream sends `text` up to its feedback, then `tail`.
+
+    `tail` defaults to the rest of `text`; an exception instance is raised
+    there instead, as a cancelled or dropped stream would.
+    """
+    from types import SimpleNamespace
+
+    split = text.index('"feedback"')
+    tail = text[split:] if tail is None else tail
+
+    class FakeStream:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        @property
+        async def text_stream(self):
+            for start in range(0, split, 7):
+                yield text[start : min(start + 7, split)]
+            # Scores are complete; Claude is still writing the feedback.
+            if on_feedback is not None:
+                on_feedback()
+            if isinstance(tail, BaseException):
+                raise tail
+            yield tail
+
+        async def get_final_message(self):
+            return SimpleNamespace(
+                content=[SimpleNamespace(text=text[:split] + tail)],
+                stop_reason=stop_reason,
+                usage=SimpleNamespace(input_tokens=300, output_tokens=400),
+            )
+
+    service = ScoringService.__new__(ScoringService)
+    service.model = "claude"
+    service.client = SimpleNamespace(
+        messages=SimpleNamespace(
+            stream=lambda **_params: FakeStream(),
+            create=create or AsyncMock(side_effect=AssertionError("expected a stream")),
+        )
+    )
+    return service
+
+
+def _claude_json(payload) -> str:
+    import json
+
+    return "```json\n" + json.dumps(payload) + "\n```"
+
+
+@pytest.mark.asyncio
+async def test_m5_038_streamed_scoring_publishes_verdict_before_feedback(
+    monkeypatch,
+):
+    from src.models.domain_enums import SessionStatus
+
+    session, scores = _install_scoring_repos(monkeypatch)
+    seen_mid_stream: list[tuple] = []
+    service = _streaming_service(
+        _claude_json(_score_payload()),
+        on_feedback=lambda: seen_mid_stream.append(
+            (session.verdict_status, scores[session.id]["feedback_summary"])
+        ),
+    )
+
+    await score_session_task({"scoring_service": service}, str(session.id))
+
+    assert seen_mid_stream == [
+        ("feedback_pending", "Your detailed feedback is still being written.")
+    ]
+    score = scores[session.id]
+    assert score["verdict"] == Verdict.DATE
+    assert score["feedback_summary"] == "Strong clarity and effort."
+    assert score["claude_output_tokens"] == 400
+    assert session.status == SessionStatus.SCORED
+    assert session.verdict_status == "ready"
+
+
+@pytest.mark.asyncio
+async def test_m5_039_get_verdict_api_serves_verdict_while_feedback_pending(
+    registered_suitor, completed_session
+):
+    session_repo = AsyncMock()
+    session_repo.read_by_id.return_value = completed_session
+    heart_repo = AsyncMock()
+    heart_repo.read_by_id.return_value = None
+    score_repo = AsyncMock()
+    score_repo.find_by_session_id.return_value = ScoreDb(
+        session_id=completed_session.id,
+        effort_score=80,
+        creativity_score=70,
+        intent_clarity_score=90,
+        emotional_intelligence_score=60,
+        weighted_total=75.5,
+        verdict=Verdict.DATE,
+        feedback_text="Your detailed feedback is still being written.",
+    )
+    completed_session.verdict_status = "feedback_pending"
+
+    res = await get_session_verdict.__wrapped__(
+        completed_session.id, registered_suitor, session_repo, score_repo, heart_repo
+    )
+
+    assert res.ready is True
+    assert res.verdict == Verdict.DATE
+    assert res.feedback_pending is True
+    assert res.message
+
+
+def test_m5_040_filler_detection_keeps_numeric_and_non_latin_answers():
+    from src.services.scoring.prompt_compiler import compact_transcript, is_filler
+
+    for filler in ("Um...", "uh-huh", "Mm-hmm.", "hmm, um"):
+        assert is_filler(filler), filler
+    for answer in ("42", "25.", "100%", "🙂", "是的", "Ja, gerne", "um 42"):
+        assert not is_filler(answer), answer
+
+    compacted, stats = compact_transcript(
+        [
+            {"speaker": "suitor", "content": "uh"},
+            {"speaker": "suitor", "content": "30"},
+            {"speaker": "suitor", "content": "🙂"},
+            {"speaker": "suitor", "content": "我喜欢徒步"},
+        ],
+        max_turn_chars=200,
+    )
+    assert [turn["content"] for turn in compacted] == ["30", "🙂", "我喜欢徒步"]
+    assert stats.dropped_filler == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("tail", "error_type"),
+    [
+        ('"feedback": {"summary": "Str', "ValueError"),
+        (asyncio.CancelledError(), "CancelledError"),
+    ],
+)
+async def test_m5_041_feedback_failure_after_early_verdict_is_marked(
+    monkeypatch, tail, error_type
+):
+    from src.models.domain_enums import SessionStatus
+    from src.services.scoring.scoring_service import PROVISIONAL_FEEDBACK
+
+    session, scores = _install_scoring_repos(monkeypatch)
+    service = _streaming_service(_claude_json(_score_payload()), tail=tail)
+
+    if isinstance(tail, BaseException):
+        with pytest.raises(asyncio.CancelledError):
+            await score_session_task({"scoring_service": service}, str(session.id))
+    else:
+        await score_session_task({"scoring_service": service}, str(session.id))
+
+    assert scores[session.id]["verdict"] == Verdict.DATE
+    assert scores[session.id]["feedback_summary"] == PROVISIONAL_FEEDBACK
+    assert session.status == SessionStatus.SCORED
+    assert session.has_verdict is True
+    assert session.verdict_status == "feedback_failed"
+    assert session.session_metadata["scoring_error"]["type"] == error_type
+
+
+@pytest.mark.asyncio
+async def test_m5_042_max_tokens_fallback_keeps_the_published_verdict(monkeypatch):
+    from types import SimpleNamespace
+
+    session, scores = _install_scoring_repos(monkeypatch)
+    retry = SimpleNamespace(
+        content=[SimpleNamespace(text=_claude_json(_score_payload(10, 10, 10, 10)))],
+        stop_reason="end_turn",
+        usage=SimpleNamespace(input_tokens=300, output_tokens=2100),
+    )
+    service = _streaming_service(
+        _claude_json(_score_payload()),
+        tail='"feedback": {"summary": "Str',
+        stop_reason="max_tokens",
+        create=AsyncMock(return_value=retry),
+    )
+
+    await score_session_task({"scoring_service": service}, str(session.id))
+
+    score = scores[session.id]
+    assert score["verdict"] == Verdict.DATE
+    assert score["effort_score"] == 80
+    assert score["feedback_summary"] == "Strong clarity and effort."
+    assert score["claude_output_tokens"] == 2100
+    assert session.verdict_status == "ready"
+
+
+@pytest.mark.asyncio
+async def test_m5_043_retry_fills_in_feedback_for_a_published_verdict(monkeypatch):
+    from types import SimpleNamespace
+
+    from src.models.domain_enums import SessionStatus
+
+    session, scores = _install_scoring_repos(
+        monkeypatch, status=SessionStatus.SCORED, verdict_status="feedback_failed"
+    )
+    service = _streaming_service(_claude_json(_score_payload()))
+    scores[session.id] = {
+        **service.provisional_payload(
+            {
+                "effort": 80,
+                "creativity": 70,
+                "intent_clarity": 90,
+                "emotional_intelligence": 60,
+            }
+        ),
+        "session_id": session.id,
+    }
+    service.client.messages.create = AsyncMock(
+        return_value=SimpleNamespace(
+            content=[
+                SimpleNamespace(text=_claude_json(_score_payload(10, 10, 10, 10)))
+            ],
+            stop_reason="end_turn",
+            usage=SimpleNamespace(input_tokens=300, output_tokens=400),
+        )
+    )
+
+    await score_session_task({"scoring_service": service}, str(session.id))
+
+    score = scores[session.id]
+    assert score["verdict"] == Verdict.DATE
+    assert score["feedback_summary"] == "Strong clarity and effort."
+    assert session.status == SessionStatus.SCORED
+    assert session.verdict_status == "ready"
+
+
+@pytest.mark.asyncio
+async def test_m5_044_get_verdict_api_serves_verdict_when_feedback_failed(
+    registered_suitor, completed_session
+):
+    session_repo = AsyncMock()
+    session_repo.read_by_id.return_value = completed_session
+    heart_repo = AsyncMock()
+    heart_repo.read_by_id.return_value = None
+    score_repo = AsyncMock()
+    score_repo.find_by_session_id.return_value = ScoreDb(
+        session_id=completed_session.id,
+        effort_score=80,
+        creativity_score=70,
+        intent_clarity_score=90,
+        emotional_intelligence_score=60,
+        weighted_total=75.5,
+        verdict=Verdict.DATE,
+        feedback_text="Your detailed feedback is still being written.",
+        feedback_summary="Your detailed feedback is still being written.",
+    )
+    completed_session.verdict_status = "feedback_failed"
+
+    res = await get_session_verdict.__wrapped__(
+        completed_session.id, registered_suitor, session_repo, score_repo, heart_repo
+    )
+
+    assert res.ready is True
+    assert res.verdict == Verdict.DATE
+    assert res.feedback_failed is True
+    assert res.feedback_pending is False
+    assert res.feedback is None
+    assert res.feedback_text is None
+    assert res.message
@@ -342,3 +342,58 @@ async def test_m7_detail_014_invalid_session_id_format(
         "/api/v1/dashboard/sessions/not-a-uuid", headers=dashboard_headers
     )
     assert resp.status_code in (404, 422)
+
+
+@pytest.mark.asyncio
+async def test_m7_detail_latency_surfaced_from_agent_metrics(
+    dashboard_request,
+    m7_seeded_heart,
+    m7_sample_suitors,
+    m7_sample_sessions,
+    make_fake_db_m7,
+    fake_result_builder_m7,
+):
+    dashboard_request.app.state.heart_id = m7_seeded_heart.id
+    session = m7_sample_sessions[0]
+    session.session_metadata = {
+        "agent_metrics": {
+            "latency": {
+                "turns": 3,
+                "stages": {"first_audio": {"count": 3, "p50_ms": 900, "p95_ms": 1400}},
+            }
+        }
+    }
+    row = (session, m7_sample_suitors[0], None, None)
+    db = _build_detail_db(
+        make_fake_db_m7, fake_result_builder_m7, row, heart=m7_seeded_heart
+    )
+
+    out = await get_dashboard_session_detail(session.id, dashboard_request, "ok", db)
+
+    assert out.latency is not None
+    assert out.latency.turns == 3
+    assert out.latency.stages["first_audio"].p95_ms == 1400
+
+
+@pytest.mark.asyncio
+async def test_m7_detail_malformed_latency_is_omitted(
+    dashboard_request,
+    m7_seeded_heart,
+    m7_sample_suitors,
+    m7_sample_sessions,
+    make_fake_db_m7,
+    fake_result_builder_m7,
+):
+    dashboard_request.app.state.heart_id = m7_seeded_heart.id
+    session = m7_sample_sessions[0]
+    session.session_metadata = {
+        "agent_metrics": {"latency": {"turns": "many", "stages": ["first_audio"]}}
+    }
+    row = (session, m7_sample_suitors[0], None, None)
+    db = _build_detail_db(
+        make_fake_db_m7, fake_result_builder_m7, row, heart=m7_seeded_heart
+    )
+
+    out = await get_dashboard_session_detail(session.id, dashboard_request, "ok", db)
+
+    assert out.latency is None
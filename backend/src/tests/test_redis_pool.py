@@ -0,0 +1,50 @@
+"""Shared arq pool tests."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.redis_pool import ArqPool, get_arq_pool
+
+
+def test_arq_pool_is_process_wide_and_lazy():
+    assert get_arq_pool() is get_arq_pool()
+    pool = ArqPool("redis://localhost:6379/0", health_check_interval=15)
+    client = pool.redis
+    assert pool.redis is client
+    kwargs = client.connection_pool.connection_kwargs
+    assert kwargs["health_check_interval"] == 15
+    assert kwargs["retry"] is not None
+    # Nothing is connected until the first command.
+    assert not client.connection_pool._in_use_connections
+
+
+@pytest.mark.asyncio
+async def test_arq_pool_reuses_client_across_enqueues():
+    pool = ArqPool("redis://localhost:6379/0")
+    fake = AsyncMock()
+    pool.use(fake)
+
+    await pool.enqueue_job("score_session_task", "s1", _defer_by=5)
+    await pool.enqueue_job("score_session_task", "s2", _defer_by=5)
+    assert await pool.ping() is True
+
+    assert fake.enqueue_job.await_count == 2
+    # Adopted clients belong to their owner (the arq worker).
+    await pool.close()
+    fake.aclose.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_arq_pool_close_releases_owned_client():
+    pool = ArqPool("redis://localhost:6379/0")
+    client = pool.redis
+    client.aclose = AsyncMock()
+
+    await pool.close()
+
+    client.aclose.assert_awaited_once()
+    assert pool.redis is not client
+    await pool.close()
@@ -43,13 +43,9 @@ async def test_cleanup_stale_sessions_uses_repository_methods(monkeypatch):
         async def find_stale_in_progress(self, older_than):
             return [stale_progress]
 
-        async def update_status(self, session_id, status):
-            calls.append(("update_status", session_id, status))
-            return None
-
-        async def update_attr(self, session_id, column, value):
-            calls.append(("update_attr", session_id, (column, value)))
-            return None
+        async def transition(self, session_id, from_states, **fields):
+            calls.append((session_id, set(from_states), fields))
+            return SimpleNamespace(id=session_id, **fields)
 
     fake_db = SimpleNamespace(session=lambda: None)
 
@@ -61,13 +57,45 @@ async def test_cleanup_stale_sessions_uses_repository_methods(monkeypatch):
     result = await workers_main.cleanup_stale_sessions({})
 
     assert result == {"expired_pending": 1, "expired_in_progress": 1}
-    assert ("update_status", stale_pending.id, SessionStatus.EXPIRED) in calls
-    assert ("update_status", stale_progress.id, SessionStatus.EXPIRED) in calls
-    assert any(
-        c[0] == "update_attr" and c[1] == stale_pending.id and c[2][0] == "end_reason"
-        for c in calls
-    )
-    assert any(
-        c[0] == "update_attr" and c[1] == stale_progress.id and c[2][0] == "end_reason"
-        for c in calls
+    by_id = {session_id: (states, fields) for session_id, states, fields in calls}
+    assert len(calls) == 2
+    states, fields = by_id[stale_pending.id]
+    assert states == {SessionStatus.PENDING}
+    assert fields["status"] == SessionStatus.EXPIRED
+    assert fields["end_reason"] == "connection_timeout"
+    assert "ended_at" in fields
+    states, fields = by_id[stale_progress.id]
+    assert states == {SessionStatus.IN_PROGRESS}
+    assert fields["status"] == SessionStatus.EXPIRED
+    assert fields["end_reason"] == "max_duration_exceeded"
+
+
+@pytest.mark.asyncio
+async def test_cleanup_stale_sessions_skips_sessions_that_moved_on(monkeypatch):
+    stale_pending = SessionDb(
+        id=uuid.uuid4(),
+        heart_id=uuid.uuid4(),
+        suitor_id=uuid.uuid4(),
+        status=SessionStatus.PENDING,
     )
+
+    class FakeSessionRepository:
+        def __init__(self, session_factory):
+            self.session_factory = session_factory
+
+        async def find_stale_pending(self, older_than):
+            return [stale_pending]
+
+        async def find_stale_in_progress(self, older_than):
+            return []
+
+        async def transition(self, session_id, from_states, **fields):
+            # The agent joined after the stale query ran.
+            return None
+
+    monkeypatch.setattr(workers_main, "database", SimpleNamespace(session=None))
+    monkeypatch.setattr(workers_main, "SessionRepository", FakeSessionRepository)
+
+    result = await workers_main.cleanup_stale_sessions({})
+
+    assert result == {"expired_pending": 0, "expired_in_progress": 0}
@@ -0,0 +1,112 @@
+"""Unit tests for the claim-based retry_pending_scoring cron."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+
+from workers import main as workers_main
+
+
+class FakeSessionRepository:
+    claimable: list[uuid.UUID] = []
+    missing_feedback: list[uuid.UUID] = []
+    claim_limits: list[int] = []
+    released: list[uuid.UUID] = []
+
+    def __init__(self, session_factory=None):
+        _ = session_factory
+
+    async def claim_for_scoring(self, *, limit: int, **_cutoffs):
+        self.claim_limits.append(limit)
+        claimed, FakeSessionRepository.claimable = (
+            self.claimable[:limit],
+            self.claimable[limit:],
+        )
+        return claimed
+
+    async def claim_missing_feedback(self, *, limit: int, **_cutoffs):
+        claimed, FakeSessionRepository.missing_feedback = (
+            self.missing_feedback[:limit],
+            self.missing_feedback[limit:],
+        )
+        return claimed
+
+    async def release_scoring_claims(self, session_ids):
+        self.released.extend(session_ids)
+
+
+@pytest.fixture
+def retry_env(monkeypatch):
+    monkeypatch.setattr(workers_main, "SessionRepository", FakeSessionRepository)
+    monkeypatch.setattr(workers_main.config, "SCORING_BATCH_MIN_SESSIONS", 0)
+    monkeypatch.setattr(workers_main.config, "SCORING_RETRY_LIMIT", 6)
+    monkeypatch.setattr(workers_main.config, "SCORING_RETRY_CONCURRENCY", 2)
+    FakeSessionRepository.claimable = [uuid.uuid4() for _ in range(8)]
+    FakeSessionRepository.missing_feedback = []
+    FakeSessionRepository.claim_limits = []
+    FakeSessionRepository.released = []
+    return FakeSessionRepository
+
+
+@pytest.mark.asyncio
+async def test_retry_scores_claimed_sessions_concurrently_and_releases_failures(
+    monkeypatch, retry_env
+):
+    failing = retry_env.claimable[1]
+    running = 0
+    peak = 0
+    scored: list[str] = []
+
+    async def fake_score(ctx, session_id):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if session_id == str(failing):
+            raise RuntimeError("claude down")
+        scored.append(session_id)
+
+    monkeypatch.setattr(workers_main, "score_session_task", fake_score)
+
+    result = await workers_main.retry_pending_scoring({})
+
+    assert result == {"retried": 5, "timed_out": 0, "failed": 1}
+    assert retry_env.claim_limits == [6]
+    assert peak == 2
+    assert len(scored) == 5
+    assert retry_env.released == [failing]
+    # The other two sessions were never claimed by this run.
+    assert len(retry_env.claimable) == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_completes_missing_feedback_first_and_never_batches_it(
+    monkeypatch, retry_env
+):
+    monkeypatch.setattr(workers_main.config, "SCORING_BATCH_MIN_SESSIONS", 2)
+    monkeypatch.setattr(workers_main.config, "SCORING_BATCH_MAX_SESSIONS", 8)
+    missing = [uuid.uuid4() for _ in range(2)]
+    retry_env.missing_feedback = list(missing)
+    batched: list[str] = []
+    scored: list[str] = []
+
+    async def fake_submit(ctx, session_ids):
+        batched.extend(session_ids)
+        return {"submitted": len(session_ids)}
+
+    async def fake_score(ctx, session_id):
+        scored.append(session_id)
+
+    monkeypatch.setattr(workers_main, "submit_scoring_batch", fake_submit)
+    monkeypatch.setattr(workers_main, "score_session_task", fake_score)
+
+    result = await workers_main.retry_pending_scoring({})
+
+    assert result == {"retried": 2, "timed_out": 0, "failed": 0, "batched": 8}
+    assert scored == [str(session_id) for session_id in missing]
+    assert not set(batched) & set(scored)
+    assert retry_env.released == []
@@ -0,0 +1,335 @@
+"""Unit tests for backlog scoring through Anthropic Message Batches."""
+
+from __future__ import annotations
+
+import json
+import threading
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from anthropic import AsyncAnthropic
+from pydantic import SecretStr
+
+from src.models.domain_enums import ConversationSpeaker, SessionStatus, Verdict
+from src.repository.session_repository import SessionRepository
+from src.services.scoring.batch_client import ScoringBatchClient
+from src.services.scoring.scoring_service import ScoringService
+from workers import main as workers_main
+
+_SCORES_JSON = json.dumps(
+    {
+        "scores": {
+            "effort": 90,
+            "creativity": 80,
+            "intent_clarity": 85,
+            "emotional_intelligence": 75,
+        },
+        "feedback": {"summary": "Strong answers."},
+    }
+)
+
+
+def _message(custom_id: str) -> dict:
+    return {
+        "id": f"msg_{custom_id[:8]}",
+        "type": "message",
+        "role": "assistant",
+        "model": "claude-sonnet-4-20250514",
+        "content": [{"type": "text", "text": _SCORES_JSON}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 1200, "output_tokens": 300},
+    }
+
+
+class FakeBatchServer:
+    """Local HTTP server standing in for the Message Batches endpoints."""
+
+    def __init__(self) -> None:
+        self.submitted: list[dict] = []
+        self.polls = 0
+        self.ready_after = 1
+        self.errored: set[str] = set()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("content-length") or 0)
+                body = json.loads(self.rfile.read(length))
+                self._send(*fake.handle("POST", self.path, body))
+
+            def do_GET(self):
+                self._send(*fake.handle("GET", self.path, None))
+
+            def _send(self, status: int, content: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header("content-type", content_type)
+                self.send_header("content-length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _batch(self, status: str) -> dict:
+        now = datetime.now(timezone.utc).isoformat()
+        return {
+            "id": "msgbatch_1",
+            "type": "message_batch",
+            "processing_status": status,
+            "request_counts": {
+                "processing": 0,
+                "succeeded": 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": now,
+            "expires_at": now,
+            "ended_at": None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": (
+                f"{self.base_url}/v1/messages/batches/msgbatch_1/results"
+                if status == "ended"
+                else None
+            ),
+        }
+
+    def handle(self, method: str, path: str, body: dict | None):
+        as_json = "application/json"
+        if method == "POST" and path == "/v1/messages/batches":
+            self.submitted = body["requests"]
+            return 200, json.dumps(self._batch("in_progress")).encode(), as_json
+        if path.endswith("/results"):
+            lines = []
+            for item in self.submitted:
+                custom_id = item["custom_id"]
+                if custom_id in self.errored:
+                    result = {
+                        "type": "errored",
+                        "error": {
+                            "type": "error",
+                            "error": {"type": "api_error", "message": "overloaded"},
+                        },
+                    }
+                else:
+                    result = {"type": "succeeded", "message": _message(custom_id)}
+                lines.append(json.dumps({"custom_id": custom_id, "result": result}))
+            return 200, "\n".join(lines).encode(), "application/x-jsonl"
+        if path == "/v1/messages/batches/msgbatch_1":
+            self.polls += 1
+            status = "ended" if self.polls > self.ready_after else "in_progress"
+            return 200, json.dumps(self._batch(status)).encode(), as_json
+        return 404, json.dumps({"error": {"message": path}}).encode(), as_json
+
+
+@pytest.fixture
+def batch_server():
+    server = FakeBatchServer()
+    yield server
+    server.close()
+
+
+def _batch_client(server: FakeBatchServer) -> ScoringBatchClient:
+    return ScoringBatchClient(
+        AsyncAnthropic(api_key="test", base_url=server.base_url, max_retries=0)
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_client_round_trip_against_fake_server(batch_server):
+    server = batch_server
+    server.errored = {"b"}
+    client = _batch_client(server)
+
+    batch_id = await client.submit({"a": {"model": "m"}, "b": {"model": "m"}})
+
+    assert batch_id == "msgbatch_1"
+    assert [item["custom_id"] for item in server.submitted] == ["a", "b"]
+    assert await client.is_done(batch_id) is False
+    assert await client.is_done(batch_id) is True
+    results = [item async for item in client.results(batch_id)]
+    assert results[0][0] == "a" and results[0][1] is not None
+    assert results[1] == ("b", None, "errored: overloaded")
+
+
+class FakeSessionRepository(SessionRepository):
+    rows: dict[uuid.UUID, SimpleNamespace] = {}
+
+    def __init__(self, session_factory=None):
+        _ = session_factory
+
+    async def transition_many(self, session_ids, from_states, **fields):
+        patch = fields.pop("session_metadata", None)
+        changed = []
+        for session_id in session_ids:
+            row = self.rows.get(session_id)
+            if row is None or row.status not in set(from_states):
+                continue
+            for key, value in fields.items():
+                setattr(row, key, value)
+            if patch is not None:
+                row.metadata_patches.append(patch)
+            changed.append(row)
+        return changed
+
+
+class FakeScoreRepository:
+    inserted: list[dict] = []
+
+    def __init__(self, session_factory=None):
+        _ = session_factory
+
+    async def bulk_create(self, scores):
+        self.inserted.extend(scores)
+        return [score["session_id"] for score in scores]
+
+
+class FakeTurnRepository:
+    def __init__(self, session_factory=None):
+        _ = session_factory
+
+    async def find_by_session_id(self, session_id):
+        row = FakeSessionRepository.rows[session_id]
+        if row.end_reason == "suitor_silent":
+            return []
+        return [
+            SimpleNamespace(
+                turn_index=0,
+                speaker=ConversationSpeaker.SUITOR,
+                content="I plan weekend hikes.",
+                created_at=None,
+            )
+        ]
+
+
+def _session(end_reason: str = "completed") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        suitor_id=uuid.uuid4(),
+        heart_id=uuid.uuid4(),
+        status=SessionStatus.COMPLETED,
+        started_at=None,
+        ended_at=None,
+        end_reason=end_reason,
+        turn_summaries={"turns": []},
+        metadata_patches=[],
+    )
+
+
+@pytest.fixture
+def batch_env(monkeypatch, batch_server):
+    monkeypatch.setattr(workers_main.config, "ANTHROPIC_API_KEY", SecretStr("k"))
+    monkeypatch.setattr(workers_main, "SessionRepository", FakeSessionRepository)
+    monkeypatch.setattr(workers_main, "ScoreRepository", FakeScoreRepository)
+    monkeypatch.setattr(workers_main, "ConversationTurnRepository", FakeTurnRepository)
+    monkeypatch.setattr(
+        workers_main.heart_config_provider,
+        "scoring_payload",
+        lambda: {"display_name": "Mira", "screening_questions": []},
+    )
+    pool = SimpleNamespace(enqueue_job=AsyncMock())
+    monkeypatch.setattr(workers_main, "get_arq_pool", lambda: pool)
+    FakeSessionRepository.rows = {}
+    FakeScoreRepository.inserted = []
+    server = batch_server
+    ctx = {
+        "scoring_service": ScoringService(),
+        "scoring_batch_client": _batch_client(server),
+    }
+    return SimpleNamespace(ctx=ctx, pool=pool, server=server)
+
+
+@pytest.mark.asyncio
+async def test_submit_then_poll_scores_backlog_in_bulk(batch_env):
+    talkers = [_session() for _ in range(3)]
+    silent = _session(end_reason="suitor_silent")
+    for row in [*talkers, silent]:
+        FakeSessionRepository.rows[row.id] = row
+    batch_env.server.errored = {str(talkers[2].id)}
+
+    submitted = await workers_main.submit_scoring_batch(
+        batch_env.ctx, [str(row.id) for row in [*talkers, silent]]
+    )
+
+    assert submitted["submitted"] == 3 and submitted["silent"] == 1
+    assert len(batch_env.server.submitted) == 3
+    assert silent.status == SessionStatus.SCORED
+    assert all(row.status == SessionStatus.SCORING for row in talkers)
+    args = batch_env.pool.enqueue_job.await_args
+    assert args.args[0] == "poll_scoring_batch"
+    assert args.kwargs["_job_id"] == "poll-scoring-batch-msgbatch_1-0"
+
+    first = await workers_main.poll_scoring_batch(batch_env.ctx, *args.args[1:])
+    assert first["status"] == "processing"
+    retry = batch_env.pool.enqueue_job.await_args
+    assert retry.args[3] == 1
+
+    done = await workers_main.poll_scoring_batch(batch_env.ctx, *retry.args[1:])
+
+    assert done == {"status": "ended", "scored": 2, "failed": 1}
+    assert [row.status for row in talkers] == [
+        SessionStatus.SCORED,
+        SessionStatus.SCORED,
+        SessionStatus.FAILED,
+    ]
+    batch_scores = FakeScoreRepository.inserted[1:]
+    assert {score["session_id"] for score in batch_scores} == {
+        talkers[0].id,
+        talkers[1].id,
+    }
+    assert all(score["verdict"] == Verdict.DATE for score in batch_scores)
+    assert FakeScoreRepository.inserted[0]["claude_model"] == "none"
+
+
+@pytest.mark.asyncio
+async def test_submit_failure_marks_sessions_failed(batch_env):
+    rows = [_session() for _ in range(2)]
+    for row in rows:
+        FakeSessionRepository.rows[row.id] = row
+    batch_env.ctx["scoring_batch_client"] = SimpleNamespace(
+        submit=AsyncMock(side_effect=RuntimeError("batches unavailable"))
+    )
+
+    result = await workers_main.submit_scoring_batch(
+        batch_env.ctx, [str(row.id) for row in rows]
+    )
+
+    assert result["failed"] == 2
+    assert all(row.status == SessionStatus.FAILED for row in rows)
+    batch_env.pool.enqueue_job.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_transient_poll_error_reschedules_instead_of_ending_the_chain(
+    batch_env,
+):
+    row = _session()
+    row.status = SessionStatus.SCORING
+    FakeSessionRepository.rows[row.id] = row
+    batch_env.ctx["scoring_batch_client"] = SimpleNamespace(
+        is_done=AsyncMock(side_effect=RuntimeError("503 from batches API"))
+    )
+
+    result = await workers_main.poll_scoring_batch(
+        batch_env.ctx, "msgbatch_9", [str(row.id)], 2
+    )
+
+    assert result == {"status": "processing", "attempt": 2}
+    retry = batch_env.pool.enqueue_job.await_args
+    assert retry.args == ("poll_scoring_batch", "msgbatch_9", [str(row.id)], 3)
+    assert retry.kwargs["_job_id"] == "poll-scoring-batch-msgbatch_9-3"
+    assert row.status == SessionStatus.SCORING
@@ -0,0 +1,39 @@
+"""Unit tests for arq worker startup/shutdown hooks."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import SecretStr
+
+from src.services.scoring.scoring_service import ScoringService
+from workers import main as workers_main
+
+
+@pytest.mark.asyncio
+async def test_startup_builds_one_pooled_scoring_service(monkeypatch):
+    monkeypatch.setattr(workers_main.config, "ANTHROPIC_API_KEY", SecretStr("k"))
+    monkeypatch.setattr(workers_main.config, "SCORING_HTTP_MAX_CONNECTIONS", 7)
+    ctx: dict = {}
+
+    await workers_main.on_startup(ctx)
+
+    service = ctx["scoring_service"]
+    assert isinstance(service, ScoringService)
+    pool = service.client._client._transport._pool
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 7
+
+    await workers_main.on_shutdown(ctx)
+    assert "scoring_service" not in ctx
+    assert service.client.is_closed()
+
+
+@pytest.mark.asyncio
+async def test_startup_without_api_key_leaves_ctx_empty(monkeypatch):
+    monkeypatch.setattr(workers_main.config, "ANTHROPIC_API_KEY", None)
+    ctx: dict = {}
+
+    await workers_main.on_startup(ctx)
+    await workers_main.on_shutdown(ctx)
+
+    assert ctx == {}
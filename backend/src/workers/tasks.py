@@ -6,22 +6,43 @@ import logging
 import uuid
 from datetime import datetime, timezone
 
-from arq import create_pool
-from arq.connections import RedisSettings
-
 from src.core.config import config
 from src.core.database import Database
+from src.core.redis_pool import get_arq_pool
 from src.models.session_model import SessionDb
 
 logger = logging.getLogger(__name__)
 database = Database(config)
 
 
-async def enqueue_scoring_job(session_id: str) -> None:
-    """Enqueue the score_session_task worker job."""
-    redis = await create_pool(RedisSettings.from_dsn(config.REDIS_URL))
+def scoring_job_id(session_id: str) -> str:
+    """Deterministic arq job id, so a session is only ever queued once."""
+    return f"score-session:{session_id}"
+
+
+async def enqueue_scoring_job(session_id: str, *, rescore: bool = False) -> None:
+    """Enqueue the score_session_task worker job.
+
+    Repeat calls for the same session are dropped by arq while the job is
+    queued or its result is kept; `rescore=True` always enqueues a fresh job
+    that replaces the existing score.
+    """
+    job_id = (
+        f"rescore-session:{session_id}:{uuid.uuid4().hex}"
+        if rescore
+        else scoring_job_id(session_id)
+    )
     try:
-        await redis.enqueue_job("score_session_task", session_id, _defer_by=5)
+        job = await get_arq_pool().enqueue_job(
+            "score_session_task",
+            session_id,
+            rescore,
+            _defer_by=5,
+            _job_id=job_id,
+        )
+        if job is None:
+            logger.info("Scoring job already queued for session: %s", session_id)
+            return
         logger.info("Scoring job enqueued for session: %s", session_id)
     except Exception as exc:
         logger.exception("Failed to enqueue scoring job for session %s", session_id)
@@ -35,5 +56,3 @@ async def enqueue_scoring_job(session_id: str) -> None:
                 db_session.session_metadata = metadata
                 session.add(db_session)
                 await session.commit()
-    finally:
-        await redis.aclose()
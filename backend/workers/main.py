@@ -14,34 +14,23 @@ from sqlmodel import select
 from src.core.config import config
 from src.core.database import Database
 from src.core.exceptions import DuplicatedError, NotFoundError
+from src.core.lease import RedisLease
+from src.core.redis_pool import get_arq_pool
 from src.models.domain_enums import SessionStatus
 from src.models.heart_model import HeartDb
-from src.models.score_model import ScoreDb
 from src.models.session_model import SessionDb
 from src.models.suitor_model import SuitorDb
 from src.repository.conversation_turn_repository import ConversationTurnRepository
 from src.repository.score_repository import ScoreRepository
+from src.repository.scoring_cache_repository import ScoringCacheRepository
 from src.repository.session_repository import SessionRepository
-from src.services.config_loader import HeartConfigLoader
+from src.services.config_loader import heart_config_provider
 from src.services.tavus_service import TavusService
 
 logger = logging.getLogger(__name__)
 database = Database(config)
 
 
-def _to_heart_config_payload(loaded: HeartConfigLoader) -> dict:
-    cfg = loaded.config
-    if cfg is None:
-        raise RuntimeError("Heart config is not loaded")
-    return {
-        "display_name": cfg.profile.display_name,
-        "bio": cfg.profile.bio,
-        "persona": cfg.persona.model_dump(),
-        "expectations": cfg.expectations.model_dump(),
-        "screening_questions": [q.model_dump() for q in cfg.screening_questions],
-    }
-
-
 async def _fallback_heart_config_payload(heart_id: uuid.UUID) -> dict:
     """Fallback heart payload from DB when YAML/env config isn't available."""
     async with database.session() as db:
@@ -60,9 +49,134 @@ async def _fallback_heart_config_payload(heart_id: uuid.UUID) -> dict:
     }
 
 
-async def score_session_task(ctx: dict, session_id: str) -> None:
-    """Score completed interview with Claude and persist verdict."""
-    _ = ctx
+_SCORABLE_STATES = frozenset(
+    {SessionStatus.COMPLETED, SessionStatus.SCORING, SessionStatus.FAILED}
+)
+
+
+async def _mark_scored(
+    session_repo: SessionRepository, session_uuid: uuid.UUID
+) -> None:
+    await session_repo.transition(
+        session_uuid,
+        {SessionStatus.SCORING},
+        status=SessionStatus.SCORED,
+        has_verdict=True,
+        verdict_status="ready",
+    )
+
+
+async def _heart_config_for(session: SessionDb) -> dict:
+    try:
+        # Cached per process; only re-parsed when the YAML or its env changes.
+        return heart_config_provider.scoring_payload()
+    except Exception as exc:
+        logger.warning(
+            "Heart config YAML unavailable for scoring session %s; falling back to DB heart payload: %s",
+            session.id,
+            exc,
+        )
+        return await _fallback_heart_config_payload(session.heart_id)
+
+
+async def _scoring_inputs(
+    session: SessionDb, turn_repo: ConversationTurnRepository
+) -> dict:
+    """Keyword arguments (bar heart_config) for building a session's scoring prompt."""
+    turns = await turn_repo.find_by_session_id(session.id)
+    transcript = [
+        {
+            "turn_index": turn.turn_index,
+            "speaker": turn.speaker.value.lower(),
+            "content": turn.content,
+            "timestamp": (
+                turn.created_at.isoformat()
+                if getattr(turn, "created_at", None)
+                else None
+            ),
+        }
+        for turn in turns
+    ]
+
+    turn_summaries_raw = session.turn_summaries or {}
+    if isinstance(turn_summaries_raw, dict):
+        turn_summaries = turn_summaries_raw.get("turns", []) or []
+    else:
+        turn_summaries = []
+    if not isinstance(turn_summaries, list):
+        turn_summaries = []
+
+    return {
+        "session_data": {
+            "session_id": str(session.id),
+            "suitor_id": str(session.suitor_id),
+            "heart_id": str(session.heart_id),
+            "started_at": session.started_at.isoformat()
+            if session.started_at
+            else None,
+            "ended_at": session.ended_at.isoformat() if session.ended_at else None,
+            "end_reason": session.end_reason,
+        },
+        "turn_summaries": turn_summaries,
+        "transcript": transcript,
+    }
+
+
+def _is_silent(session: SessionDb, transcript: list[dict]) -> bool:
+    """Ended for silence and the suitor never said anything: nothing to score."""
+    suitor_spoke = any(
+        entry["speaker"] == "suitor" and (entry["content"] or "").strip()
+        for entry in transcript
+    )
+    return session.end_reason == "suitor_silent" and not suitor_spoke
+
+
+def _scoring_service(ctx: dict):
+    from src.services.scoring.scoring_service import ScoringService
+
+    # Shared per worker (see on_startup) so jobs reuse warm connections.
+    return ctx.get("scoring_service") or ScoringService(
+        cache=ScoringCacheRepository(session_factory=database.session)
+    )
+
+
+async def score_session_task(ctx: dict, session_id: str, rescore: bool = False) -> None:
+    """Score completed interview with Claude and persist verdict.
+
+    Runs under a per-session Redis lease, taken before any prompt is built, so
+    an arq retry or the retry cron overlapping a live run skips instead of
+    paying for a second Claude call. `rescore=True` replaces an existing score.
+    """
+    lease = None
+    if ctx.get("redis") is not None:
+        lease = RedisLease(
+            ctx["redis"], f"scoring-lease:{session_id}", config.SCORING_LEASE_TTL_S
+        )
+        try:
+            acquired = await lease.acquire()
+        except Exception as exc:
+            # Redis trouble should not block scoring; the status claim still guards.
+            logger.warning("Scoring lease unavailable for %s: %s", session_id, exc)
+            lease, acquired = None, True
+        if not acquired:
+            logger.info(
+                "Skipping scoring for session %s; another run holds its lease",
+                session_id,
+            )
+            return
+    try:
+        await _score_session(ctx, session_id, rescore=rescore)
+    finally:
+        if lease is not None:
+            try:
+                await lease.release()
+            except Exception as exc:
+                logger.warning(
+                    "Releasing scoring lease for %s failed: %s", session_id, exc
+                )
+
+
+async def _score_session(ctx: dict, session_id: str, *, rescore: bool) -> None:
     session_uuid = uuid.UUID(session_id)
     session_repo = SessionRepository(session_factory=database.session)
     score_repo = ScoreRepository(session_factory=database.session)
@@ -73,85 +187,113 @@ async def score_session_task(ctx: dict, session_id: str) -> None:
     except NotFoundError:
         logger.warning("Skipping scoring; session %s was not found", session_id)
         return
-    if session.status not in {
-        SessionStatus.COMPLETED,
-        SessionStatus.SCORING,
-        SessionStatus.FAILED,
-    }:
+
+    from src.services.scoring.scoring_service import (
+        feedback_fields,
+        is_provisional,
+        silent_session_score,
+    )
+
+    scorable = (
+        _SCORABLE_STATES | {SessionStatus.SCORED} if rescore else _SCORABLE_STATES
+    )
+    if session.verdict_status == "feedback_failed":
+        # The verdict is out but its feedback never arrived; fill it in.
+        scorable = scorable | {SessionStatus.SCORED}
+    if session.status not in scorable:
         logger.info(
             "Skipping scoring for session %s with status=%s", session_id, session.status
         )
         return
 
-    if await score_repo.exists_for_session(session_uuid):
+    # A provisional score means the verdict was published by an earlier run.
+    published = False
+    if not rescore:
+        existing = await score_repo.find_by_session_id(session_uuid)
+        if existing is not None and not is_provisional(existing):
+            logger.info(
+                "Skipping scoring for session %s because score already exists",
+                session_id,
+            )
+            await session_repo.transition(
+                session_uuid,
+                _SCORABLE_STATES,
+                status=SessionStatus.SCORED,
+                has_verdict=True,
+                verdict_status="ready",
+            )
+            return
+        published = existing is not None
+
+    claimed = await session_repo.transition(
+        session_uuid,
+        scorable,
+        status=SessionStatus.SCORING,
+        # An already published verdict stays visible while feedback is retried.
+        verdict_status="feedback_pending" if published else "scoring",
+        has_verdict=published,
+    )
+    if claimed is None:
         logger.info(
-            "Skipping scoring for session %s because score already exists", session_id
+            "Skipping scoring for session %s; status changed concurrently", session_id
         )
-        await session_repo.update_attr(session_uuid, "has_verdict", True)
-        await session_repo.update_attr(session_uuid, "verdict_status", "ready")
-        if session.status != SessionStatus.SCORED:
-            await session_repo.update_status(session_uuid, SessionStatus.SCORED)
         return
 
-    await session_repo.update_status(session_uuid, SessionStatus.SCORING)
-    await session_repo.update_attr(session_uuid, "verdict_status", "scoring")
-    await session_repo.update_attr(session_uuid, "has_verdict", False)
+    finished = False
+    scoring_error: dict | None = None
+
+    async def _publish_verdict(provisional: dict) -> None:
+        # The results page unblocks on this; feedback follows on stream end.
+        nonlocal published
+        await score_repo.create({**provisional, "session_id": session_uuid})
+        published = True
+        await session_repo.transition(
+            session_uuid,
+            {SessionStatus.SCORING},
+            has_verdict=True,
+            verdict_status="feedback_pending",
+        )
+        logger.info(
+            "Session %s verdict published early (final_score=%s, verdict=%s)",
+            session_id,
+            provisional.get("final_score"),
+            provisional.get("verdict"),
+        )
 
     try:
-        loader = HeartConfigLoader()
-        try:
-            loader.load()
-            heart_config = _to_heart_config_payload(loader)
-        except Exception as exc:
-            logger.warning(
-                "Heart config YAML unavailable for scoring session %s; falling back to DB heart payload: %s",
+        heart_config = await _heart_config_for(session)
+        inputs = await _scoring_inputs(session, turn_repo)
+
+        if _is_silent(session, inputs["transcript"]):
+            logger.info(
+                "Session %s ended with a silent suitor; skipping Claude scoring",
                 session_id,
-                exc,
             )
-            heart_config = await _fallback_heart_config_payload(session.heart_id)
-
-        turns = await turn_repo.find_by_session_id(session_uuid)
-        transcript = [
-            {
-                "turn_index": turn.turn_index,
-                "speaker": turn.speaker.value.lower(),
-                "content": turn.content,
-                "timestamp": (
-                    turn.created_at.isoformat()
-                    if getattr(turn, "created_at", None)
-                    else None
-                ),
-            }
-            for turn in turns
-        ]
-
-        turn_summaries_raw = session.turn_summaries or {}
-        if isinstance(turn_summaries_raw, dict):
-            turn_summaries = turn_summaries_raw.get("turns", []) or []
+            score_payload = silent_session_score()
         else:
-            turn_summaries = []
-        if not isinstance(turn_summaries, list):
-            turn_summaries = []
-
-        from src.services.scoring.scoring_service import ScoringService
-
-        scoring_service = ScoringService()
-        score_payload = await scoring_service.score_session(
-            heart_config=heart_config,
-            session_data={
-                "session_id": str(session.id),
-                "suitor_id": str(session.suitor_id),
-                "heart_id": str(session.heart_id),
-                "started_at": session.started_at.isoformat()
-                if session.started_at
-                else None,
-                "ended_at": session.ended_at.isoformat() if session.ended_at else None,
-                "end_reason": session.end_reason,
-            },
-            turn_summaries=turn_summaries,
-            transcript=transcript,
-        )
+            scoring_service = _scoring_service(ctx)
+            score_payload = await scoring_service.score_session(
+                heart_config=heart_config,
+                use_cache=not rescore,
+                # A rescore keeps the old score until the new one is complete.
+                on_verdict=None if rescore or published else _publish_verdict,
+                **inputs,
+            )
         score_payload["session_id"] = session_uuid
+        if published:
+            # The published verdict stands, even if a max_tokens retry
+            # scored differently; only the feedback is filled in.
+            await score_repo.update_for_session(
+                session_uuid, feedback_fields(score_payload)
+            )
+            await _mark_scored(session_repo, session_uuid)
+            finished = True
+            logger.info(
+                "Session %s feedback written (verdict kept as published)", session_id
+            )
+            return
+        if rescore:
+            await score_repo.delete_for_session(session_uuid)
         try:
             await score_repo.create(score_payload)
         except DuplicatedError:
@@ -160,15 +302,13 @@ async def score_session_task(ctx: dict, session_id: str) -> None:
                     "Duplicate score write detected for session %s; treating as idempotent success",
                     session_id,
                 )
-                await session_repo.update_attr(session_uuid, "has_verdict", True)
-                await session_repo.update_attr(session_uuid, "verdict_status", "ready")
-                await session_repo.update_status(session_uuid, SessionStatus.SCORED)
+                await _mark_scored(session_repo, session_uuid)
+                finished = True
                 return
             raise
 
-        await session_repo.update_attr(session_uuid, "has_verdict", True)
-        await session_repo.update_attr(session_uuid, "verdict_status", "ready")
-        await session_repo.update_status(session_uuid, SessionStatus.SCORED)
+        await _mark_scored(session_repo, session_uuid)
+        finished = True
         logger.info(
             "Session %s scored successfully (final_score=%s, verdict=%s)",
             session_id,
@@ -177,22 +317,40 @@ async def score_session_task(ctx: dict, session_id: str) -> None:
         )
     except Exception as exc:
         logger.exception("Session scoring failed for %s", session_id)
-        metadata = dict(session.session_metadata or {})
-        metadata["scoring_error"] = {
-            "type": type(exc).__name__,
-            "message": str(exc)[:500],
-            "captured_at": datetime.now(timezone.utc).isoformat(),
-        }
-        await session_repo.update_attr(session_uuid, "session_metadata", metadata)
-        await session_repo.update_attr(session_uuid, "has_verdict", False)
-        await session_repo.update_attr(session_uuid, "verdict_status", "failed")
-        await session_repo.update_status(session_uuid, SessionStatus.FAILED)
+        scoring_error = _scoring_error(str(exc), type(exc).__name__)
+        if published:
+            # The verdict is already out; `finally` records the missing feedback.
+            return
+        await session_repo.transition(
+            session_uuid,
+            {SessionStatus.SCORING},
+            status=SessionStatus.FAILED,
+            has_verdict=False,
+            verdict_status="failed",
+            session_metadata={**(session.session_metadata or {}), **scoring_error},
+        )
         raise
+    finally:
+        if published and not finished:
+            # Also reached on cancellation (retry wait_for, arq job_timeout):
+            # never leave the results page polling a feedback that won't come.
+            scoring_error = scoring_error or _scoring_error(
+                "Scoring was cancelled before the feedback was written",
+                "CancelledError",
+            )
+            await session_repo.transition(
+                session_uuid,
+                {SessionStatus.SCORING},
+                status=SessionStatus.SCORED,
+                has_verdict=True,
+                verdict_status="feedback_failed",
+                session_metadata={**(session.session_metadata or {}), **scoring_error},
+            )
 
 
-async def score_session(ctx: dict, session_id: str) -> None:
+async def score_session(ctx: dict, session_id: str, rescore: bool = False) -> None:
     """Backward-compatible alias for the scoring task name."""
-    await score_session_task(ctx, session_id)
+    await score_session_task(ctx, session_id, rescore)
 
 
 async def generate_tavus_avatar(ctx: dict, heart_id: str) -> None:
@@ -268,18 +426,29 @@ async def cleanup_stale_sessions(ctx: dict) -> dict[str, int]:
     stale_pending = await repo.find_stale_pending(pending_cutoff)
     stale_in_progress = await repo.find_stale_in_progress(in_progress_cutoff)
 
+    # Conditional on the state we found, so a session that started (or ended)
+    # in the meantime is left alone.
+    expired_pending = 0
     for stale in stale_pending:
-        await repo.update_status(stale.id, SessionStatus.EXPIRED)
-        await repo.update_attr(stale.id, "end_reason", "connection_timeout")
-        await repo.update_attr(stale.id, "ended_at", now)
-
+        if await repo.transition(
+            stale.id,
+            {SessionStatus.PENDING},
+            status=SessionStatus.EXPIRED,
+            end_reason="connection_timeout",
+            ended_at=now,
+        ):
+            expired_pending += 1
+
+    expired_in_progress = 0
     for stale in stale_in_progress:
-        await repo.update_status(stale.id, SessionStatus.EXPIRED)
-        await repo.update_attr(stale.id, "end_reason", "max_duration_exceeded")
-        await repo.update_attr(stale.id, "ended_at", now)
-
-    expired_pending = len(stale_pending)
-    expired_in_progress = len(stale_in_progress)
+        if await repo.transition(
+            stale.id,
+            {SessionStatus.IN_PROGRESS},
+            status=SessionStatus.EXPIRED,
+            end_reason="max_duration_exceeded",
+            ended_at=now,
+        ):
+            expired_in_progress += 1
 
     if expired_pending or expired_in_progress:
         logger.info(
@@ -361,48 +530,312 @@ async def cleanup_old_data(ctx: dict) -> dict[str, int]:
     }
 
 
-async def retry_pending_scoring(ctx: dict) -> dict[str, int]:
-    """Retry scoring for completed sessions that still don't have scores."""
-    _ = ctx
-    cutoff = datetime.now(timezone.utc) - timedelta(minutes=5)
-    retried = 0
-    timed_out = 0
-    failed = 0
+# Anthropic expires batches after 24h; past this a batch is treated as lost.
+_BATCH_MAX_AGE = timedelta(hours=25)
 
-    async with database.session() as session:
-        pending_query = (
-            select(SessionDb)
-            .outerjoin(ScoreDb, ScoreDb.session_id == SessionDb.id)
-            .where(
-                SessionDb.status.in_(
-                    [
-                        SessionStatus.COMPLETED,
-                        SessionStatus.SCORING,
-                        SessionStatus.FAILED,
-                    ]
-                ),
-                ScoreDb.id.is_(None),
-                SessionDb.ended_at.is_not(None),
-                SessionDb.ended_at < cutoff,
-            )
-            .limit(20)
-        )
-        pending = (await session.execute(pending_query)).scalars().all()
 
-    for candidate in pending:
+def _batch_client(ctx: dict, scoring_service):
+    from src.services.scoring.batch_client import ScoringBatchClient
+
+    return ctx.get("scoring_batch_client") or ScoringBatchClient(scoring_service.client)
+
+
+def _scoring_error(message: str, error_type: str) -> dict:
+    return {
+        "scoring_error": {
+            "type": error_type,
+            "message": message[:500],
+            "captured_at": datetime.now(timezone.utc).isoformat(),
+        }
+    }
+
+
+async def _fail_batch_sessions(
+    session_repo: SessionRepository,
+    session_ids: list[uuid.UUID],
+    message: str,
+    error_type: str = "BatchScoringError",
+) -> int:
+    failed = await session_repo.transition_many(
+        session_ids,
+        {SessionStatus.SCORING},
+        status=SessionStatus.FAILED,
+        has_verdict=False,
+        verdict_status="failed",
+        scoring_claimed_at=None,
+        session_metadata=SessionRepository.metadata_patch(
+            _scoring_error(message, error_type), drop=["scoring_batch"]
+        ),
+    )
+    return len(failed)
+
+
+async def submit_scoring_batch(ctx: dict, session_ids: list[str]) -> dict:
+    """Score a backlog of sessions through one Message Batch.
+
+    Sessions are claimed (moved to SCORING) up front, so interactive
+    `score_session_task` runs and later retries skip them while the batch is
+    in flight. Silent sessions are scored locally and never sent.
+    """
+    from src.services.scoring.scoring_service import silent_session_score
+
+    session_repo = SessionRepository(session_factory=database.session)
+    score_repo = ScoreRepository(session_factory=database.session)
+    turn_repo = ConversationTurnRepository(session_factory=database.session)
+
+    claimed = await session_repo.transition_many(
+        [uuid.UUID(session_id) for session_id in session_ids],
+        _SCORABLE_STATES,
+        status=SessionStatus.SCORING,
+        verdict_status="scoring",
+        has_verdict=False,
+    )
+    if not claimed:
+        return {"submitted": 0, "silent": 0}
+
+    scoring_service = _scoring_service(ctx)
+    requests: dict[str, dict] = {}
+    silent: list[dict] = []
+    unbuildable: list[uuid.UUID] = []
+    for session in claimed:
         try:
-            await asyncio.wait_for(
-                score_session_task({}, str(candidate.id)), timeout=45
+            inputs = await _scoring_inputs(session, turn_repo)
+            if _is_silent(session, inputs["transcript"]):
+                silent.append({**silent_session_score(), "session_id": session.id})
+                continue
+            requests[str(session.id)] = scoring_service.build_request(
+                heart_config=await _heart_config_for(session), **inputs
             )
-            retried += 1
-        except TimeoutError:
-            timed_out += 1
-            logger.warning("Retry scoring timed out for session %s", candidate.id)
         except Exception:
-            failed += 1
-            logger.exception("Retry scoring failed for session %s", candidate.id)
+            logger.exception("Could not build scoring request for %s", session.id)
+            unbuildable.append(session.id)
+
+    if unbuildable:
+        await _fail_batch_sessions(
+            session_repo, unbuildable, "Could not build scoring request"
+        )
+    if silent:
+        await score_repo.bulk_create(silent)
+        await session_repo.transition_many(
+            [payload["session_id"] for payload in silent],
+            {SessionStatus.SCORING},
+            status=SessionStatus.SCORED,
+            has_verdict=True,
+            verdict_status="ready",
+        )
+    if not requests:
+        return {"submitted": 0, "silent": len(silent)}
+
+    request_ids = [uuid.UUID(custom_id) for custom_id in requests]
+    try:
+        batch_id = await _batch_client(ctx, scoring_service).submit(requests)
+    except Exception as exc:
+        logger.exception("Scoring batch submission failed (%s sessions)", len(requests))
+        await _fail_batch_sessions(
+            session_repo, request_ids, str(exc), type(exc).__name__
+        )
+        return {"submitted": 0, "silent": len(silent), "failed": len(requests)}
+
+    await session_repo.transition_many(
+        request_ids,
+        {SessionStatus.SCORING},
+        session_metadata=SessionRepository.metadata_patch(
+            {
+                "scoring_batch": {
+                    "id": batch_id,
+                    "submitted_at": datetime.now(timezone.utc).isoformat(),
+                }
+            }
+        ),
+    )
+    await get_arq_pool().enqueue_job(
+        "poll_scoring_batch",
+        batch_id,
+        list(requests),
+        _defer_by=config.SCORING_BATCH_POLL_S,
+        _job_id=f"poll-scoring-batch-{batch_id}-0",
+    )
+    return {"submitted": len(requests), "silent": len(silent), "batch_id": batch_id}
+
+
+async def poll_scoring_batch(
+    ctx: dict, batch_id: str, session_ids: list[str], attempt: int = 0
+) -> dict:
+    """Check a scoring batch; re-enqueue itself until it ends, then bulk-write scores."""
+    session_repo = SessionRepository(session_factory=database.session)
+    score_repo = ScoreRepository(session_factory=database.session)
+    scoring_service = _scoring_service(ctx)
+    batch_client = _batch_client(ctx, scoring_service)
+    pending = [uuid.UUID(session_id) for session_id in session_ids]
+
+    async def _poll_again(reason: str) -> dict:
+        max_attempts = _BATCH_MAX_AGE // timedelta(
+            seconds=max(1, config.SCORING_BATCH_POLL_S)
+        )
+        if attempt + 1 >= max_attempts:
+            failed = await _fail_batch_sessions(
+                session_repo, pending, f"Scoring batch {batch_id} {reason}"
+            )
+            return {"status": "expired", "failed": failed}
+        await get_arq_pool().enqueue_job(
+            "poll_scoring_batch",
+            batch_id,
+            session_ids,
+            attempt + 1,
+            _defer_by=config.SCORING_BATCH_POLL_S,
+            _job_id=f"poll-scoring-batch-{batch_id}-{attempt + 1}",
+        )
+        return {"status": "processing", "attempt": attempt}
+
+    # Each poll is the only link to the next one: a transient API error must
+    # reschedule, not end the chain and strand the sessions in SCORING.
+    payloads: list[dict] = []
+    errors: dict[uuid.UUID, str] = {}
+    try:
+        if not await batch_client.is_done(batch_id):
+            return await _poll_again("never finished")
+        async for custom_id, message, error in batch_client.results(batch_id):
+            session_uuid = uuid.UUID(custom_id)
+            if message is None:
+                errors[session_uuid] = error or "no result"
+                continue
+            try:
+                payload = scoring_service.normalize_response(
+                    message, scoring_duration_ms=None
+                )
+            except Exception as exc:
+                errors[session_uuid] = str(exc)
+                continue
+            payloads.append({**payload, "session_id": session_uuid})
+    except Exception:
+        logger.exception("Polling scoring batch %s failed; retrying", batch_id)
+        return await _poll_again("could not be read")
+
+    await score_repo.bulk_create(payloads)
+    scored = await session_repo.transition_many(
+        [payload["session_id"] for payload in payloads],
+        {SessionStatus.SCORING},
+        status=SessionStatus.SCORED,
+        has_verdict=True,
+        verdict_status="ready",
+        session_metadata=SessionRepository.metadata_patch(drop=["scoring_batch"]),
+    )
+
+    returned = {payload["session_id"] for payload in payloads} | set(errors)
+    for session_uuid in pending:
+        if session_uuid not in returned:
+            errors[session_uuid] = "missing from batch results"
+    failed = 0
+    for message in set(errors.values()):
+        failed += await _fail_batch_sessions(
+            session_repo,
+            [sid for sid, error in errors.items() if error == message],
+            message,
+        )
+    logger.info(
+        "Scoring batch %s finished: scored=%s failed=%s",
+        batch_id,
+        len(scored),
+        failed,
+    )
+    return {"status": "ended", "scored": len(scored), "failed": failed}
+
+
+async def retry_pending_scoring(ctx: dict) -> dict[str, int]:
+    """Retry scoring for completed sessions that still don't have scores.
+
+    Candidates are claimed with FOR UPDATE SKIP LOCKED, so overlapping runs on
+    different workers never score the same session twice. A backlog of at
+    least SCORING_BATCH_MIN_SESSIONS goes out as one Message Batch; smaller
+    ones are scored concurrently (bounded by SCORING_RETRY_CONCURRENCY) on the
+    interactive path, and each failure releases its claim. Published
+    verdicts whose feedback never arrived are always retried interactively.
+    """
+    now = datetime.now(timezone.utc)
+    batching = config.SCORING_BATCH_MIN_SESSIONS > 0
+    session_repo = SessionRepository(session_factory=database.session)
+    claim_expired_before = now - timedelta(seconds=config.SCORING_CLAIM_TTL_S)
+
+    # Never batched: the batch path would insert a second score row.
+    feedback_retries = await session_repo.claim_missing_feedback(
+        ended_before=now - timedelta(minutes=5),
+        claim_expired_before=claim_expired_before,
+        limit=config.SCORING_RETRY_LIMIT,
+    )
+    claimed = await session_repo.claim_for_scoring(
+        ended_before=now - timedelta(minutes=5),
+        claim_expired_before=claim_expired_before,
+        batch_expired_before=now - _BATCH_MAX_AGE,
+        limit=(
+            config.SCORING_BATCH_MAX_SESSIONS
+            if batching
+            else config.SCORING_RETRY_LIMIT
+        ),
+    )
+
+    batched = None
+    if batching and len(claimed) >= config.SCORING_BATCH_MIN_SESSIONS:
+        result = await submit_scoring_batch(
+            ctx, [str(session_id) for session_id in claimed]
+        )
+        batched, claimed = result["submitted"], []
+    room = max(0, config.SCORING_RETRY_LIMIT - len(feedback_retries))
+    await session_repo.release_scoring_claims(claimed[room:])
+    claimed = [*feedback_retries, *claimed[:room]]
+
+    semaphore = asyncio.Semaphore(max(1, config.SCORING_RETRY_CONCURRENCY))
+
+    async def _retry(session_id: uuid.UUID) -> str:
+        async with semaphore:
+            try:
+                await asyncio.wait_for(
+                    score_session_task(ctx, str(session_id)), timeout=45
+                )
+                return "retried"
+            except TimeoutError:
+                logger.warning("Retry scoring timed out for session %s", session_id)
+                outcome = "timed_out"
+            except Exception:
+                logger.exception("Retry scoring failed for session %s", session_id)
+                outcome = "failed"
+        await session_repo.release_scoring_claims([session_id])
+        return outcome
+
+    outcomes = await asyncio.gather(*(_retry(session_id) for session_id in claimed))
+    summary = {
+        "retried": outcomes.count("retried"),
+        "timed_out": outcomes.count("timed_out"),
+        "failed": outcomes.count("failed"),
+    }
+    if batched is not None:
+        summary["batched"] = batched
+    return summary
+
+
+async def on_startup(ctx: dict) -> None:
+    """Build one pooled ScoringService shared by every job in this worker."""
+    from src.services.scoring.batch_client import ScoringBatchClient
+    from src.services.scoring.scoring_service import ScoringService
+
+    # Anything in this process that enqueues reuses arq's own connection.
+    if ctx.get("redis") is not None:
+        get_arq_pool().use(ctx["redis"])
+    try:
+        ctx["scoring_service"] = ScoringService.pooled(
+            cache=ScoringCacheRepository(session_factory=database.session)
+        )
+        ctx["scoring_batch_client"] = ScoringBatchClient(ctx["scoring_service"].client)
+    except RuntimeError as exc:
+        # Jobs will retry construction (and fail loudly) until a key is set.
+        logger.warning("Scoring service unavailable at worker startup: %s", exc)
+
 
-    return {"retried": retried, "timed_out": timed_out, "failed": failed}
+async def on_shutdown(ctx: dict) -> None:
+    await get_arq_pool().close()
+    ctx.pop("scoring_batch_client", None)
+    scoring_service = ctx.pop("scoring_service", None)
+    if scoring_service is not None:
+        await scoring_service.aclose()
 
 
 class WorkerSettings:
@@ -418,6 +851,8 @@ class WorkerSettings:
         cleanup_stale_sessions,
         cleanup_old_data,
         retry_pending_scoring,
+        submit_scoring_batch,
+        poll_scoring_batch,
     ]
     cron_jobs = [
         cron(
@@ -427,6 +862,8 @@ class WorkerSettings:
         cron(retry_pending_scoring, minute={2, 12, 22, 32, 42, 52}),
         cron(cleanup_old_data, hour={3}, minute={0}),
     ]
+    on_startup = on_startup
+    on_shutdown = on_shutdown
     max_tries = 3
     job_timeout = 300
     keep_result = 3600
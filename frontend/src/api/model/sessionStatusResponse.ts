@@ -28,6 +28,6 @@ export interface SessionStatusResponse {
   questions_total?: number | null;
   /** Whether a final verdict exists. */
   has_verdict: boolean;
-  /** Verdict pipeline status: pending, scoring, ready. */
+  /** Verdict pipeline status: pending, scoring, feedback_pending, feedback_failed, ready. */
   verdict_status?: string | null;
 }
@@ -30,6 +30,10 @@ export interface SessionVerdictResponse {
   heart_name?: string | null;
   /** Status message for scoring state. */
   message?: string | null;
+  /** True while the verdict is out but feedback is still being written. */
+  feedback_pending?: boolean;
+  /** True when the verdict is out but its feedback could not be written. */
+  feedback_failed?: boolean;
   /** Structured weighted scoring payload. */
   scores?: SessionVerdictResponseScores;
   /** Structured feedback payload. */
@@ -8,8 +8,12 @@ export function useVerdictPolling(sessionId: string) {
     queryFn: () => getVerdict(sessionId),
     enabled: Boolean(sessionId),
     refetchInterval: (query) => {
-      const status = query.state.data?.status;
-      if (status === 'scored' || status === 'failed') {
+      const data = query.state.data;
+      // A streamed verdict arrives before its feedback; keep polling for it.
+      if (data?.status === 'failed' || data?.feedback_failed) {
+        return false;
+      }
+      if (data?.status === 'scored' && !data.feedback_pending) {
         return false;
       }
       return 3000;
@@ -67,6 +67,11 @@ export function ResultsPage() {
             <VerdictReveal verdict={verdict.verdict} />
             {verdict.scores ? <ScoreBreakdown scores={verdict.scores} /> : null}
             {verdict.feedback ? <FeedbackDisplay feedback={verdict.feedback} /> : null}
+            {verdict.feedback_failed && verdict.message ? (
+              <section className="m6-card text-center">
+                <p className="text-rose-100 text-sm">{verdict.message}</p>
+              </section>
+            ) : null}
 
             {booking ? (
               <BookingConfirmation
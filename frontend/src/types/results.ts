@@ -33,6 +33,8 @@ export interface VerdictResponse {
   suitor_name?: string;
   heart_name?: string;
   message?: string;
+  feedback_pending?: boolean;
+  feedback_failed?: boolean;
 }
 
 export interface SlotTime {